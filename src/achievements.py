@@ -0,0 +1,122 @@
+from array import array
+from bisect import bisect_right
+
+# Counters an achievement can watch; "building" also names a building id.
+COUNTERS = ("points", "clicks", "building", "upgrades")
+REWARD_TYPES = ("production", "click_power")
+
+
+def counter_key(definition):
+    """Index key of the counter an achievement definition watches."""
+    counter = definition["counter"]
+    if counter == "building":
+        return (counter, definition["building"])
+    return (counter, None)
+
+
+class AchievementIndex:
+    """Achievement definitions grouped by the counter they depend on.
+
+    Thresholds are sorted per counter, so a new counter value finds
+    every achievement it reaches with one bisect. Built once per
+    catalog and shared by every player.
+    """
+
+    def __init__(self, definitions):
+        self.defs = list(definitions)
+        self.by_id = {d["id"]: i for i, d in enumerate(self.defs)}
+        groups = {}
+        for i, d in enumerate(self.defs):
+            groups.setdefault(counter_key(d), []).append((d["threshold"], i))
+        self.thresholds = {}
+        self.members = {}
+        for key, items in groups.items():
+            items.sort()
+            self.thresholds[key] = array("d", [t for t, _ in items])
+            self.members[key] = tuple(i for _, i in items)
+        n = len(self.defs)
+        self.production_factor = array("d", [1.0]) * n
+        self.click_factor = array("d", [1.0]) * n
+        for i, d in enumerate(self.defs):
+            reward = d.get("reward")
+            if not reward:
+                continue
+            if reward["type"] == "production":
+                self.production_factor[i] = float(reward["factor"])
+            else:
+                self.click_factor[i] = float(reward["factor"])
+
+
+class Achievements:
+    """One player's unlocked achievements and their reward multipliers.
+
+    Per counter, a cursor counts the thresholds already passed, so an
+    observation that reaches nothing new costs a single comparison.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.unlocked = set()
+        self.production = 1.0
+        self.click = 1.0
+        self._cursor = dict.fromkeys(index.thresholds, 0)
+
+    def __len__(self):
+        return len(self.unlocked)
+
+    def observe(self, key, value):
+        """Feed a counter's new value; return newly unlocked indexes."""
+        thresholds = self.index.thresholds.get(key)
+        if thresholds is None:
+            return ()
+        start = self._cursor[key]
+        if start >= len(thresholds) or value < thresholds[start]:
+            return ()
+        end = bisect_right(thresholds, value, start)
+        self._cursor[key] = end
+        new = [i for i in self.index.members[key][start:end]
+               if i not in self.unlocked]
+        for i in new:
+            self._unlock(i)
+        return new
+
+    def unlock_id(self, achievement_id):
+        """Unlock an achievement by id; return False if unknown or held."""
+        i = self.index.by_id.get(achievement_id)
+        if i is None or i in self.unlocked:
+            return False
+        self._unlock(i)
+        self._advance_cursors()
+        return True
+
+    def _unlock(self, i):
+        self.unlocked.add(i)
+        self.production *= self.index.production_factor[i]
+        self.click *= self.index.click_factor[i]
+
+    def _advance_cursors(self):
+        """Skip leading thresholds whose achievements are all unlocked."""
+        for key, members in self.index.members.items():
+            c = self._cursor[key]
+            while c < len(members) and members[c] in self.unlocked:
+                c += 1
+            self._cursor[key] = c
+
+    def ids(self):
+        defs = self.index.defs
+        return [defs[i]["id"] for i in sorted(self.unlocked)]
+
+    def clear(self):
+        self.unlocked = set()
+        self.production = 1.0
+        self.click = 1.0
+        self._cursor = dict.fromkeys(self.index.thresholds, 0)
+
+    def from_dict(self, ids):
+        """Restore unlocked achievements saved by ids(), skipping unknown."""
+        self.clear()
+        for achievement_id in ids:
+            i = self.index.by_id.get(achievement_id)
+            if i is not None and i not in self.unlocked:
+                self._unlock(i)
+        self._advance_cursors()
@@ -0,0 +1,65 @@
+import heapq
+
+
+class AffordScheduler:
+    """Tracks when shop items become affordable without polling them.
+
+    Crossings are kept in a min-heap keyed in "earned points" space
+    rather than time: income from production and clicks only moves
+    the earned counter forward, so a frame costs one comparison with
+    the heap top. Only spending (a purchase) or a price change needs
+    a rebuild. Seconds-until-affordable hints are derived on demand
+    from the current rate.
+    """
+
+    def __init__(self):
+        self.earned = 0.0
+        self.affordable = {}
+        self.thresholds = {}
+        self._heap = []
+        self._seq = 0
+
+    def rebuild(self, points, prices):
+        """Recompute crossings from the current points and prices.
+
+        prices is an iterable of (key, price) pairs. The new tables are
+        built aside and swapped in, so a reader on another thread sees
+        either the old schedule or the new one.
+        """
+        heap = []
+        affordable = {}
+        thresholds = {}
+        for key, price in prices:
+            if points >= price:
+                affordable[key] = True
+                thresholds[key] = self.earned
+                continue
+            threshold = self.earned + (price - points)
+            affordable[key] = False
+            thresholds[key] = threshold
+            self._seq += 1
+            heap.append((threshold, self._seq, key))
+        heapq.heapify(heap)
+        self._heap = heap
+        self.thresholds = thresholds
+        self.affordable = affordable
+
+    def earn(self, amount):
+        """Credit income; return True if any item became affordable."""
+        self.earned += amount
+        heap = self._heap
+        if not heap or heap[0][0] > self.earned:
+            return False
+        while heap and heap[0][0] <= self.earned:
+            _, _, key = heapq.heappop(heap)
+            self.affordable[key] = True
+        return True
+
+    def seconds_until(self, key, rate):
+        """Seconds until key is affordable at rate, or None if never."""
+        if self.affordable.get(key, False):
+            return 0.0
+        threshold = self.thresholds.get(key)
+        if threshold is None or rate <= 0.0:
+            return None
+        return (threshold - self.earned) / rate
@@ -0,0 +1,265 @@
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path
+
+import pygame
+
+from atomic_file import write_atomic
+
+RAW_FORMAT = "BGRA"
+
+
+class DiskCache:
+    """Decoded and scaled images stored as raw pixel files.
+
+    Each entry records the hash of its source PNG; an entry whose
+    source changed is ignored and rewritten. Hits are memory-mapped
+    and copied straight into a surface, so nothing is decoded and no
+    map outlives the load.
+    """
+
+    def __init__(self, directory, root="assets"):
+        self.dir = Path(directory)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        self.root = root
+        self.index_path = self.dir / "index.json"
+        self.entries = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._hashes = {}
+        self._masks = None
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f).get("entries", {})
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def source_hash(self, name):
+        """Content hash of a source asset, computed once per run."""
+        digest = self._hashes.get(name)
+        if digest is None:
+            try:
+                with open(f"{self.root}/{name}", "rb") as f:
+                    digest = hashlib.blake2b(f.read(),
+                                             digest_size=16).hexdigest()
+            except OSError:
+                digest = ""
+            self._hashes[name] = digest
+        return digest
+
+    def _key(self, name, size):
+        if size is None:
+            return name
+        return f"{name}@{size[0]}x{size[1]}"
+
+    def load(self, name, size=None):
+        """Return the cached surface, or None on a miss or stale entry."""
+        entry = self.entries.get(self._key(name, size))
+        if entry is None or entry["hash"] != self.source_hash(name):
+            self.misses += 1
+            return None
+        w, h = entry["size"]
+        try:
+            with open(self.dir / entry["file"], "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                if len(buf) != w * h * 4:
+                    self.misses += 1
+                    return None
+                surf = pygame.image.frombuffer(buf, (w, h), RAW_FORMAT)
+                # Copy out (converting if needed) so the map can close.
+                if surf.get_masks() != self._display_masks():
+                    surf = surf.convert_alpha()
+                else:
+                    surf = surf.copy()
+        except (OSError, ValueError, BufferError, pygame.error) as e:
+            print("Asset cache read error:", e)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return surf
+
+    def store(self, name, size, surf):
+        """Write surf's pixels for (name, size) and index them."""
+        digest = self.source_hash(name)
+        if not digest:
+            return
+        key = self._key(name, size)
+        w, h = surf.get_size()
+        filename = hashlib.blake2b(key.encode("utf-8"),
+                                   digest_size=8).hexdigest() + ".raw"
+        try:
+            write_atomic(self.dir / filename,
+                         pygame.image.tobytes(surf, RAW_FORMAT),
+                         durable=False)
+        except OSError as e:
+            print("Asset cache write error:", e)
+            return
+        self.entries[key] = {"hash": digest, "size": [w, h],
+                             "file": filename}
+        self.dirty = True
+
+    def flush(self):
+        """Rewrite the index if entries were added."""
+        if not self.dirty:
+            return
+        payload = json.dumps({"entries": self.entries},
+                             separators=(",", ":")).encode("utf-8")
+        try:
+            write_atomic(self.index_path, payload, durable=False)
+            self.dirty = False
+        except OSError as e:
+            print("Asset cache write error:", e)
+
+    def _display_masks(self):
+        if self._masks is None:
+            try:
+                probe = pygame.Surface((1, 1), pygame.SRCALPHA)
+                self._masks = probe.convert_alpha().get_masks()
+            except pygame.error:
+                self._masks = pygame.image.frombuffer(
+                    bytes(4), (1, 1), RAW_FORMAT
+                ).get_masks()
+        return self._masks
+
+
+class Atlas:
+    """Sprites pre-scaled and packed by build_atlas.py.
+
+    The index maps "name@WxH" to a rect on one of a few page images;
+    sprites are handed out as subsurfaces of the pages, so a hit costs
+    no decoding or scaling. A page is loaded with load_image on first
+    use. Entries whose source file changed size are ignored (rerun
+    build_atlas.py after editing art).
+    """
+
+    def __init__(self, root, index_name, load_image):
+        self.load_image = load_image
+        self.sprites = {}
+        self._subsurfaces = {}
+        with open(f"{root}/{index_name}", "r", encoding="utf-8") as f:
+            index = json.load(f)
+        stale = set()
+        for name, info in index.get("sources", {}).items():
+            try:
+                if os.stat(f"{root}/{name}").st_size != info["size"]:
+                    stale.add(name)
+            except OSError:
+                stale.add(name)
+        self.page_files = list(index["pages"])
+        self.pages = [None] * len(self.page_files)
+        for key, entry in index["sprites"].items():
+            if key.rsplit("@", 1)[0] not in stale:
+                self.sprites[key] = entry
+
+    def sprite(self, name, size):
+        """Subsurface for name at size, or None if it was not packed."""
+        key = f"{name}@{size[0]}x{size[1]}"
+        surf = self._subsurfaces.get(key)
+        if surf is None:
+            entry = self.sprites.get(key)
+            if entry is None:
+                return None
+            page, x, y, w, h = entry
+            if self.pages[page] is None:
+                self.pages[page] = self.load_image(self.page_files[page])
+                if self.pages[page] is None:
+                    self.sprites.clear()
+                    return None
+            surf = self.pages[page].subsurface((x, y, w, h))
+            self._subsurfaces[key] = surf
+        return surf
+
+
+class AssetCache:
+    """Loads each image once and keeps copies scaled for the window.
+
+    Scaled surfaces are dropped on resize (clear_scaled) and rebuilt
+    once for the new size, so drawing never scales art per frame.
+    Sizes found in the atlas are served from it; with a disk_cache
+    directory, decoded atlas pages and other scaled pixels persist
+    between runs (see DiskCache).
+    """
+
+    def __init__(self, root="assets", disk_cache=None, atlas=None):
+        self.root = root
+        self.disk = DiskCache(disk_cache, root) if disk_cache else None
+        self.atlas = None
+        if atlas:
+            try:
+                self.atlas = Atlas(root, atlas, self.image)
+            except (OSError, ValueError, KeyError, pygame.error) as e:
+                print("Atlas load error:", e)
+        self._images = {}
+        self._scaled = {}
+        self._fonts = {}
+
+    def image(self, name):
+        """Return the unscaled image, or None if it cannot be loaded."""
+        if name not in self._images:
+            img = self.disk.load(name) if self.disk else None
+            if img is None:
+                img = self._decode(name)
+                if img is not None and self.disk:
+                    self.disk.store(name, None, img)
+            self._images[name] = img
+        return self._images[name]
+
+    def _decode(self, name):
+        try:
+            img = pygame.image.load(f"{self.root}/{name}")
+            try:
+                img = img.convert_alpha()
+            except pygame.error:
+                pass
+        except (pygame.error, FileNotFoundError) as e:
+            print("Asset load error:", e)
+            img = None
+        return img
+
+    def atlas_sprite(self, name, size):
+        """The atlas sprite for name at exactly size, or None."""
+        if self.atlas is None:
+            return None
+        return self.atlas.sprite(name, (int(size[0]), int(size[1])))
+
+    def scaled(self, name, size):
+        """Return the image smoothscaled to size, cached per size."""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        key = (name, size)
+        surf = self._scaled.get(key, False)
+        if surf is False:
+            surf = self.atlas_sprite(name, size)
+            if surf is None and self.disk:
+                surf = self.disk.load(name, size)
+            if surf is None:
+                img = self.image(name)
+                if img is None:
+                    surf = None
+                elif img.get_size() == size:
+                    surf = img
+                else:
+                    surf = pygame.transform.smoothscale(img, size)
+                    if self.disk:
+                        self.disk.store(name, size, surf)
+            self._scaled[key] = surf
+        return surf
+
+    def font(self, size):
+        """Return the default font at size px, created once."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont(None, size)
+            self._fonts[size] = font
+        return font
+
+    def clear_scaled(self):
+        """Forget scaled copies (after the window size changed)."""
+        self._scaled.clear()
+
+    def flush(self):
+        """Persist the disk cache index, if there is one."""
+        if self.disk:
+            self.disk.flush()
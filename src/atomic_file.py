@@ -0,0 +1,45 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path, payload, durable=True):
+    """Replace the file at path with payload, all or nothing.
+
+    The bytes go to a temp file in the same directory, which is then
+    renamed over path, so readers see either the old or the new file.
+    With durable, the temp file and then the directory are fsynced so
+    the new content and the rename both survive a crash.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp",
+                               dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory):
+    """Persist a rename; not every platform can open a directory."""
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,94 @@
+import threading
+
+
+class AutosaveScheduler:
+    """Periodic autosave that serializes and writes on a worker thread.
+
+    The main thread only hands over a snapshot; if a write is already
+    in flight, newer requests replace the pending one instead of
+    queueing up, so at most one save waits behind the current write.
+    """
+
+    def __init__(self, save_manager, interval=30.0, on_saved=None):
+        self.save_manager = save_manager
+        self.interval = interval
+        self.on_saved = on_saved
+        self.elapsed = 0.0
+        self.saves_written = 0
+        self.requests_coalesced = 0
+        self.last_duration = 0.0
+        self.last_error = None
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._busy = False
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="autosave", daemon=True
+        )
+        self._thread.start()
+
+    def tick(self, dt):
+        """Advance the interval timer; return True when a save is due."""
+        self.elapsed += dt
+        if self.elapsed >= self.interval:
+            self.elapsed = 0.0
+            return True
+        return False
+
+    def request(self, data):
+        """Queue a snapshot for writing, replacing any pending one."""
+        with self._cond:
+            if self._stopped:
+                return
+            if self._pending is not None:
+                self.requests_coalesced += 1
+            self._pending = data
+            self.elapsed = 0.0
+            self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Block until every requested save has been written."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: self._pending is None and not self._busy, timeout
+            )
+
+    def stop(self, timeout=None):
+        """Write any pending snapshot, then shut the worker down."""
+        self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._pending is not None or self._stopped
+                )
+                if self._pending is None:
+                    return
+                data = self._pending
+                self._pending = None
+                self._busy = True
+            duration = None
+            error = None
+            try:
+                duration = self.save_manager.write(data)
+            except Exception as e:
+                error = e
+                print("Autosave error:", e)
+            if error is None and self.on_saved is not None:
+                try:
+                    self.on_saved(duration, data)
+                except Exception as e:
+                    print("Autosave callback error:", e)
+            with self._cond:
+                self._busy = False
+                self.last_error = error
+                if error is None:
+                    self.saves_written += 1
+                    self.last_duration = duration
+                self._cond.notify_all()
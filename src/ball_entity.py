@@ -1,45 +1,65 @@
 import pygame, random, math
 class BallEntity:
-    def __init__(self, x, y, vx, vy, radius=12, value=1.0):
+    """A bouncing ball; its sprite is looked up by type_id when drawing.
+
+    type_id is the owning building id, 0 when the ball has no type.
+    Position, velocity and radius are in design pixels (1280x720
+    space); the renderer scales them to the window.
+    """
+
+    __slots__ = ("x", "y", "vx", "vy", "radius", "value", "type_id")
+
+    def __init__(self, x, y, vx, vy, radius=12, value=1.0, type_id=0):
         self.x = x
         self.y = y
         self.vx = vx
         self.vy = vy
         self.radius = radius
         self.value = value
+        self.type_id = type_id
 
     def update(self, dt, screen_rect):
+        """Move the ball; return True if it bounced off a wall."""
         self.x += self.vx * dt
         self.y += self.vy * dt
+        bounced = False
         if self.x - self.radius < screen_rect.left:
             self.x = screen_rect.left + self.radius
             self.vx = -self.vx * 1.0
             self.vx += (random.random()-0.5)*30
+            bounced = True
         if self.x + self.radius > screen_rect.right:
             self.x = screen_rect.right - self.radius
             self.vx = -self.vx * 1.0
             self.vx += (random.random()-0.5)*30
+            bounced = True
         if self.y - self.radius < screen_rect.top:
             self.y = screen_rect.top + self.radius
             self.vy = -self.vy * 1.0
             self.vy += (random.random()-0.5)*30
+            bounced = True
         if self.y + self.radius > screen_rect.bottom:
             self.y = screen_rect.bottom - self.radius
             self.vy = -self.vy * 1.0
             self.vy += (random.random()-0.5)*30
+            bounced = True
+        return bounced
 
-    def draw(self, screen):
+    def draw(self, screen, center=None, radius=None):
+        """Plain circle fallback; center/radius in screen pixels."""
+        if center is None:
+            center = (int(self.x), int(self.y))
+        if radius is None:
+            radius = self.radius
         pygame.draw.circle(
             screen, 
             (255,225,25), 
-            (int(self.x), 
-             int(self.y)), 
-             self.radius
+            center, 
+            radius
             )
         pygame.draw.circle(
             screen, 
             (255,255,255), 
-            (int(self.x), 
-             int(self.y)), 
-             self.radius, 2
+            center, 
+            radius, 2
             )
\ No newline at end of file
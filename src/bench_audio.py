@@ -0,0 +1,76 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from ball_entity import BallEntity
+from physics_manager import PhysicsManager
+from sound_bank import SoundBank
+
+
+def make_balls(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        BallEntity(rng.uniform(20, 1260), rng.uniform(20, 700),
+                   rng.uniform(-200, 200), rng.uniform(-150, 150),
+                   14, 1.0, 1)
+        for _ in range(count)
+    ]
+
+
+def run(count, frames, sounds):
+    """Return (physics ms/frame, audio ms/frame, bounces/frame)."""
+    physics = PhysicsManager()
+    balls = make_balls(count)
+    dt = 1 / 60.0
+    physics_time = 0.0
+    audio_time = 0.0
+    bounces = 0
+    for _ in range(frames):
+        t0 = time.perf_counter()
+        physics.update(dt, balls)
+        t1 = time.perf_counter()
+        sounds.play("bounce", physics.bounces)
+        sounds.play("click", 3)
+        sounds.end_frame(dt)
+        t2 = time.perf_counter()
+        physics_time += t1 - t0
+        audio_time += t2 - t1
+        bounces += physics.bounces
+    return (physics_time / frames * 1000.0, audio_time / frames * 1000.0,
+            bounces / frames)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure the per-frame cost of the sound bank next "
+                    "to ball physics (works with the SDL dummy driver)."
+    )
+    parser.add_argument("--counts", default="1000,10000")
+    parser.add_argument("--frames", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    sounds = SoundBank()
+    if not sounds.enabled:
+        print("Mixer unavailable; audio calls are no-ops.")
+    for count in (int(c) for c in args.counts.split(",") if c):
+        physics_ms, audio_ms, bounces = run(count, args.frames, sounds)
+        print(f"{count:>6} balls: physics {physics_ms:7.3f} ms/frame, "
+              f"audio {audio_ms:6.3f} ms/frame "
+              f"({bounces:.0f} bounces/frame)")
+    print(f"played {sounds.played}, coalesced {sounds.coalesced}, "
+          f"rate-limited {sounds.limited}, stolen {sounds.stolen}, "
+          f"dropped {sounds.dropped}")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
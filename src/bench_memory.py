@@ -0,0 +1,68 @@
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+
+from ball_entity import BallEntity
+
+
+class DictBall:
+    """The pre-__slots__ layout: instance dict plus per-ball img/type_id."""
+
+    def __init__(self, x, y, vx, vy, radius=12, value=1.0):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.radius = radius
+        self.value = value
+
+
+def _make_slotted(rng, sprite):
+    return BallEntity(rng.uniform(200, 800), rng.uniform(100, 600),
+                      rng.uniform(-200, 200), rng.uniform(-150, 150),
+                      14, 1.0, 1)
+
+
+def _make_dict(rng, sprite):
+    b = DictBall(rng.uniform(200, 800), rng.uniform(100, 600),
+                 rng.uniform(-200, 200), rng.uniform(-150, 150),
+                 14, 1.0)
+    b.img = sprite
+    b.type_id = 1
+    return b
+
+
+def bytes_per_ball(factory, count, seed=0):
+    """Traced bytes allocated per ball for count balls (list included)."""
+    rng = random.Random(seed)
+    sprite = object()
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    balls = [factory(rng, sprite) for _ in range(count)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del balls
+    return used / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Report memory used per ball entity."
+    )
+    parser.add_argument("--counts", default="10000,100000")
+    args = parser.parse_args(argv)
+
+    for count in (int(c) for c in args.counts.split(",") if c):
+        slotted = bytes_per_ball(_make_slotted, count)
+        legacy = bytes_per_ball(_make_dict, count)
+        print(f"{count:>7} balls: {slotted:6.1f} B/ball slotted, "
+              f"{legacy:6.1f} B/ball with __dict__ "
+              f"({legacy / slotted:.2f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import pygame
+
+from frame_capture import DROP_NEWEST, REPLACE_OLDEST, FrameCapture
+
+
+def run_frames(game, frames, dt):
+    """Per-frame seconds of update + render at a fixed step of dt."""
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        game.update(dt)
+        game.render()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def summary(times):
+    ms = sorted(t * 1000 for t in times)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    return (f"median {statistics.median(ms):6.2f} ms  p95 {p95:6.2f} ms  "
+            f"max {ms[-1]:6.2f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure frame times of a running game, optionally "
+                    "while recording frames. Run from the repository root."
+    )
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--balls", type=int, default=200,
+                        help="building balls bouncing on screen")
+    parser.add_argument("--capture", metavar="DIR", default=None,
+                        help="record frames here ('-' for a temp folder)")
+    parser.add_argument("--every", type=int, default=1,
+                        help="record every Nth frame")
+    parser.add_argument("--policy", default=DROP_NEWEST,
+                        choices=(DROP_NEWEST, REPLACE_OLDEST))
+    parser.add_argument("--pool", type=int, default=6,
+                        help="frame buffers waiting for the encoders")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    screen = pygame.display.set_mode((1280, 720))
+    import game as game_module
+    game = game_module.Game(screen)
+    game.start_game()
+    ids = game.shop.building_ids
+    for n in range(args.balls):
+        game.shop.spawn_balls_for_building(ids[n % len(ids)])
+
+    # Simulation runs at a fixed step, so recording never changes what
+    # the game computes, only how long each frame takes.
+    dt = 1 / 60.0
+    run_frames(game, 30, dt)
+    base = run_frames(game, args.frames, dt)
+    print(f"  no capture: {summary(base)}")
+
+    if args.capture:
+        directory = args.capture
+        if directory == "-":
+            directory = tempfile.mkdtemp(prefix="tc-capture-")
+        game.capture = FrameCapture(directory, screen.get_size(),
+                                    pool_size=args.pool,
+                                    workers=args.workers,
+                                    drop_policy=args.policy,
+                                    every=args.every)
+        captured = run_frames(game, args.frames, dt)
+        start = time.perf_counter()
+        game.capture.stop()
+        drain = time.perf_counter() - start
+        print(f"     capture: {summary(captured)}")
+        print(f"       drain: {drain * 1000:.1f} ms after the last frame")
+        print(game.capture.report())
+        game.capture = None
+
+    if game.sim is not None:
+        game.sim.stop()
+    game.autosave.stop()
+    game.journal.close()
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
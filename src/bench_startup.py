@@ -0,0 +1,83 @@
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Runs in a fresh interpreter so every start really is cold.
+_CHILD = """
+import sys, time
+start = time.perf_counter()
+import pygame
+pygame.init()
+screen = pygame.display.set_mode((1280, 720))
+import game
+game.ASSET_CACHE_DIR = sys.argv[1] or None
+game.ATLAS_INDEX = sys.argv[2] or None
+g = game.Game(screen)
+g.render()
+elapsed = time.perf_counter() - start
+g.autosave.stop()
+g.journal.close()
+g.assets.flush()
+print(elapsed)
+"""
+
+
+def time_start(cache_dir, env, atlas=None):
+    """Seconds from interpreter start of the game to the first frame."""
+    out = subprocess.run(
+        [sys.executable, "-c", _CHILD, cache_dir or "", atlas or ""],
+        env=env, capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Measure startup time with and without the on-disk "
+                    "asset cache and the sprite atlas. Run from the "
+                    "repository root."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--atlas", default="atlas.json",
+                        help="atlas index under assets/ (see build_atlas.py)")
+    args = parser.parse_args(argv)
+
+    env = dict(os.environ)
+    src = os.path.dirname(os.path.abspath(__file__))
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (src, env.get("PYTHONPATH")) if p
+    )
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+    cache_dir = tempfile.mkdtemp(prefix="tc-asset-cache-")
+    try:
+        results = {"no cache": [], "cold cache": [], "warm cache": [],
+                   "atlas": [], "atlas+warm": []}
+        for _ in range(args.runs):
+            results["no cache"].append(time_start(None, env))
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            results["cold cache"].append(time_start(cache_dir, env))
+            results["warm cache"].append(time_start(cache_dir, env))
+            results["atlas"].append(time_start(None, env, args.atlas))
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            time_start(cache_dir, env, args.atlas)
+            results["atlas+warm"].append(
+                time_start(cache_dir, env, args.atlas)
+            )
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    for mode, times in results.items():
+        print(f"{mode:>10}: median {statistics.median(times) * 1000:7.1f} ms"
+              f"  (min {min(times) * 1000:.1f}, max {max(times) * 1000:.1f})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+import json
+import struct
+import zlib
+from array import array
+
+MAGIC = b"TCSB"
+FORMAT_VERSION = 2
+FLAG_ZLIB = 1
+FLAG_NO_BALLS = 2
+
+# magic, format version, flags, meta length, ball count
+_HEADER = struct.Struct("<4sHHII")
+
+# Column name, array typecode, default used when a ball dict lacks it.
+BALL_COLUMNS = (
+    ("x", "f", 400.0),
+    ("y", "f", 300.0),
+    ("vx", "f", 0.0),
+    ("vy", "f", 0.0),
+    ("radius", "H", 12),
+    ("value", "f", 1.0),
+    ("type_id", "h", -1),
+)
+# Typecodes that differ in older format versions (v1: byte type ids).
+_V1_CODES = {"type_id": "b"}
+
+
+class BinarySaveError(ValueError):
+    """Raised when a binary save is truncated or not understood."""
+
+
+def is_binary(payload):
+    """Return True if payload starts with the binary save magic."""
+    return payload[:len(MAGIC)] == MAGIC
+
+
+def balls_to_columns(balls):
+    """Convert a list of ball dicts into packed column arrays."""
+    cols = {}
+    for name, code, default in BALL_COLUMNS:
+        if name == "type_id":
+            values = [
+                -1 if b.get(name) is None else int(b[name]) for b in balls
+            ]
+        else:
+            values = [b.get(name, default) for b in balls]
+        cols[name] = array(code, values)
+    return cols
+
+
+def columns_to_balls(cols):
+    """Expand column arrays back into a list of ball dicts."""
+    names = [name for name, _, _ in BALL_COLUMNS]
+    balls = []
+    for row in zip(*(cols[name] for name in names)):
+        bd = dict(zip(names, row))
+        if bd["type_id"] < 0:
+            bd["type_id"] = None
+        balls.append(bd)
+    return balls
+
+
+def encode(data, compress=True):
+    """Encode a save dict into the versioned binary format.
+
+    Everything except the balls is stored as a small compact JSON
+    header; ball state is stored as one packed array per column.
+    """
+    shop = dict(data.get("shop", {}))
+    has_balls = "balls" in shop
+    balls = shop.pop("balls", [])
+    if not isinstance(balls, dict):
+        balls = balls_to_columns(balls)
+    meta = dict(data)
+    meta["shop"] = shop
+    meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+
+    count = len(balls["x"]) if balls else 0
+    parts = [meta_bytes]
+    for name, code, _ in BALL_COLUMNS:
+        col = balls[name] if balls else array(code)
+        if col.typecode != code:
+            col = array(code, col)
+        if len(col) != count:
+            raise BinarySaveError(f"Ball column {name} has wrong length")
+        parts.append(col.tobytes())
+    body = b"".join(parts)
+
+    flags = 0 if has_balls else FLAG_NO_BALLS
+    if compress:
+        body = zlib.compress(body, 6)
+        flags |= FLAG_ZLIB
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(meta_bytes),
+                          count)
+    return header + body
+
+
+def decode(payload):
+    """Decode a binary save; balls come back as column arrays."""
+    if len(payload) < _HEADER.size or not is_binary(payload):
+        raise BinarySaveError("Not a binary save")
+    _, version, flags, meta_len, count = _HEADER.unpack_from(payload)
+    if version > FORMAT_VERSION:
+        raise BinarySaveError(f"Unsupported binary save version {version}")
+    body = payload[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as e:
+            raise BinarySaveError(f"Corrupt compressed save: {e}")
+    body = memoryview(body)
+
+    data = json.loads(bytes(body[:meta_len]).decode("utf-8"))
+    if flags & FLAG_NO_BALLS:
+        return data
+    offset = meta_len
+    cols = {}
+    for name, code, _ in BALL_COLUMNS:
+        if version < 2:
+            code = _V1_CODES.get(name, code)
+        col = array(code)
+        size = col.itemsize * count
+        if offset + size > len(body):
+            raise BinarySaveError("Truncated ball data")
+        col.frombytes(body[offset:offset + size])
+        cols[name] = col
+        offset += size
+    data.setdefault("shop", {})["balls"] = cols
+    return data
@@ -0,0 +1,100 @@
+import heapq
+
+# name -> (kind, factor, seconds, label). Kinds: "production" multiplies
+# all production, "click" click gains, "building" one building's
+# production (the buff's target). Stacked buffs multiply.
+BUFFS = {
+    "frenzy": ("production", 7.0, 30.0, "Frenzy"),
+    "click_storm": ("click", 10.0, 15.0, "Click storm"),
+    "building_boost": ("building", 3.0, 45.0, "Boost"),
+}
+
+
+class BuffSet:
+    """Active timed buffs in a min-heap ordered by expiry time.
+
+    Time only moves through expire_until(), so checking for expiry is
+    one comparison with the heap top. The effective multipliers are
+    recomputed when a buff starts or expires, never per frame.
+    """
+
+    def __init__(self):
+        self.time = 0.0
+        self.production = 1.0
+        self.click = 1.0
+        self.building = {}
+        self._heap = []
+        self._seq = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def start(self, name, target=None, duration=None):
+        """Activate a buff for duration seconds (its default if None)."""
+        if name not in BUFFS:
+            raise ValueError(f"Unknown buff {name!r}")
+        kind, _, seconds, _ = BUFFS[name]
+        if kind == "building" and target is None:
+            raise ValueError(f"Buff {name!r} needs a target building")
+        if duration is None:
+            duration = seconds
+        self._seq += 1
+        heapq.heappush(self._heap,
+                       (self.time + duration, self._seq, name, target))
+        self._recompute()
+
+    def next_expiry(self):
+        """Time of the next expiry, or None with no active buff."""
+        return self._heap[0][0] if self._heap else None
+
+    def expire_until(self, t):
+        """Move time to t and drop buffs that ended; return how many."""
+        self.time = max(self.time, t)
+        heap = self._heap
+        expired = 0
+        while heap and heap[0][0] <= self.time:
+            heapq.heappop(heap)
+            expired += 1
+        if expired:
+            self._recompute()
+        return expired
+
+    def _recompute(self):
+        production = 1.0
+        click = 1.0
+        building = {}
+        for _, _, name, target in self._heap:
+            kind, factor, _, _ = BUFFS[name]
+            if kind == "production":
+                production *= factor
+            elif kind == "click":
+                click *= factor
+            else:
+                building[target] = building.get(target, 1.0) * factor
+        self.production = production
+        self.click = click
+        self.building = building
+
+    def active(self):
+        """(name, target, seconds left) of each buff, soonest first."""
+        return [(name, target, expires - self.time)
+                for expires, _, name, target in sorted(self._heap)]
+
+    def clear(self):
+        self._heap = []
+        self._recompute()
+
+    def to_dict(self):
+        """Serialize active buffs with their remaining seconds."""
+        return [{"name": name, "target": target, "remaining": left}
+                for name, target, left in self.active()]
+
+    def from_dict(self, items):
+        """Restore buffs saved by to_dict, skipping unknown entries."""
+        self.clear()
+        for item in items:
+            try:
+                self.start(item["name"], item.get("target"),
+                           float(item["remaining"]))
+            except (KeyError, TypeError, ValueError) as e:
+                print("Buff load error:", e)
@@ -0,0 +1,191 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import pygame
+
+from catalog import DEFAULT_CATALOG_PATH, load_catalog
+from clickable_area import HOVER_SCALE
+from layout import DESIGN_HEIGHT, DESIGN_WIDTH, Layout
+
+ATLAS_VERSION = 1
+PAGE_SIZE = 2048
+PADDING = 1
+
+
+def sprite_specs(catalog, scale=1.0):
+    """(group, asset name, (w, h)) of every sprite the game draws at scale.
+
+    Sizes follow the same layout rules as the game: ball sprites at
+    2 * (12 + 2 * type) px, 260x70 shop cards, and the clickable ball
+    at each upgrade size step, resting and hovered. Each group is
+    packed on its own pages, so the game only loads the pages it uses:
+    "ui" at startup, one "clickable-N" group per upgrade size step.
+    """
+    layout = Layout((round(DESIGN_WIDTH * scale),
+                     round(DESIGN_HEIGHT * scale)))
+    px = layout.px
+    specs = []
+    for bid in catalog.building_ids:
+        name = "ball.png" if bid == 1 else f"ball-{bid}.png"
+        d = px((12 + bid * 2) * 2)
+        specs.append(("ui", name, (d, d)))
+        specs.append(("ui", f"shop-item-{bid}.png", (px(260), px(70))))
+    specs.append(("ui", "shop-bg.png", (px(350), px(700))))
+    specs.append(("ui", "points.png", layout.rect("points").size))
+    for name in ("pause-btn.png", "pause-btn-hover.png"):
+        specs.append(("ui", name, layout.rect("pause").size))
+
+    steps = [1.0]
+    for factor in catalog.scale_factor:
+        if factor != 1.0:
+            steps.append(steps[-1] * factor)
+    radius = px(110)
+    for n, step in enumerate(steps):
+        for hover in (1.0, HOVER_SCALE):
+            d = int(radius * hover * step) * 2
+            specs.append((f"clickable-{n}", "ball.png", (d, d)))
+            specs.append((f"clickable-{n}", "ball-hover.png", (d, d)))
+    return specs
+
+
+def sprite_key(name, size):
+    return f"{name}@{size[0]}x{size[1]}"
+
+
+def source_info(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    return {"size": len(data),
+            "hash": hashlib.blake2b(data, digest_size=16).hexdigest()}
+
+
+def pack_shelves(sizes, page_size=PAGE_SIZE, padding=PADDING):
+    """Shelf-pack sizes into pages; return [(page, x, y)] and page heights.
+
+    Tallest sprites go first so each shelf wastes little height.
+    """
+    order = sorted(range(len(sizes)),
+                   key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    places = [None] * len(sizes)
+    heights = [0]
+    page = x = y = shelf_h = 0
+    for i in order:
+        w, h = sizes[i][0] + padding, sizes[i][1] + padding
+        if w > page_size or h > page_size:
+            raise ValueError(f"Sprite {sizes[i]} exceeds the page size")
+        if x + w > page_size:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if y + h > page_size:
+            page += 1
+            heights.append(0)
+            x = y = shelf_h = 0
+        places[i] = (page, x, y)
+        x += w
+        shelf_h = max(shelf_h, h)
+        heights[page] = max(heights[page], y + h)
+    return places, heights
+
+
+def build(assets_dir, out_name, catalog, scales):
+    """Scale, pack and write the atlas pages and their JSON index."""
+    seen = set()
+    groups = {}
+    for scale in scales:
+        suffix = "" if scale == 1.0 else f"@{scale:g}"
+        for group, name, size in sprite_specs(catalog, scale):
+            if (name, size) in seen:
+                continue
+            if not os.path.exists(os.path.join(assets_dir, name)):
+                print("Atlas: skipping missing", name)
+                continue
+            seen.add((name, size))
+            groups.setdefault(group + suffix, []).append((name, size))
+
+    sources = {}
+    sprites = {}
+    page_files = []
+    sources_cache = {}
+    for group, specs in groups.items():
+        places, heights = pack_shelves([size for _, size in specs])
+        first = len(page_files)
+        pages = []
+        for n, h in enumerate(heights):
+            width = max(x + size[0] for (_, size), (p, x, _) in
+                        zip(specs, places) if p == n) + PADDING
+            page = pygame.Surface((width, h), pygame.SRCALPHA)
+            page.fill((0, 0, 0, 0))
+            pages.append(page)
+        for (name, size), (page, x, y) in zip(specs, places):
+            img = sources_cache.get(name)
+            if img is None:
+                path = os.path.join(assets_dir, name)
+                sources[name] = source_info(path)
+                img = sources_cache[name] = pygame.image.load(path)
+            if img.get_size() != size:
+                img = pygame.transform.smoothscale(img, size)
+            pages[page].blit(img, (x, y))
+            sprites[sprite_key(name, size)] = [first + page, x, y,
+                                               size[0], size[1]]
+        for n, page in enumerate(pages):
+            filename = f"{out_name}-{group}-{n}.png"
+            pygame.image.save(page, os.path.join(assets_dir, filename))
+            page_files.append(filename)
+    index = {"version": ATLAS_VERSION, "pages": page_files,
+             "sources": sources, "sprites": sprites}
+    with open(os.path.join(assets_dir, out_name + ".json"), "w",
+              encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def stale_sources(assets_dir, index):
+    """Names of sources whose content no longer matches the index."""
+    stale = []
+    for name, info in index.get("sources", {}).items():
+        path = os.path.join(assets_dir, name)
+        if not os.path.exists(path) or source_info(path) != info:
+            stale.append(name)
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Pack sprites and UI art into atlas pages at the sizes "
+                    "the game draws them. Run from the repository root."
+    )
+    parser.add_argument("--assets", default="assets")
+    parser.add_argument("--out", default="atlas",
+                        help="base name of the pages and index")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    parser.add_argument("--scales", type=float, nargs="+", default=[1.0],
+                        help="layout scales to pack (1.0 is 1280x720)")
+    parser.add_argument("--check", action="store_true",
+                        help="only report whether the atlas is stale")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        path = os.path.join(args.assets, args.out + ".json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            print("Atlas index error:", e)
+            return 1
+        stale = stale_sources(args.assets, index)
+        for name in stale:
+            print("Atlas is stale for", name)
+        return 1 if stale else 0
+
+    index = build(args.assets, args.out, load_catalog(args.catalog),
+                  args.scales)
+    print(f"Packed {len(index['sprites'])} sprites from "
+          f"{len(index['sources'])} files into {len(index['pages'])} "
+          f"page(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,14 @@
+from array import array
 from dataclasses import dataclass
 
-@dataclass
+PRICE_GROWTH = 1.15
+PRICE_TABLE_SIZE = 2048
+# Precomputed PRICE_GROWTH ** count, so pricing is a table lookup.
+GROWTH_TABLE = array(
+    "d", [PRICE_GROWTH ** k for k in range(PRICE_TABLE_SIZE)]
+)
+
+@dataclass(slots=True)
 class Building:
     id: int
     name: str
@@ -9,7 +17,9 @@ class Building:
     production_per_second: float
 
     def price_next(self):
-        return int(self.base_price * (1.15 ** self.count))
+        if self.count < PRICE_TABLE_SIZE:
+            return int(self.base_price * GROWTH_TABLE[self.count])
+        return int(self.base_price * (PRICE_GROWTH ** self.count))
 
     def to_dict(self):
         return {
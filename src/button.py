@@ -9,24 +9,18 @@ class Button:
         self.hover = False
         self.pressed = False
         self._img_cache = {}
+        self._surfaces = {}
 
     def set_text(self, text):
         """Update button text dynamically."""
-        self.text = text
+        if text != self.text:
+            self.text = text
+            self._surfaces.clear()
 
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEMOTION:
-            self.hover = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
-                self.pressed = True
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if self.pressed and self.rect.collidepoint(event.pos):
-                try:
-                    self.callback()
-                except Exception as e:
-                    print("Button callback error:", e)
-            self.pressed = False
+    def invalidate(self):
+        """Drop rendered surfaces (after a font or size change)."""
+        self._img_cache.clear()
+        self._surfaces.clear()
 
     def drawButtonImg(self, img, screen):
         img_hover = getattr(self, "_img_hover", None)
@@ -46,6 +40,21 @@ class Button:
         rect = surf.get_rect(center=self.rect.center)
         screen.blit(surf, rect)
 
+    def _render(self, color):
+        """Render the button face once per colour and size."""
+        surf = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, surf.get_rect(), border_radius=15)
+        txt = self.font.render(self.text, True, (0,0,0))
+        tw, th = txt.get_size()
+        surf.blit(
+            txt, 
+            (
+                (self.rect.w - tw)//2, 
+                (self.rect.h - th)//2
+                )
+            )
+        return surf
+
     def draw(self, screen):
         img = getattr(self, "_img", None)
         if img:
@@ -56,13 +65,8 @@ class Button:
             color = (174, 191, 75)
         elif self.hover:
             color = (242, 255, 168)
-        pygame.draw.rect(screen, color, self.rect, border_radius=15)
-        txt = self.font.render(self.text, True, (0,0,0))
-        tw, th = txt.get_size()
-        screen.blit(
-            txt, 
-            (
-                self.rect.x + (self.rect.w - tw)//2, 
-                self.rect.y + (self.rect.h - th)//2
-                )
-            )
\ No newline at end of file
+        key = (color, self.rect.size)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = self._surfaces[key] = self._render(color)
+        screen.blit(surf, self.rect)
\ No newline at end of file
@@ -0,0 +1,176 @@
+import json
+from array import array
+
+from achievements import AchievementIndex, COUNTERS, REWARD_TYPES
+from building import Building
+from upgrade import Upgrade
+
+DEFAULT_CATALOG_PATH = "data/catalog.json"
+
+EFFECT_TYPES = ("click_power", "clickable_scale", "production", "building")
+UNLOCK_TYPES = ("points", "building", "upgrade")
+
+
+class CatalogError(ValueError):
+    """Raised when the building/upgrade catalog is malformed."""
+
+
+class Catalog:
+    """Building and upgrade definitions compiled into lookup tables.
+
+    Upgrade effects are flattened into one factor array per effect type
+    (indexed by upgrade position), so applying or recomputing effects
+    never has to interpret the catalog data again.
+    """
+
+    def __init__(self, buildings, upgrades, ball_production_share=0.2,
+                 achievements=()):
+        self.building_defs = buildings
+        self.ball_production_share = ball_production_share
+        self.upgrade_defs = upgrades
+        self.building_ids = [b["id"] for b in buildings]
+        self.upgrade_index = {u["id"]: i for i, u in enumerate(upgrades)}
+
+        n = len(upgrades)
+        self.click_factor = array("d", [1.0]) * n
+        self.scale_factor = array("d", [1.0]) * n
+        self.production_factor = array("d", [1.0]) * n
+        self.building_factors = [()] * n
+        self.unlocks = [None] * n
+        for i, u in enumerate(upgrades):
+            per_building = []
+            for effect in u.get("effects", []):
+                kind = effect["type"]
+                factor = float(effect["factor"])
+                if kind == "click_power":
+                    self.click_factor[i] *= factor
+                elif kind == "clickable_scale":
+                    self.scale_factor[i] *= factor
+                elif kind == "production":
+                    self.production_factor[i] *= factor
+                else:
+                    per_building.append((effect["building"], factor))
+            self.building_factors[i] = tuple(per_building)
+            self.unlocks[i] = self._compile_unlock(u.get("unlock"))
+        self.achievements = AchievementIndex(achievements)
+
+    def _compile_unlock(self, unlock):
+        """Turn an unlock dict into a (kind, key, threshold) tuple."""
+        if not unlock:
+            return None
+        if "points" in unlock:
+            return ("points", None, unlock["points"])
+        if "building" in unlock:
+            return ("building", unlock["building"], unlock.get("count", 1))
+        return ("upgrade", self.upgrade_index[unlock["upgrade"]], None)
+
+    def make_buildings(self):
+        """Return fresh Building objects keyed by id."""
+        return {
+            b["id"]: Building(
+                b["id"], b["name"],
+                base_price=b["base_price"], count=0,
+                production_per_second=float(b["production_per_second"])
+            )
+            for b in self.building_defs
+        }
+
+    def make_upgrades(self):
+        """Return fresh Upgrade objects in catalog order."""
+        return [
+            Upgrade(u["id"], u["name"], u.get("description", ""),
+                    price=u["price"], effects=list(u.get("effects", [])),
+                    unlock=u.get("unlock"))
+            for u in self.upgrade_defs
+        ]
+
+    def is_unlocked(self, index, points, buildings, upgrade_list):
+        """Check the unlock condition of the upgrade at index."""
+        cond = self.unlocks[index]
+        if cond is None:
+            return True
+        kind, key, threshold = cond
+        if kind == "points":
+            return points >= threshold
+        if kind == "building":
+            b = buildings.get(key)
+            return b is not None and b.count >= threshold
+        return upgrade_list[key].bought
+
+
+def _require(d, keys, where):
+    for key in keys:
+        if key not in d:
+            raise CatalogError(f"{where} is missing '{key}'")
+
+
+def validate_catalog(raw):
+    """Check catalog data and return (buildings, upgrades) lists."""
+    buildings = raw.get("buildings")
+    upgrades = raw.get("upgrades", [])
+    if not isinstance(buildings, list) or not buildings:
+        raise CatalogError("Catalog needs a non-empty 'buildings' list")
+    ids = set()
+    for b in buildings:
+        _require(b, ("id", "name", "base_price", "production_per_second"),
+                 "Building")
+        if b["id"] in ids:
+            raise CatalogError(f"Duplicate building id {b['id']}")
+        ids.add(b["id"])
+    upgrade_ids = set()
+    for u in upgrades:
+        _require(u, ("id", "name", "price"), "Upgrade")
+        if u["id"] in upgrade_ids:
+            raise CatalogError(f"Duplicate upgrade id {u['id']}")
+        for effect in u.get("effects", []):
+            _require(effect, ("type", "factor"), f"Effect of {u['id']}")
+            if effect["type"] not in EFFECT_TYPES:
+                raise CatalogError(f"Unknown effect type {effect['type']}")
+            if (effect["type"] == "building"
+                    and effect.get("building") not in ids):
+                raise CatalogError(f"Effect of {u['id']} needs a building")
+        unlock = u.get("unlock")
+        if unlock:
+            kinds = [k for k in UNLOCK_TYPES if k in unlock]
+            if len(kinds) != 1:
+                raise CatalogError(f"Bad unlock condition for {u['id']}")
+            if "building" in unlock and unlock["building"] not in ids:
+                raise CatalogError(f"Unlock of {u['id']} names no building")
+            if "upgrade" in unlock and unlock["upgrade"] not in upgrade_ids:
+                raise CatalogError(
+                    f"Unlock of {u['id']} must name an earlier upgrade"
+                )
+        upgrade_ids.add(u["id"])
+    _validate_achievements(raw.get("achievements", []), ids)
+    return buildings, upgrades
+
+
+def _validate_achievements(achievements, building_ids):
+    if not isinstance(achievements, list):
+        raise CatalogError("Catalog 'achievements' must be a list")
+    seen = set()
+    for a in achievements:
+        _require(a, ("id", "name", "counter", "threshold"), "Achievement")
+        if a["id"] in seen:
+            raise CatalogError(f"Duplicate achievement id {a['id']}")
+        seen.add(a["id"])
+        if a["counter"] not in COUNTERS:
+            raise CatalogError(f"Unknown counter {a['counter']}")
+        if (a["counter"] == "building"
+                and a.get("building") not in building_ids):
+            raise CatalogError(f"Achievement {a['id']} needs a building")
+        reward = a.get("reward")
+        if reward:
+            _require(reward, ("type", "factor"), f"Reward of {a['id']}")
+            if reward["type"] not in REWARD_TYPES:
+                raise CatalogError(f"Unknown reward type {reward['type']}")
+
+
+def load_catalog(path=DEFAULT_CATALOG_PATH):
+    """Load, validate and compile the catalog data file."""
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    buildings, upgrades = validate_catalog(raw)
+    return Catalog(buildings, upgrades,
+                   float(raw.get("ball_production_share", 0.2)),
+                   raw.get("achievements", []))
@@ -0,0 +1,50 @@
+from array import array
+
+
+class ClickStats:
+    """Per-frame click counters and a sliding-window click rate."""
+
+    def __init__(self, window_frames=60):
+        self.window_frames = window_frames
+        self._hits = array("I", [0]) * window_frames
+        self._dts = array("f", [0.0]) * window_frames
+        self._head = 0
+        self._window_hits = 0
+        self._window_time = 0.0
+
+        self.frame_hits = 0
+        self.frame_accepted = 0
+        self.last_frame_hits = 0
+        self.last_frame_accepted = 0
+        self.total_hits = 0
+        self.total_accepted = 0
+        self.total_rejected = 0
+        self.rate = 0.0
+        self.peak_rate = 0.0
+
+    def record(self, hits, accepted):
+        """Record a batch of hits and how many of them were credited."""
+        self.frame_hits += hits
+        self.frame_accepted += accepted
+        self.total_hits += hits
+        self.total_accepted += accepted
+        self.total_rejected += hits - accepted
+
+    def end_frame(self, dt):
+        """Close the current frame and update the windowed click rate."""
+        i = self._head
+        self._window_hits += self.frame_hits - self._hits[i]
+        self._window_time += dt - self._dts[i]
+        self._hits[i] = self.frame_hits
+        self._dts[i] = dt
+        self._head = (i + 1) % self.window_frames
+        if self._window_time > 0.0:
+            self.rate = self._window_hits / self._window_time
+        else:
+            self.rate = 0.0
+        if self.rate > self.peak_rate:
+            self.peak_rate = self.rate
+        self.last_frame_hits = self.frame_hits
+        self.last_frame_accepted = self.frame_accepted
+        self.frame_hits = 0
+        self.frame_accepted = 0
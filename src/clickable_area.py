@@ -1,14 +1,51 @@
 import pygame
+from click_stats import ClickStats
+
+# Scale of the ball while hovered; build_atlas.py packs this size too.
+HOVER_SCALE = 1.12
 
 class ClickableArea:
-    def __init__(self, center, radius, player):
+    def __init__(self, center, radius, player, max_clicks_per_second=None):
         self.x, self.y = center
         self.radius = radius
         self.player = player
         self.scale = 1.0
+        self.size_multiplier = 1.0
         self.target_scale = 1.0
         self.hovered = False
         self._scaled_cache = {}
+        self.particles = None
+        self.assets = None
+        self.on_credit = None
+        self.stats = ClickStats()
+        self.max_clicks_per_second = max_clicks_per_second
+        self._allowance = float(max_clicks_per_second or 0)
+
+    def set_particles(self, particles):
+        """Set the particle pool used for click feedback."""
+        self.particles = particles
+
+    def set_assets(self, assets):
+        """Set the AssetCache the ball art is drawn from."""
+        self.assets = assets
+        self._scaled_cache.clear()
+
+    def set_credit_handler(self, on_credit):
+        """Credit click gains through on_credit(gain) instead (or None).
+
+        Used when another thread owns the player's points.
+        """
+        self.on_credit = on_credit
+
+    def set_layout(self, center, radius):
+        """Move and resize the area after a window resize."""
+        self.x, self.y = center
+        self.radius = radius
+        self._scaled_cache.clear()
+
+    def hit_radius(self):
+        """Radius used for hover and click tests, including upgrades."""
+        return self.radius * self.size_multiplier
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
@@ -18,18 +55,67 @@ class ClickableArea:
                 ) ** 2 + (
                     my - self.y
                     ) ** 2 <= (
-                        self.radius
+                        self.hit_radius()
                         ) ** 2
-            self.target_scale = 1.12 if self.hovered else 1.0
+            self.target_scale = HOVER_SCALE if self.hovered else 1.0
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             mx, my = event.pos
-            if (mx - self.x) ** 2 + (my - self.y) ** 2 <= (self.radius) ** 2:
-                self.player.points += (
-                    self.player.click_power * self.player.global_multiplier
-                                       )
-                self.target_scale = max(self.target_scale, 1.0)
+            r = self.hit_radius()
+            if (mx - self.x) ** 2 + (my - self.y) ** 2 <= r ** 2:
+                self.apply_hits(1, event.pos)
+
+    def count_hits(self, events):
+        """Split left clicks on the area out of an event batch.
+
+        Returns (hits, last_hit_pos, remaining_events) so the caller can
+        credit every hit of the frame at once and only dispatch the rest.
+        """
+        x, y = self.x, self.y
+        r2 = self.hit_radius() ** 2
+        down = pygame.MOUSEBUTTONDOWN
+        hits = 0
+        last_pos = None
+        rest = []
+        keep = rest.append
+        for e in events:
+            if e.type == down and e.button == 1:
+                pos = e.pos
+                dx = pos[0] - x
+                dy = pos[1] - y
+                if dx * dx + dy * dy <= r2:
+                    hits += 1
+                    last_pos = pos
+                    continue
+            keep(e)
+        return hits, last_pos, rest
+
+    def apply_hits(self, n, pos=None):
+        """Credit n clicks as one batch, honouring the clicks/s cap."""
+        accepted = n
+        if self.max_clicks_per_second is not None:
+            accepted = min(n, int(self._allowance))
+            self._allowance -= accepted
+        self.stats.record(n, accepted)
+        if accepted <= 0:
+            return 0.0
+        gain = (self.player.click_power * self.player.global_multiplier
+                * accepted)
+        if self.on_credit is not None:
+            self.on_credit(gain)
+        else:
+            self.player.points += gain
+        self.target_scale = max(self.target_scale, 1.0)
+        if self.particles is not None:
+            px, py = pos if pos is not None else (self.x, self.y)
+            self.particles.emit_text(px, py - 20, gain)
+            self.particles.emit_burst(px, py, count=min(accepted * 4, 16))
+        return gain
 
     def update(self, dt):
+        self.stats.end_frame(dt)
+        cap = self.max_clicks_per_second
+        if cap is not None:
+            self._allowance = min(float(cap), self._allowance + cap * dt)
         speed = 8.0
         diff = self.target_scale - self.scale
         if abs(diff) > 0.0001:
@@ -38,23 +124,22 @@ class ClickableArea:
             self.scale = self.target_scale
 
     def draw(self, screen):
-        img = getattr(
-            self, 
-            "_ball_hover_img", 
-            None
-            ) if self.hovered else getattr(
-                self, 
-                "_ball_img", 
-                None
-                )
-        if img:
-            r = int(self.radius * self.scale)
-            size = (r * 2, r * 2)
-            key = (id(img), size[0], size[1])
-            surf = self._scaled_cache.get(key)
+        if self.assets is None:
+            return
+        name = "ball-hover.png" if self.hovered else "ball.png"
+        r = int(self.radius * self.scale * self.size_multiplier)
+        size = (r * 2, r * 2)
+        key = (name, size[0], size[1])
+        surf = self._scaled_cache.get(key)
+        if surf is None:
+            # Resting and hovered sizes come from the atlas; sizes the
+            # grow animation passes through are scaled once here.
+            surf = self.assets.atlas_sprite(name, size)
             if surf is None:
+                img = self.assets.image(name)
+                if img is None:
+                    return
                 surf = pygame.transform.smoothscale(img, size)
-                self._scaled_cache[key] = surf
-            rect = surf.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(surf, rect)
-            return
\ No newline at end of file
+            self._scaled_cache[key] = surf
+        rect = surf.get_rect(center=(int(self.x), int(self.y)))
+        screen.blit(surf, rect)
@@ -0,0 +1,262 @@
+from achievements import Achievements
+from buffs import BUFFS, BuffSet
+from catalog import load_catalog
+
+
+class Economy:
+    """Buildings, upgrades and production for one player, without pygame.
+
+    Shop adds drawing, balls and input on top of this; headless tools
+    such as the economy server use it directly.
+    """
+
+    def __init__(self, player, catalog=None):
+        self.player = player
+        self.catalog = catalog if catalog is not None else load_catalog()
+        self.buildings = self.catalog.make_buildings()
+        self.building_multipliers = {bid: 1.0 for bid in self.buildings}
+        self.upgrade_list = self.catalog.make_upgrades()
+        self.current_upgrade_index = 0
+        self.click_power_multiplier = 1.0
+        self.clickable_scale_multiplier = 1.0
+        self.production_multiplier = 1.0
+        self.buffs = BuffSet()
+        self.achievements = Achievements(self.catalog.achievements)
+        self.clicks = 0
+        self._production = None
+        self.listeners = []
+
+    def add_listener(self, callback):
+        """Register callback(kind, **data) for purchase and buff events."""
+        self.listeners.append(callback)
+
+    def _notify(self, kind, **data):
+        for callback in self.listeners:
+            try:
+                callback(kind, **data)
+            except Exception as e:
+                print("Shop listener error:", e)
+
+    def observe(self, counter, value, key=None):
+        """Feed a counter to the achievement engine.
+
+        Only the achievements indexed under (counter, key) are checked;
+        rewards are applied and an "achievement" event sent per unlock.
+        """
+        new = self.achievements.observe((counter, key), value)
+        if not new:
+            return
+        self._effects_changed()
+        defs = self.catalog.achievements.defs
+        for i in new:
+            self._notify("achievement", id=defs[i]["id"])
+
+    def unlock_achievement(self, achievement_id):
+        """Unlock an achievement directly (journal replay)."""
+        if self.achievements.unlock_id(achievement_id):
+            self._effects_changed()
+
+    def _sync_achievements(self):
+        """Unlock, without events, whatever the loaded state reached."""
+        ach = self.achievements
+        ach.observe(("points", None), self.player.points)
+        ach.observe(("clicks", None), self.clicks)
+        ach.observe(("upgrades", None), self.current_upgrade_index)
+        for bid, b in self.buildings.items():
+            ach.observe(("building", bid), b.count)
+
+    def _effects_changed(self):
+        """Called after counts or multipliers change."""
+        self._production = None
+        self._apply_click_power_to_player()
+
+    def attempt_buy_building(self, building_id):
+        """Attempt to purchase a building."""
+        b = self.buildings.get(building_id)
+        if not b:
+            return False
+        price = b.price_next()
+        if self.player.points >= price:
+            self.player.points -= price
+            b.count += 1
+            self._effects_changed()
+            self._notify("building", id=building_id, price=price,
+                         points=self.player.points)
+            self.observe("building", b.count, building_id)
+            return True
+        return False
+
+    def upgrade_unlocked(self, index):
+        """Check the catalog unlock condition of an upgrade."""
+        return self.catalog.is_unlocked(
+            index, self.player.points, self.buildings, self.upgrade_list
+        )
+
+    def attempt_buy_upgrade(self):
+        """Attempt to purchase the next sequential upgrade."""
+        i = self.current_upgrade_index
+        if i >= len(self.upgrade_list) or not self.upgrade_unlocked(i):
+            return False
+        u = self.upgrade_list[i]
+        if self.player.points >= u.price:
+            self.player.points -= u.price
+            u.bought = True
+            self.current_upgrade_index += 1
+            self._apply_upgrade(i)
+            self._effects_changed()
+            self._notify("upgrade", id=u.id, price=u.price,
+                         points=self.player.points)
+            self.observe("upgrades", self.current_upgrade_index)
+            return True
+        return False
+
+    def recompute_upgrade_effects(self):
+        """Rebuild all multipliers from the bought upgrades.
+
+        Only needed after a load or reset; a single purchase goes
+        through _apply_upgrade instead.
+        """
+        self.click_power_multiplier = 1.0
+        self.clickable_scale_multiplier = 1.0
+        self.production_multiplier = 1.0
+        for bid in self.building_multipliers:
+            self.building_multipliers[bid] = 1.0
+        for i, up in enumerate(self.upgrade_list):
+            if up.bought:
+                self._apply_upgrade(i)
+        self._effects_changed()
+
+    def _apply_upgrade(self, i):
+        """Fold the compiled effects of upgrade i into the multipliers."""
+        cat = self.catalog
+        self.click_power_multiplier *= cat.click_factor[i]
+        self.clickable_scale_multiplier *= cat.scale_factor[i]
+        self.production_multiplier *= cat.production_factor[i]
+        for bid, factor in cat.building_factors[i]:
+            self.building_multipliers[bid] *= factor
+        self._production = None
+
+    def start_buff(self, name, target=None, duration=None):
+        """Activate a timed buff (see buffs.BUFFS)."""
+        if duration is None and name in BUFFS:
+            duration = BUFFS[name][2]
+        self.buffs.start(name, target, duration)
+        self._effects_changed()
+        self._notify("buff", name=name, target=target, duration=duration)
+
+    def _apply_click_power_to_player(self):
+        """Derive the player's click_power from base_click_power."""
+        self.player.click_power = (
+            self.player.base_click_power * self.click_power_multiplier
+            * self.buffs.click * self.achievements.click
+        )
+
+    def total_production_per_second(self):
+        """Calculate total production from buildings and their balls.
+
+        Every building owns one ball worth its production, and balls
+        add the catalog's ball_production_share on top, so the total
+        is derived from counts and does not depend on the ball list.
+        The result is cached until a purchase, load or buff change.
+        """
+        if self._production is None:
+            mults = self.building_multipliers
+            boosts = self.buffs.building
+            total = 0.0
+            for bid, b in self.buildings.items():
+                total += (b.production_per_second * b.count * mults[bid]
+                          * boosts.get(bid, 1.0))
+            share = self.catalog.ball_production_share
+            self._production = (total * self.production_multiplier
+                                * self.buffs.production
+                                * self.achievements.production
+                                * (1.0 + share))
+        return self._production
+
+    def income_per_second(self):
+        """Points per second from production, after the global multiplier."""
+        return (self.total_production_per_second()
+                * self.player.global_multiplier)
+
+    def advance(self, dt):
+        """Credit dt seconds of production; return the points gained.
+
+        Production is constant between purchases and buff expiries, so
+        any dt is applied in one step per expiry it crosses.
+        """
+        if dt <= 0.0:
+            return 0.0
+        buffs = self.buffs
+        end = buffs.time + dt
+        gained = 0.0
+        expiry = buffs.next_expiry()
+        while expiry is not None and expiry <= end:
+            gained += self.income_per_second() * (expiry - buffs.time)
+            buffs.expire_until(expiry)
+            self._effects_changed()
+            expiry = buffs.next_expiry()
+        gained += self.income_per_second() * (end - buffs.time)
+        buffs.time = end
+        self.player.points += gained
+        self.observe("points", self.player.points)
+        return gained
+
+    def click(self, hits=1):
+        """Credit hits clicks at the current click power."""
+        gained = (self.player.click_power * self.player.global_multiplier
+                  * hits)
+        self.player.points += gained
+        self.count_clicks(hits)
+        return gained
+
+    def count_clicks(self, hits):
+        """Add credited clicks to the lifetime click counter."""
+        self.clicks += hits
+        self.observe("clicks", self.clicks)
+
+    def to_dict(self):
+        """Serialize progress, buffs and achievements (shop section)."""
+        data = {
+            "buildings": {
+                str(bid): b.count for bid, b in self.buildings.items()
+            },
+            "upgrades": [u.id for u in self.upgrade_list if u.bought],
+            "current_upgrade_index": self.current_upgrade_index,
+            "clicks": self.clicks,
+        }
+        if self.buffs:
+            data["buffs"] = self.buffs.to_dict()
+        if self.achievements:
+            data["achievements"] = self.achievements.ids()
+        return data
+
+    def from_dict(self, d):
+        """Load counts and upgrades from validated shop save data."""
+        for b in self.buildings.values():
+            b.count = 0
+        for k, count in d["buildings"].items():
+            b = self.buildings.get(int(k))
+            if b is not None:
+                b.count = count
+
+        self.current_upgrade_index = d["current_upgrade_index"]
+        bought = set(d["upgrades"])
+        for u in self.upgrade_list:
+            u.bought = u.id in bought
+        self.buffs.from_dict(d.get("buffs", []))
+        self.clicks = d.get("clicks", 0)
+        self.achievements.from_dict(d.get("achievements", []))
+        self._sync_achievements()
+        self.recompute_upgrade_effects()
+
+    def reset_progress(self):
+        """Return counts and upgrades to a fresh game."""
+        for b in self.buildings.values():
+            b.count = 0
+        for u in self.upgrade_list:
+            u.bought = False
+        self.current_upgrade_index = 0
+        self.buffs.clear()
+        self.clicks = 0
+        self.achievements.clear()
+        self.recompute_upgrade_effects()
@@ -0,0 +1,151 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+from economy_server import DEFAULT_HOST, DEFAULT_PORT
+
+OP_MIX = (("state", 0.6), ("click", 0.3), ("buy", 0.1))
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    k = max(0, min(len(sorted_values) - 1,
+                   int(round(q / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[k]
+
+
+def make_request(rng, players, building_ids):
+    """Pick a random request following OP_MIX."""
+    roll = rng.random()
+    player = f"p{rng.randrange(players)}"
+    for op, share in OP_MIX:
+        roll -= share
+        if roll < 0:
+            break
+    if op == "click":
+        return {"op": "click", "player": player, "hits": rng.randint(1, 20)}
+    if op == "buy":
+        return {"op": "buy", "player": player,
+                "building": rng.choice(building_ids)}
+    return {"op": "state", "player": player}
+
+
+async def _client(host, port, requests, players, seed, latencies, errors):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    building_ids = [1, 2, 3, 4, 5, 6]
+    try:
+        for _ in range(requests):
+            line = json.dumps(make_request(rng, players, building_ids))
+            start = time.perf_counter()
+            writer.write(line.encode("utf-8") + b"\n")
+            await writer.drain()
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if not reply or not json.loads(reply).get("ok"):
+                errors.append(reply)
+    finally:
+        writer.close()
+
+
+async def _warm_up(host, port, players):
+    """Touch every player once so creation cost is not measured."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(players):
+            writer.write(json.dumps({"op": "state", "player": f"p{i}"})
+                         .encode("utf-8") + b"\n")
+            await writer.drain()
+            await reader.readline()
+    finally:
+        writer.close()
+
+
+async def _spawn_server():
+    """Start economy_server.py on a free port; return (process, port)."""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                          "economy_server.py")
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, script, "--port", "0",
+        stdout=asyncio.subprocess.PIPE
+    )
+    line = (await proc.stdout.readline()).decode("utf-8").strip()
+    if not line:
+        raise RuntimeError("economy server did not start")
+    return proc, int(line.rsplit(":", 1)[1])
+
+
+async def run_load(host, port, connections, requests, players, seed=0):
+    """Run the load and return a summary dict."""
+    latencies = []
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, requests, players, seed + i, latencies, errors)
+        for i in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000.0,
+        "p99_ms": percentile(latencies, 99) * 1000.0,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000.0,
+    }
+
+
+async def _main(args):
+    proc = None
+    host, port = args.host, args.port
+    if args.spawn:
+        proc, port = await _spawn_server()
+        host = DEFAULT_HOST
+    try:
+        if args.warmup:
+            await _warm_up(host, port, args.players)
+        return await run_load(host, port, args.connections, args.requests,
+                              args.players, args.seed)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            await proc.wait()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Load-test the economy server and report throughput "
+                    "and latency."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--spawn", action="store_true",
+                        help="start a server subprocess on a free port")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500,
+                        help="requests per connection")
+    parser.add_argument("--players", type=int, default=5000)
+    parser.add_argument("--no-warmup", dest="warmup", action="store_false")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(_main(args))
+    print(f"{result['requests']} requests over {args.connections} "
+          f"connections in {result['seconds']:.2f} s")
+    print(f"  throughput: {result['requests_per_second']:.0f} req/s")
+    print(f"  latency: p50 {result['p50_ms']:.2f} ms, "
+          f"p99 {result['p99_ms']:.2f} ms, max {result['max_ms']:.2f} ms")
+    print(f"  errors: {result['errors']}")
+    return 1 if result["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
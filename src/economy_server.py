@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from catalog import DEFAULT_CATALOG_PATH, load_catalog
+from economy import Economy
+from player_state import PlayerState
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class EconomyServer:
+    """Serves many player economies over newline-delimited JSON.
+
+    Each request is one JSON object with an "op" and a "player" id and
+    gets exactly one JSON reply line. States are created on first use
+    and only advanced when a request touches them: production is
+    constant between purchases, so the time since the last request is
+    credited in one step.
+    """
+
+    def __init__(self, catalog, clock=time.monotonic):
+        self.catalog = catalog
+        self.clock = clock
+        self.players = {}
+        self.requests = 0
+        self.ops = {
+            "state": self._op_state,
+            "click": self._op_click,
+            "buy": self._op_buy,
+            "upgrade": self._op_upgrade,
+            "export": self._op_export,
+            "drop": self._op_drop,
+        }
+
+    def economy(self, player_id):
+        """Return the economy for player_id, advanced to now."""
+        now = self.clock()
+        entry = self.players.get(player_id)
+        if entry is None:
+            entry = [Economy(PlayerState(), self.catalog), now]
+            self.players[player_id] = entry
+        else:
+            entry[0].advance(now - entry[1])
+            entry[1] = now
+        return entry[0]
+
+    def handle(self, request):
+        """Run one decoded request and return the reply dict."""
+        self.requests += 1
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "request must be an object"}
+        op = self.ops.get(request.get("op"))
+        if op is None:
+            return {"ok": False, "error": f"unknown op {request.get('op')!r}"}
+        player_id = request.get("player")
+        if not isinstance(player_id, (str, int)) or isinstance(player_id,
+                                                                bool):
+            return {"ok": False, "error": "missing player id"}
+        try:
+            return op(player_id, request)
+        except (KeyError, TypeError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+
+    def _state(self, econ, **extra):
+        reply = {
+            "ok": True,
+            "points": econ.player.points,
+            "per_second": econ.income_per_second(),
+            "click_power": econ.player.click_power,
+            "buildings": {
+                str(bid): b.count for bid, b in econ.buildings.items()
+            },
+            "next_upgrade": econ.current_upgrade_index,
+        }
+        reply.update(extra)
+        return reply
+
+    def _op_state(self, player_id, request):
+        return self._state(self.economy(player_id))
+
+    def _op_click(self, player_id, request):
+        hits = int(request.get("hits", 1))
+        if hits < 0:
+            raise ValueError("hits must be >= 0")
+        econ = self.economy(player_id)
+        econ.click(hits)
+        return self._state(econ)
+
+    def _op_buy(self, player_id, request):
+        econ = self.economy(player_id)
+        bought = econ.attempt_buy_building(int(request["building"]))
+        return self._state(econ, bought=bought)
+
+    def _op_upgrade(self, player_id, request):
+        econ = self.economy(player_id)
+        bought = econ.attempt_buy_upgrade()
+        return self._state(econ, bought=bought)
+
+    def _op_export(self, player_id, request):
+        econ = self.economy(player_id)
+        return {"ok": True, "player": econ.player.to_dict(),
+                "shop": econ.to_dict()}
+
+    def _op_drop(self, player_id, request):
+        return {"ok": True,
+                "dropped": self.players.pop(player_id, None) is not None}
+
+    async def serve_client(self, reader, writer):
+        """Answer request lines until the client disconnects."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    reply = self.handle(json.loads(line))
+                except ValueError:
+                    reply = {"ok": False, "error": "invalid JSON"}
+                writer.write(
+                    json.dumps(reply, separators=(",", ":")).encode("utf-8")
+                    + b"\n"
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        return await asyncio.start_server(self.serve_client, host, port)
+
+
+async def _serve(args):
+    server = EconomyServer(load_catalog(args.catalog))
+    listener = await server.start(args.host, args.port)
+    port = listener.sockets[0].getsockname()[1]
+    print(f"Economy server listening on {args.host}:{port}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve many Tennis Clicker economies over a local "
+                    "socket (one JSON object per line)."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT,
+                        help="0 picks a free port")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
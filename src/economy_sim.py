@@ -0,0 +1,308 @@
+import argparse
+import csv
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from building import PRICE_GROWTH
+from catalog import DEFAULT_CATALOG_PATH, load_catalog
+
+
+class EconomySim:
+    """Headless, event-driven model of the shop economy.
+
+    Income is constant between purchases, so instead of stepping frames
+    the simulation jumps straight to the moment the next purchase is
+    affordable.
+    """
+
+    def __init__(self, catalog, clicks_per_second=5.0,
+                 price_growth=PRICE_GROWTH, production_scale=1.0):
+        self.catalog = catalog
+        self.clicks_per_second = clicks_per_second
+        self.price_growth = price_growth
+        self.production_scale = production_scale
+        self.buildings = catalog.make_buildings()
+        self.upgrades = catalog.make_upgrades()
+        self.next_upgrade = 0
+        self.points = 0.0
+        self.time = 0.0
+        self.click_mult = 1.0
+        self.production_mult = 1.0
+        self.building_mults = {bid: 1.0 for bid in self.buildings}
+        self.purchases = 0
+
+    def price(self, bid):
+        b = self.buildings[bid]
+        if self.price_growth == PRICE_GROWTH:
+            return b.price_next()
+        return int(b.base_price * (self.price_growth ** b.count))
+
+    def building_rate(self, bid):
+        """Production one more unit of bid would add, per second."""
+        b = self.buildings[bid]
+        return (b.production_per_second * self.building_mults[bid]
+                * self.production_mult * self.production_scale
+                * (1.0 + self.catalog.ball_production_share))
+
+    def production(self):
+        return sum(self.building_rate(bid) * b.count
+                   for bid, b in self.buildings.items())
+
+    def click_income(self):
+        return self.clicks_per_second * self.click_mult
+
+    def income(self):
+        return self.production() + self.click_income()
+
+    def available_upgrade(self):
+        """Index of the next upgrade if it is unlocked, else None."""
+        i = self.next_upgrade
+        if i >= len(self.upgrades):
+            return None
+        if not self.catalog.is_unlocked(i, self.points, self.buildings,
+                                        self.upgrades):
+            return None
+        return i
+
+    def upgrade_gain(self, i):
+        """Extra income per second that buying upgrade i would give."""
+        cat = self.catalog
+        gain = self.click_income() * (cat.click_factor[i] - 1.0)
+        gain += self.production() * (cat.production_factor[i] - 1.0)
+        for bid, factor in cat.building_factors[i]:
+            gain += self.building_rate(bid) * self.buildings[bid].count * (
+                factor - 1.0
+            )
+        return gain
+
+    def options(self):
+        """All purchasable actions as (kind, key, price, income_gain)."""
+        opts = [("building", bid, self.price(bid), self.building_rate(bid))
+                for bid in self.buildings]
+        i = self.available_upgrade()
+        if i is not None:
+            opts.append(("upgrade", i, self.upgrades[i].price,
+                         self.upgrade_gain(i)))
+        return opts
+
+    def wait_and_buy(self, kind, key, price):
+        """Advance time until price is affordable, then buy."""
+        if self.points < price:
+            income = self.income()
+            if income <= 0.0:
+                return False
+            self.time += (price - self.points) / income
+            self.points = float(price)
+        self.points -= price
+        if kind == "building":
+            self.buildings[key].count += 1
+        else:
+            cat = self.catalog
+            self.upgrades[key].bought = True
+            self.next_upgrade = key + 1
+            self.click_mult *= cat.click_factor[key]
+            self.production_mult *= cat.production_factor[key]
+            for bid, factor in cat.building_factors[key]:
+                self.building_mults[bid] *= factor
+        self.purchases += 1
+        return True
+
+
+class GreedyPolicy:
+    """Buy whatever has the lowest price per unit of added income."""
+
+    name = "greedy"
+
+    def choose(self, sim):
+        best = None
+        best_ratio = None
+        for kind, key, price, gain in sim.options():
+            if gain <= 0.0:
+                continue
+            # Time to afford counts too, so cheap-now beats cheap-per-unit.
+            wait = max(0.0, price - sim.points) / max(sim.income(), 1e-9)
+            ratio = price / gain + wait
+            if best_ratio is None or ratio < best_ratio:
+                best, best_ratio = (kind, key, price), ratio
+        return best
+
+
+class CheapestFirstPolicy:
+    """Always buy the cheapest available item."""
+
+    name = "cheapest"
+
+    def choose(self, sim):
+        opts = sim.options()
+        if not opts:
+            return None
+        kind, key, price, _ = min(opts, key=lambda o: o[2])
+        return kind, key, price
+
+
+class ScriptedPolicy:
+    """Follow a fixed purchase order, then fall back to another policy.
+
+    Steps are building ids (ints) or upgrade ids (strings).
+    """
+
+    def __init__(self, steps, fallback=None, name="scripted"):
+        self.steps = list(steps)
+        self.fallback = fallback or GreedyPolicy()
+        self.name = name
+        self._pos = 0
+
+    def choose(self, sim):
+        while self._pos < len(self.steps):
+            step = self.steps[self._pos]
+            self._pos += 1
+            if isinstance(step, str):
+                i = sim.catalog.upgrade_index.get(step)
+                if i is None or i != sim.next_upgrade:
+                    continue
+                return "upgrade", i, sim.upgrades[i].price
+            if step in sim.buildings:
+                return "building", step, sim.price(step)
+        return self.fallback.choose(sim)
+
+
+POLICIES = {
+    "greedy": GreedyPolicy,
+    "cheapest": CheapestFirstPolicy,
+}
+
+
+def make_policy(spec):
+    """Build a policy from a name or "script:1,1,up1,2" spec."""
+    if spec.startswith("script:"):
+        steps = []
+        for token in spec[len("script:"):].split(","):
+            token = token.strip()
+            if token:
+                steps.append(int(token) if token.isdigit() else token)
+        return ScriptedPolicy(steps, name=spec)
+    return POLICIES[spec]()
+
+
+def run_simulation(catalog, policy, clicks_per_second=5.0,
+                   price_growth=PRICE_GROWTH, production_scale=1.0,
+                   max_time=36000.0, max_purchases=10000):
+    """Simulate one policy; return time-to-milestone results.
+
+    Milestones are the first purchase of every building tier and of
+    every upgrade. Unreached milestones are reported as None.
+    """
+    sim = EconomySim(catalog, clicks_per_second, price_growth,
+                     production_scale)
+    milestones = {f"building_{bid}": None for bid in sim.buildings}
+    milestones.update({f"upgrade_{u.id}": None for u in sim.upgrades})
+    while sim.purchases < max_purchases and sim.time < max_time:
+        choice = policy.choose(sim)
+        if choice is None:
+            break
+        kind, key, price = choice
+        if not sim.wait_and_buy(kind, key, price) or sim.time > max_time:
+            break
+        name = (f"building_{key}" if kind == "building"
+                else f"upgrade_{sim.upgrades[key].id}")
+        if milestones[name] is None:
+            milestones[name] = sim.time
+            if all(v is not None for v in milestones.values()):
+                break
+    return {
+        "policy": policy.name,
+        "clicks_per_second": clicks_per_second,
+        "price_growth": price_growth,
+        "production_scale": production_scale,
+        "purchases": sim.purchases,
+        "end_time": sim.time,
+        **milestones,
+    }
+
+
+_worker_catalog = None
+
+
+def _init_worker(catalog_path):
+    global _worker_catalog
+    _worker_catalog = load_catalog(catalog_path)
+
+
+def _run_job(job):
+    policy_spec, cps, growth, scale, max_time = job
+    return run_simulation(_worker_catalog, make_policy(policy_spec), cps,
+                          growth, scale, max_time)
+
+
+def sweep(policies, cps_values, growth_values, scale_values,
+          max_time=36000.0, workers=None, catalog_path=DEFAULT_CATALOG_PATH):
+    """Run every parameter combination across a process pool."""
+    jobs = [
+        (p, c, g, s, max_time)
+        for p, c, g, s in itertools.product(policies, cps_values,
+                                            growth_values, scale_values)
+    ]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(catalog_path,)) as pool:
+        return list(pool.map(_run_job, jobs, chunksize=chunksize))
+
+
+def write_csv(rows, path):
+    if not rows:
+        return
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({
+                k: ("" if v is None else
+                    round(v, 2) if isinstance(v, float) else v)
+                for k, v in row.items()
+            })
+
+
+def _floats(text):
+    return [float(v) for v in text.split(",") if v.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Sweep purchase policies over the Tennis Clicker "
+                    "economy and write time-to-milestone tables."
+    )
+    parser.add_argument("--out", default="balance.csv")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH)
+    parser.add_argument("--policies", default="greedy,cheapest",
+                        help="comma-separated; use ';' before a "
+                             "script:1,1,up1 policy")
+    parser.add_argument("--cps", default="0.5,1,2,5,10",
+                        help="clicks per second values")
+    parser.add_argument("--growth", default=str(PRICE_GROWTH),
+                        help="price growth factors")
+    parser.add_argument("--production-scale", default="1.0",
+                        help="production multipliers")
+    parser.add_argument("--max-time", type=float, default=36000.0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    policies = []
+    for group in args.policies.split(";"):
+        if group.startswith("script:"):
+            policies.append(group)
+        else:
+            policies.extend(p for p in group.split(",") if p)
+    rows = sweep(policies, _floats(args.cps), _floats(args.growth),
+                 _floats(args.production_scale), args.max_time,
+                 args.workers, args.catalog)
+    write_csv(rows, args.out)
+    print(f"Wrote {len(rows)} runs to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+
+import pygame
+
+DROP_NEWEST = "drop_newest"
+REPLACE_OLDEST = "replace_oldest"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind))))
+
+
+def rgb_surface(size):
+    """24-bit surface whose bytes are laid out R, G, B like PNG rows."""
+    return pygame.Surface(size, 0, 24, (0xFF, 0xFF00, 0xFF0000, 0))
+
+
+def encode_png(surface, level=1):
+    """Encode an RGB PNG of a surface made by rgb_surface().
+
+    pygame.image.save holds the GIL while compressing; here the pixels
+    are read in place and zlib releases the GIL, so encoding on a
+    worker thread barely slows the game thread.
+    """
+    w, h = surface.get_size()
+    stride = w * 3
+    pitch = surface.get_pitch()
+    rows = bytearray()
+    buf = surface.get_buffer()
+    try:
+        view = memoryview(buf)
+        for y in range(0, h * pitch, pitch):
+            rows += b"\x00"
+            rows += view[y:y + stride]
+        view.release()
+    finally:
+        del buf
+    return b"".join((
+        PNG_SIGNATURE,
+        _chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)),
+        _chunk(b"IDAT", zlib.compress(rows, level)),
+        _chunk(b"IEND", b""),
+    ))
+
+
+class FrameCapture:
+    """Records frames to a PNG sequence on worker threads.
+
+    capture() only blits the frame into a free buffer from a fixed
+    pool (converting it to PNG byte order) and queues it. When every
+    buffer is waiting for an encoder, the drop policy decides:
+    DROP_NEWEST skips the new frame, REPLACE_OLDEST drops the oldest
+    queued one and reuses its buffer.
+    Frames keep their game frame number in the file name, so drops
+    show as gaps, and stop() writes them to capture.json.
+    """
+
+    def __init__(self, directory, size, pool_size=6, workers=None,
+                 drop_policy=DROP_NEWEST, every=1, level=1):
+        if drop_policy not in (DROP_NEWEST, REPLACE_OLDEST):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.dir = directory
+        os.makedirs(directory, exist_ok=True)
+        self.size = tuple(size)
+        self.drop_policy = drop_policy
+        self.every = max(1, int(every))
+        self.level = level
+        self.frame = 0
+        self.queued = 0
+        self.written = 0
+        self.bytes_written = 0
+        self.dropped = []
+        self.errors = 0
+        self.copy_time = 0.0
+        self.encode_time = 0.0
+
+        self._free = [rgb_surface(self.size) for _ in range(pool_size)]
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._busy = 0
+        self._stopped = False
+        if workers is None:
+            workers = min(2, os.cpu_count() or 1)
+        self._threads = [
+            threading.Thread(target=self._run, name=f"capture-{i}",
+                             daemon=True)
+            for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def capture(self, surface):
+        """Queue a copy of surface as the next frame (cheap, main thread)."""
+        n = self.frame
+        self.frame += 1
+        if n % self.every:
+            return False
+        if surface.get_size() != self.size:
+            self.dropped.append(n)
+            return False
+        with self._cond:
+            if self._stopped:
+                return False
+            if self._free:
+                buf = self._free.pop()
+            elif self.drop_policy == REPLACE_OLDEST and self._pending:
+                old, buf = self._pending.popleft()
+                self.dropped.append(old)
+            else:
+                self.dropped.append(n)
+                return False
+        start = time.perf_counter()
+        buf.blit(surface, (0, 0))
+        self.copy_time += time.perf_counter() - start
+        with self._cond:
+            self._pending.append((n, buf))
+            self.queued += 1
+            self._cond.notify()
+        return True
+
+    def flush(self, timeout=None):
+        """Block until every queued frame has been written."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def stop(self, timeout=None):
+        """Finish queued frames, stop the workers and write the report."""
+        self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join(timeout)
+        self._write_manifest()
+
+    def report(self):
+        frames = max(1, self.queued)
+        return (f"captured {self.written} frames "
+                f"({self.bytes_written / 1e6:.1f} MB) to {self.dir}, "
+                f"dropped {len(self.dropped)}, errors {self.errors}; "
+                f"copy {self.copy_time / frames * 1000:.2f} ms/frame, "
+                f"encode {self.encode_time / max(1, self.written) * 1000:.1f}"
+                f" ms/frame")
+
+    def _write_manifest(self):
+        manifest = {
+            "size": list(self.size),
+            "every": self.every,
+            "frames": self.frame,
+            "written": self.written,
+            "dropped": sorted(self.dropped),
+            "drop_policy": self.drop_policy,
+        }
+        try:
+            with open(os.path.join(self.dir, "capture.json"), "w",
+                      encoding="utf-8") as f:
+                json.dump(manifest, f)
+        except OSError as e:
+            print("Capture manifest error:", e)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._stopped)
+                if not self._pending:
+                    return
+                n, buf = self._pending.popleft()
+                self._busy += 1
+            start = time.perf_counter()
+            size = 0
+            try:
+                payload = encode_png(buf, self.level)
+                path = os.path.join(self.dir, f"frame_{n:06d}.png")
+                with open(path, "wb") as f:
+                    f.write(payload)
+                size = len(payload)
+            except Exception as e:
+                print("Capture write error:", e)
+            elapsed = time.perf_counter() - start
+            with self._cond:
+                self._busy -= 1
+                self._free.append(buf)
+                if size:
+                    self.written += 1
+                    self.bytes_written += size
+                    self.encode_time += elapsed
+                else:
+                    self.errors += 1
+                self._cond.notify_all()
@@ -1,10 +1,83 @@
+import os
+import random
+import time
+from contextlib import nullcontext
 import pygame
 from ui_manager import UIManager
 from player_state import PlayerState
 from shop import Shop
 from clickable_area import ClickableArea
-from save_manager import SaveManager
+from save_manager import SaveManager, FORMAT_SUFFIXES
 from physics_manager import PhysicsManager
+from particle_system import ParticleSystem
+from autosave import AutosaveScheduler
+from save_journal import SaveJournal, after_new_game, replay
+from slot_index import SlotIndex
+from layout import Layout
+from asset_cache import AssetCache
+from stats_history import StatsHistory
+from sound_bank import SoundBank
+from sim_thread import SimulationThread, SimSnapshot
+from buffs import BUFFS
+from frame_capture import FrameCapture
+
+PARTICLE_CAPACITY = 512
+PARTICLE_DROP_POLICY = "replace_oldest"
+MAX_CLICKS_PER_SECOND = None
+AUTOSAVE_INTERVAL = 300.0
+JOURNAL_CHECKPOINT_INTERVAL = 5.0
+JOURNAL_COMPACT_BYTES = 64 * 1024
+SAVE_FORMAT = "json"
+SAVE_BALL_MODE = "full"
+SAVE_SLOTS = 3
+ASSET_CACHE_DIR = "cache/assets"
+# Index written by build_atlas.py, relative to assets/ (None disables it).
+ATLAS_INDEX = "atlas.json"
+SOUND_ENABLED = True
+SOUND_CHANNELS = 8
+STATS_CAPACITY = 720
+STATS_INTERVAL = 5.0
+SAVE_STATS = True
+ACHIEVEMENT_BANNER_SECONDS = 4.0
+# Mean seconds between random buffs (None disables them).
+BUFF_MEAN_INTERVAL = 240.0
+FRAME_RATE = 60
+# Minimized (or unfocused) windows skip rendering and physics and only
+# credit production, BACKGROUND_FPS times per second.
+BACKGROUND_FPS = 4
+BACKGROUND_ON_FOCUS_LOSS = True
+# F12 records frames to a new folder under CAPTURE_DIR.
+CAPTURE_DIR = "captures"
+CAPTURE_EVERY = 1
+CAPTURE_DROP_POLICY = "drop_newest"
+# Run economy, physics and shop on their own thread at SIM_RATE Hz.
+SIM_THREAD = False
+SIM_RATE = 60
+# Button id -> (label, Game method called on click); ids are layout names.
+UI_BUTTONS = (
+    ("start", "Start", "start_game"),
+    ("save", "Save", "save_game"),
+    ("load", "Load", "show_slots"),
+    ("credits", "Credits", "show_credits"),
+    ("quit", "Quit", "quit_game"),
+    ("stats", "Stats", "show_stats"),
+    ("pause", "Pause", "pause_game"),
+    ("back", "Back", "back_to_menu"),
+)
+# Game state -> buttons shown, in draw order (SLOTS also gets the slots).
+UI_SCREENS = {
+    "MENU": ("start", "save", "load", "credits", "quit", "stats"),
+    "RUNNING": ("pause",),
+    "CREDITS": ("back",),
+    "SLOTS": ("back",),
+    "STATS": ("back",),
+}
+STATS_GRAPHS = (
+    ("points", "Points", (255, 220, 100)),
+    ("production", "Production /s", (120, 220, 120)),
+    ("click_rate", "Clicks /s", (120, 180, 255)),
+    ("frame_ms", "Frame time (ms)", (240, 120, 120)),
+)
 
 class Game:
     def __init__(self, screen):
@@ -12,188 +85,466 @@ class Game:
         self.running = True
         self.state = "MENU"
         self.previous_state = None
+        self.fullscreen = False
+        self.minimized = False
+        self.focused = True
+        self.backgrounded = False
+        self._needs_redraw = True
+        self._catch_up_pending = False
+        self.capture = None
+        self.windowed_size = screen.get_size()
+        self.layout = Layout(screen.get_size())
+        self.assets = AssetCache(disk_cache=ASSET_CACHE_DIR,
+                                 atlas=ATLAS_INDEX)
         self.ui = UIManager(screen)
         self.player = PlayerState()
-        self.save_manager = SaveManager("saves/save_slot_1.json")
-        self.shop = Shop(self.player)
-        center = (self.screen.get_width() // 2, self.screen.get_height() // 2)
-        self.clickable = ClickableArea(center, 110, self.player)
+        self.slot_index = SlotIndex("saves/index.json")
+        self.current_slot = 1
+        self.save_manager = self._slot_save_manager(self.current_slot)
+        self.autosave = AutosaveScheduler(self.save_manager,
+                                          AUTOSAVE_INTERVAL,
+                                          on_saved=self._on_saved)
+        self.journal = SaveJournal(
+            self.save_manager.path.with_suffix(".journal")
+        )
+        self._journal_based = False
+        self._checkpoint_elapsed = 0.0
+        self._compact_pending = False
+        self.shop = Shop(self.player, *screen.get_size(), assets=self.assets)
+        self.clickable = ClickableArea(self.layout.rect("clickable").center,
+                                       self.layout.px(110), self.player,
+                                       MAX_CLICKS_PER_SECOND)
         self.shop.set_clickable(self.clickable)
         self.physics = PhysicsManager()
+        self.particles = ParticleSystem(PARTICLE_CAPACITY,
+                                        PARTICLE_DROP_POLICY)
+        self.clickable.set_particles(self.particles)
+        self.clickable.set_assets(self.assets)
+        self.shop.set_particles(self.particles)
+        self.shop.add_listener(self._on_shop_event)
+        self.sounds = SoundBank(SOUND_CHANNELS, SOUND_ENABLED)
+        self.stats = StatsHistory(STATS_CAPACITY, STATS_INTERVAL)
+        self._stats_surface = None
+        self._stats_key = None
+        self._clicks_seen = 0
+        self._banner = None
+        self._banner_time = 0.0
         self.unsaved_changes = False
+        self.sim = None
+        if SIM_THREAD:
+            self.sim = SimulationThread(self._simulate, self._make_snapshot,
+                                        SIM_RATE)
         
         self.add_buttons_ui()
-        
-        self.shop.set_ui_positions(900, 0)
-
-        self.ui.set_buttons_visible_for_state("MENU")
+        self._apply_layout()
+        self.assets.flush()
 
-    def add_start_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
-        start_y = 150
-        button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
+        self.ui.set_state("MENU")
 
-        start_rect = (center_x - start_btn_width // 2, 
-                      start_y, 
-                      start_btn_width, 
-                      start_btn_height)
-
-        self.ui.add_button("start", start_rect, "Start", self.start_game)
-
-    def add_save_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
-        start_y = 150
-        button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
-
-        save_rect = (center_x - btn_width // 2, 
-                        start_y + button_spacing + 30, 
-                        btn_width, 
-                        btn_height)
-        self.ui.add_button("save", save_rect, "Save", self.save_game)
-
-    def add_load_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
-        start_y = 150
-        button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
-
-        load_rect = (center_x - btn_width // 2, 
-                     start_y + button_spacing * 2 + 30, 
-                     btn_width, 
-                     btn_height)
-        self.ui.add_button("load", load_rect, "Load", self.load_game)
-
-    def add_credits_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
-        start_y = 150
-        button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
-
-        credits_rect = (center_x - btn_width // 2, 
-                        start_y + button_spacing * 3 + 30, 
-                        btn_width, 
-                        btn_height)
-        self.ui.add_button("credits", 
-                           credits_rect, 
-                           "Credits", 
-                           self.show_credits)
-
-    def add_quit_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
-        start_y = 150
-        button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
-
-        quit_rect = (center_x - btn_width // 2, 
-                     start_y + button_spacing * 4 + 30, 
-                     btn_width, 
-                     btn_height)
-        self.ui.add_button("quit", 
-                           quit_rect, 
-                           "Quit", 
-                           self.quit_game)
-        
-    def add_pause_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
+    def add_buttons_ui(self):
+        """Create the buttons of UI_BUTTONS and the slot picker."""
+        for id_, label, action in UI_BUTTONS:
+            self.ui.add_button(id_, self.layout.rect(id_), label,
+                               getattr(self, action))
         start_y = 150
         button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
-
-        pause_rect = (10, 10, btn_width, btn_height)
-        self.ui.add_button("pause", pause_rect, "Pause", self.pause_game)
+        slots = []
+        for slot in range(1, SAVE_SLOTS + 1):
+            name = f"slot_{slot}"
+            self.layout.add(name, "midtop",
+                            (0, start_y + button_spacing * slot), (420, 50))
+            self.ui.add_button(name,
+                               self.layout.rect(name),
+                               f"Slot {slot}",
+                               lambda slot=slot: self.select_slot(slot))
+            slots.append(name)
+        screens = dict(UI_SCREENS)
+        screens["SLOTS"] = screens["SLOTS"] + tuple(slots)
+        self.ui.set_screens(screens)
+
+    def on_resize(self, size):
+        """Recompute the layout and rescale art for a new window size."""
+        self.screen = pygame.display.get_surface() or self.screen
+        self.ui.screen = self.screen
+        self.layout.resize(self.screen.get_size())
+        self.assets.clear_scaled()
+        self._apply_layout()
+        self.assets.flush()
+
+    def toggle_fullscreen(self):
+        """Switch between a resizable window and desktop fullscreen."""
+        self.fullscreen = not self.fullscreen
+        if self.fullscreen:
+            self.windowed_size = self.screen.get_size()
+            pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            pygame.display.set_mode(self.windowed_size, pygame.RESIZABLE)
+        self.on_resize(pygame.display.get_surface().get_size())
 
-    def add_back_ui(self):
-        screen_width = self.screen.get_width()
-        center_x = screen_width // 2
-        start_y = 150
-        button_spacing = 70
-        start_btn_width = 200
-        start_btn_height = 60
-        btn_width = 140
-        btn_height = 40
+    def start_capture(self, directory=None):
+        """Record rendered frames to a PNG sequence in directory."""
+        if self.capture is not None:
+            return
+        if directory is None:
+            directory = os.path.join(CAPTURE_DIR,
+                                     time.strftime("%Y%m%d-%H%M%S"))
+        try:
+            self.capture = FrameCapture(directory, self.screen.get_size(),
+                                        drop_policy=CAPTURE_DROP_POLICY,
+                                        every=CAPTURE_EVERY)
+        except (OSError, ValueError) as e:
+            print("Capture error:", e)
+
+    def stop_capture(self):
+        """Finish writing queued frames and report the recording."""
+        if self.capture is None:
+            return
+        self.capture.stop()
+        print(self.capture.report())
+        self.capture = None
 
-        back_rect = (10, 10, btn_width, btn_height)
-        self.ui.add_button("back", back_rect, "Back", self.back_to_menu)
+    def toggle_capture(self):
+        if self.capture is None:
+            self.start_capture()
+        else:
+            self.stop_capture()
+
+    def _set_window_state(self, minimized=None, focused=None):
+        """Track minimize/focus changes and enter or leave background mode."""
+        if minimized is not None:
+            self.minimized = minimized
+        if focused is not None:
+            self.focused = focused
+        background = self.minimized or (BACKGROUND_ON_FOCUS_LOSS
+                                        and not self.focused)
+        if background == self.backgrounded:
+            return
+        self.backgrounded = background
+        if background:
+            if self.state == "RUNNING":
+                self._pause_simulation()
+        else:
+            self._catch_up_pending = True
+            self._needs_redraw = True
+
+    def frame_rate(self):
+        """Frames per second the main loop should run at right now."""
+        return BACKGROUND_FPS if self.backgrounded else FRAME_RATE
+
+    def needs_render(self):
+        """False while in background mode, unless the window was exposed."""
+        return not self.backgrounded or self._needs_redraw
+
+    def _apply_layout(self):
+        """Push layout rects to every element and pre-scale the art."""
+        layout = self.layout
+        self.ui.apply_layout(layout, self.assets.font(layout.px(24)))
+        pause_btn = self.ui.buttons.get("pause")
+        pause_img = self.assets.scaled("pause-btn.png", pause_btn.rect.size)
+        if pause_img is not None:
+            pause_btn._img = pause_img
+            pause_btn._img_hover = pause_img
+        self.shop.set_layout(layout.rect("shop"), layout.scale,
+                             layout.window.size)
+        self.clickable.set_layout(layout.rect("clickable").center,
+                                  layout.px(110))
+        # Balls move in design pixels; drawing scales them to the window.
+        playfield = layout.rect("playfield")
+        self.physics.screen_rect = pygame.Rect(
+            0, 0, round(playfield.w / layout.scale),
+            round(playfield.h / layout.scale)
+        )
+
+        self.background = self.assets.scaled("background.png",
+                                             layout.window.size)
+        self._overlay = pygame.Surface(layout.window.size)
+        self._overlay.set_alpha(180)
+        self._overlay.fill((0, 0, 0))
+        self._points_bg = self.assets.scaled("points.png",
+                                             layout.rect("points").size)
+        # One sprite per ball type at its scaled diameter.
+        self._ball_scaled_cache = {}
+        for i in range(1, 7):
+            d = layout.px((12 + i * 2) * 2)
+            name = self._ball_sprite_name(i)
+            self._ball_scaled_cache[(name, d)] = self.assets.scaled(
+                name, (d, d)
+            )
 
-    def add_buttons_ui(self):
-        self.add_start_ui()
-        self.add_save_ui()
-        self.add_load_ui()
-        self.add_credits_ui()
-        self.add_quit_ui()
-        self.add_pause_ui()
-        self.add_back_ui()
+    def _ball_sprite_name(self, type_id):
+        return "ball.png" if type_id == 1 else f"ball-{type_id}.png"
 
     def start_game(self):
         self.state = "RUNNING"
         self.previous_state = "RUNNING"
-        self.ui.set_buttons_visible_for_state("RUNNING")
+        self.ui.set_state("RUNNING")
+        self._resume_simulation()
 
     def pause_game(self):
+        self._pause_simulation()
         self.previous_state = self.state
         self.state = "MENU"
-        self.ui.set_buttons_visible_for_state("MENU")
+        self.ui.set_state("MENU")
         if self.previous_state == "RUNNING":
             self.ui.buttons["start"].set_text("Resume")
 
     def show_credits(self):
         self.state = "CREDITS"
-        self.ui.set_buttons_visible_for_state("CREDITS")
+        self.ui.set_state("CREDITS")
+
+    def show_stats(self):
+        self.state = "STATS"
+        self.ui.set_state("STATS")
+
+    def show_slots(self):
+        """Open the slot picker, labelled from the slot index only."""
+        for slot in range(1, SAVE_SLOTS + 1):
+            self.ui.buttons[f"slot_{slot}"].set_text(self._slot_label(slot))
+        self.state = "SLOTS"
+        self.ui.set_state("SLOTS")
+
+    def _slot_label(self, slot):
+        meta = self.slot_index.discover(slot, self._slot_save_manager(slot))
+        mark = "*" if slot == self.current_slot else ""
+        if meta is None:
+            return f"Slot {slot}{mark}: empty"
+        label = f"Slot {slot}{mark}: {int(meta['points'])} pts"
+        if meta.get("production_per_second") is not None:
+            label += f", {meta['production_per_second']:.1f}/s"
+        if meta.get("saved_at"):
+            label += time.strftime(" (%d/%m %H:%M)",
+                                   time.localtime(meta["saved_at"]))
+        return label
+
+    def select_slot(self, slot):
+        """Switch to a slot, load it if it has a save, and play."""
+        if slot == self.current_slot and self._journal_based:
+            self.start_game()
+            return
+        self.switch_slot(slot)
+        if not self.load_game():
+            self._new_game()
+            # Nothing on disk to replay onto: journal from the start.
+            self._journal_based = True
+        self.start_game()
+
+    def _resume_simulation(self):
+        """Hand the game state to the simulation thread, if enabled."""
+        if self.sim is None:
+            return
+        self.shop.set_command_channel(self.sim.submit, self.sim.defer)
+        self.clickable.set_credit_handler(
+            lambda gain: self.sim.submit(self._credit_points, gain)
+        )
+        self.sim.resume()
+
+    def _pause_simulation(self):
+        """Take the game state back; the main thread may then touch it."""
+        if self.sim is None:
+            return
+        self.sim.pause()
+        self.shop.set_command_channel(None, None)
+        self.clickable.set_credit_handler(None)
+        self.sim.run_deferred()
+
+    def _credit_points(self, gain):
+        self.player.points += gain
+
+    def _on_main(self, fn, *args):
+        """Call fn now, or on the main thread if called from the sim."""
+        if self.sim is not None and self.sim.in_sim_thread():
+            self.sim.defer(fn, *args)
+        else:
+            fn(*args)
+
+    def _make_snapshot(self, tick):
+        return SimSnapshot(tick, self.player.points,
+                           self.shop.income_per_second(),
+                           self.player.click_power, self.shop.ball_entities,
+                           tuple(self.shop.buffs.active()))
 
     def back_to_menu(self):
         self.state = "MENU"
-        self.ui.set_buttons_visible_for_state("MENU")
+        self.ui.set_state("MENU")
+
+    def _slot_save_manager(self, slot):
+        return SaveManager(
+            f"saves/save_slot_{slot}" + FORMAT_SUFFIXES[SAVE_FORMAT],
+            SAVE_FORMAT, ball_mode=SAVE_BALL_MODE,
+            slot=slot, index=self.slot_index
+        )
+
+    def switch_slot(self, slot):
+        """Point saving, autosave and the journal at another slot."""
+        if slot == self.current_slot:
+            return
+        if self.unsaved_changes:
+            self.save_game()
+        self.autosave.flush()
+        self.journal.close()
+        self.current_slot = slot
+        self.save_manager = self._slot_save_manager(slot)
+        self.autosave.save_manager = self.save_manager
+        self.journal = SaveJournal(
+            self.save_manager.path.with_suffix(".journal")
+        )
+        self._journal_based = False
+
+    def _new_game(self):
+        """Reset to a fresh game in the current slot."""
+        self.player = PlayerState()
+        self.shop.player = self.player
+        self.clickable.player = self.player
+        self.shop.reset_progress()
+        self.stats.clear()
+        self._journal_based = False
+        self.unsaved_changes = False
 
     def save_game(self):
-        self.save_manager.save(self.player, self.shop)
-        self.unsaved_changes = False
+        """Request a full snapshot, which also compacts the journal.
+
+        Call on the main thread: with a simulation thread running, the
+        snapshot is taken between its ticks, and the autosave worker
+        serializes and writes it.
+        """
+        held = self.sim.held() if self.sim is not None else nullcontext()
+        with held:
+            if not self._journal_based:
+                # This session replaces the slot's game; records from
+                # now on must not be replayed onto the previous snapshot.
+                self.journal.append("new_game")
+            data = self.save_manager.snapshot(
+                self.player, self.shop, self.stats if SAVE_STATS else None
+            )
+            data["journal_seq"] = self.journal.seq
+            self._journal_based = True
+            self._checkpoint_elapsed = 0.0
+            self.unsaved_changes = False
+        self.autosave.request(data)
+
+    def _on_saved(self, duration, data):
+        self.journal.compact(data.get("journal_seq", 0))
+        self._compact_pending = False
+
+    def _on_shop_event(self, kind, **data):
+        if self._journal_based:
+            self.journal.append(kind, **data)
+        if kind == "buff":
+            return
+        self._on_main(self.sounds.play, "purchase")
+        if kind == "achievement":
+            self._on_main(self._show_achievement, data["id"])
+
+    def _show_achievement(self, achievement_id):
+        """Show an "achievement unlocked" banner for a few seconds."""
+        index = self.shop.catalog.achievements
+        name = index.defs[index.by_id[achievement_id]]["name"]
+        self._banner = f"Achievement unlocked: {name}"
+        self._banner_time = ACHIEVEMENT_BANNER_SECONDS
+
+    def _update_journal(self, dt):
+        """Checkpoint points periodically; compact when the log grows."""
+        self._checkpoint_elapsed += dt
+        if self._checkpoint_elapsed >= JOURNAL_CHECKPOINT_INTERVAL:
+            self._checkpoint_elapsed = 0.0
+            if self._journal_based:
+                self.journal.append("points", points=self.player.points,
+                                    clicks=self.shop.clicks,
+                                    buffs=self.shop.buffs.to_dict())
+        if self.autosave.tick(dt):
+            self._on_main(self.save_game)
+        elif (self.journal.size >= JOURNAL_COMPACT_BYTES
+              and not self._compact_pending):
+            # One snapshot; the journal stays large until it is written.
+            self._compact_pending = True
+            self._on_main(self.save_game)
 
     def load_game(self):
+        """Load the current slot; return False if it holds nothing."""
+        self.autosave.flush()
         data = self.save_manager.load()
         if not data:
-            return
-        self.player = PlayerState.from_dict(data.get("player", {}))
-        self.shop.from_dict(data.get("shop", {}), self.physics)
+            if not self.journal.read():
+                return False
+            data = {}
+        seq = data.get("journal_seq", 0)
+        fresh, records = after_new_game(self.journal.read(seq))
+        if fresh or not data:
+            self.player = PlayerState()
+            self.shop.player = self.player
+            self.shop.reset_progress()
+            self.stats.clear()
+        else:
+            self.player = PlayerState.from_dict(data["player"])
+            self.shop.player = self.player
+            self.shop.from_dict(data["shop"], self.physics)
+            self._load_stats(data.get("stats"))
         self.shop.player = self.player
         self.clickable.player = self.player
+        self.journal.reset(seq)
+        replay(records, self.player, self.shop)
+        self._journal_based = True
         self.unsaved_changes = False
+        return True
+
+    def _load_stats(self, stats_data):
+        """Restore the stats history from save data, if it has any."""
+        self.stats.clear()
+        if stats_data is None:
+            return
+        try:
+            self.stats.from_dict(stats_data)
+        except Exception as e:
+            print("Stats load error:", e)
+            self.stats.clear()
 
     def quit_game(self):
+        if self.sim is not None:
+            self.sim.stop()
+            self.sim.run_deferred()
+        self.stop_capture()
         if self.unsaved_changes:
-            self.save_manager.save(self.player, self.shop)
+            self.save_game()
+        self.autosave.stop()
+        self.journal.close()
+        self.assets.flush()
         self.running = False
 
     def handle_events(self):
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self.state == "RUNNING":
+            try:
+                hits, pos, events = self.clickable.count_hits(events)
+                if hits:
+                    self.clickable.apply_hits(hits, pos)
+                    self.sounds.play("click", hits)
+            except Exception as e:
+                print("Clickable handler error:", e)
+        for event in events:
             try:
                 if event.type == pygame.QUIT:
                     self.quit_game()
+                elif event.type == pygame.VIDEORESIZE:
+                    self.on_resize(event.size)
+                elif (event.type == pygame.KEYDOWN
+                      and event.key == pygame.K_F11):
+                    self.toggle_fullscreen()
+                elif (event.type == pygame.KEYDOWN
+                      and event.key == pygame.K_F12):
+                    self.toggle_capture()
+                elif event.type in (pygame.WINDOWMINIMIZED,
+                                    pygame.WINDOWHIDDEN):
+                    self._set_window_state(minimized=True)
+                elif event.type in (pygame.WINDOWRESTORED,
+                                    pygame.WINDOWMAXIMIZED,
+                                    pygame.WINDOWSHOWN):
+                    self._set_window_state(minimized=False)
+                elif event.type == pygame.WINDOWFOCUSLOST:
+                    self._set_window_state(focused=False)
+                elif event.type == pygame.WINDOWFOCUSGAINED:
+                    self._set_window_state(focused=True)
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self._needs_redraw = True
                 try:
                     self.ui.handle_event(event)
                 except Exception as e:
@@ -211,288 +562,311 @@ class Game:
             except Exception as e:
                 print("Unexpected error processing event:", e)
 
+    def _simulate(self, dt):
+        """Advance economy, physics and shop; the simulation half of a frame.
+
+        Runs on the simulation thread when SIM_THREAD is set.
+        """
+        try:
+            self.shop.advance(dt)
+        except Exception as e:
+            print("Error computing production:", e)
+        self._roll_buff(dt)
+        accepted = self.clickable.stats.total_accepted
+        if accepted != self._clicks_seen:
+            self.shop.count_clicks(accepted - self._clicks_seen)
+            self._clicks_seen = accepted
+        try:
+            self.physics.update(dt, self.shop.ball_entities)
+            self._on_main(self.sounds.play, "bounce", self.physics.bounces)
+        except Exception as e:
+            print("Physics update error:", e)
+        try:
+            self.shop.update(dt)
+        except Exception as e:
+            print("Shop update error:", e)
+        self.unsaved_changes = True
+        self._update_journal(dt)
+
+    def _catch_up(self, dt):
+        """Credit dt seconds of production without simulating physics.
+
+        Production is constant between purchases, so one analytic step
+        per background frame is exact; the balls simply hold still.
+        """
+        if dt <= 0.0:
+            return
+        try:
+            self.shop.advance(dt)
+        except Exception as e:
+            print("Error computing production:", e)
+        # Buffs keep rolling while away, like production.
+        self._roll_buff(dt)
+        self.unsaved_changes = True
+        self._update_journal(dt)
+
+    def _roll_buff(self, dt):
+        """Start a random buff every BUFF_MEAN_INTERVAL s on average."""
+        if (not BUFF_MEAN_INTERVAL
+                or random.random() >= dt / BUFF_MEAN_INTERVAL):
+            return
+        name = random.choice(list(BUFFS))
+        target = None
+        if BUFFS[name][0] == "building":
+            owned = [bid for bid, b in self.shop.buildings.items() if b.count]
+            if not owned:
+                return
+            target = random.choice(owned)
+        self.shop.start_buff(name, target)
+        self._on_main(self.sounds.play, "purchase")
+
     def update(self, dt):
-        if self.state == "RUNNING":
-            try:
-                produced = self.shop.total_production_per_second() * dt
-                self.player.points += produced * self.player.global_multiplier
-            except Exception as e:
-                print("Error computing production:", e)
-            try:
-                self.physics.update(dt, self.shop.ball_entities)
-            except Exception as e:
-                print("Physics update error:", e)
-            try:
-                self.shop.update(dt)
-            except Exception as e:
-                print("Shop update error:", e)
-            self.unsaved_changes = True 
+        if self.sim is not None:
+            self.sim.run_deferred()
+        if self.state == "RUNNING" and self.backgrounded:
+            self._catch_up(dt)
+        elif self.state == "RUNNING":
+            if self._catch_up_pending:
+                # The first frame back may span a whole background
+                # frame: credit that analytically, simulate one step.
+                step = min(dt, 1.0 / FRAME_RATE)
+                self._catch_up(dt - step)
+                dt = step
+                self._catch_up_pending = False
+                self._resume_simulation()
+            if self.sim is None:
+                self._simulate(dt)
             try:
                 self.clickable.update(dt)
             except Exception as e:
                 print("Clickable update error:", e)
+            self.particles.update(dt)
+            if self._banner is not None:
+                self._banner_time -= dt
+                if self._banner_time <= 0.0:
+                    self._banner = None
+            points, income, _ = self._displayed_values()
+            self.stats.tick(dt, points, income, self.clickable.stats.rate)
         self.ui.update(dt)
+        self.sounds.end_frame(dt)
 
     def _draw_background(self):
         """Draw background image or green court."""
-        if not hasattr(self, "background"):
-            try:
-                img = pygame.image.load("assets/background.png")
-                try:
-                    self.background = img.convert_alpha()
-                except Exception:
-                    self.background = img.convert()
-            except Exception:
-                self.background = None
-
         if self.background:
-            bg = pygame.transform.scale(self.background, 
-                                        self.screen.get_size())
-            self.screen.blit(bg, (0, 0))
+            self.screen.blit(self.background, (0, 0))
         else:
             self.screen.fill((20, 110, 20))
 
-    def load_ball_img_map(self):
-        if not hasattr(self, "_ball_img_map"):
-            self._ball_img_map = {}
-            for i in range(1, 7):
-                filename = (
-                    "assets/ball.png"
-                    ) if i == 1 else f"assets/ball-{i}.png"
-                try:
-                    img = pygame.image.load(filename)
-                    try:
-                        self._ball_img_map[i] = img.convert_alpha()
-                    except Exception:
-                        self._ball_img_map[i] = img.convert()
-                except Exception:
-                    self._ball_img_map[i] = None
-
-    def load_ball_hover_img_map(self):
-        if not hasattr(self, "_ball_hover_img_map"):
-            self._ball_hover_img_map = {}
-            for i in range(1, 7):
-                hfile = (
-                    "assets/ball-hover.png"
-                    ) if i == 1 else f"assets/ball-{i}-hover.png"
-                try:
-                    himg = pygame.image.load(hfile)
-                    try:
-                        self._ball_hover_img_map[i] = himg.convert_alpha()
-                    except Exception:
-                        self._ball_hover_img_map[i] = himg.convert()
-                except Exception:
-                    self._ball_hover_img_map[i] = None
-
-    def try_pause_btn(self):
-        try:
-            pause_btn = self.ui.buttons.get("pause")
-            if pause_btn is not None and not hasattr(pause_btn, "_img"):
-                pimg = pygame.image.load("assets/pause-btn.png")
-                pause_btn._img = pimg.convert_alpha()
-                try:
-                    pause_btn._img_hover = pause_btn._img
-                except Exception:
-                    pause_btn._img_hover = None
-                try:
-                    if pause_btn._img:
-                        w, h = pause_btn._img.get_size()
-                        pause_btn.rect.width = w
-                        pause_btn.rect.height = h
-                        pause_btn.rect.topleft = (20, 20)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-    def _load_ball_images(self):
-        """Load ball images (cached on first call)."""
-        self.load_ball_img_map()
-        self.load_ball_hover_img_map()
-
-        if not hasattr(self, "_ball_scaled_cache"):
-            self._ball_scaled_cache = {}
-        
-        self.try_pause_btn()
+    def _displayed_values(self):
+        """(points, income per second, click power) to show this frame."""
+        snap = self.sim.snapshot if self.sim is not None else None
+        if snap is not None and self.state == "RUNNING":
+            return snap.points, snap.income, snap.click_power
+        return (self.player.points, self.shop.income_per_second(),
+                self.player.click_power)
+
+    def _displayed_buffs(self):
+        """(name, target, seconds left) of the buffs to show this frame."""
+        snap = self.sim.snapshot if self.sim is not None else None
+        if snap is not None and self.state == "RUNNING":
+            return snap.buffs
+        return self.shop.buffs.active()
+
+    def _draw_buffs(self, font, x, y):
+        """List the active buffs and their remaining time from (x, y)."""
+        for name, target, left in self._displayed_buffs():
+            _, factor, _, label = BUFFS[name]
+            if target is not None:
+                label = f"{label} {self.shop.buildings[target].name}"
+            txt = font.render(f"{label} x{factor:g}  {int(left) + 1}s",
+                              True, (255, 220, 100))
+            self.screen.blit(txt, (x - txt.get_width() // 2, y))
+            y += txt.get_height() + self.layout.px(2)
+
+    def _draw_snapshot_balls(self, snap):
+        """Blit the balls of a simulation snapshot."""
+        cache = self._ball_scaled_cache
+        px = self.layout.px
+        s = self.layout.scale
+        blit = self.screen.blit
+        for x, y, radius, type_id in zip(snap.xs, snap.ys, snap.radii,
+                                         snap.types):
+            d = px(radius * 2)
+            x, y = int(x * s), int(y * s)
+            name = self._ball_sprite_name(type_id or 1)
+            surf = cache.get((name, d), False)
+            if surf is False:
+                surf = cache[(name, d)] = self.assets.scaled(name, (d, d))
+            if surf is None:
+                pygame.draw.circle(self.screen, (255, 225, 25), (x, y),
+                                   d // 2)
+                continue
+            blit(surf, (x - d // 2, y - d // 2))
+
+    def _draw_balls(self):
+        """Blit every ball with its type's pre-scaled sprite."""
+        snap = self.sim.snapshot if self.sim is not None else None
+        if snap is not None and self.state == "RUNNING":
+            self._draw_snapshot_balls(snap)
+            return
+        cache = self._ball_scaled_cache
+        px = self.layout.px
+        s = self.layout.scale
+        blit = self.screen.blit
+        for ball in self.shop.ball_entities:
+            d = px(ball.radius * 2)
+            x, y = int(ball.x * s), int(ball.y * s)
+            name = self._ball_sprite_name(ball.type_id or 1)
+            key = (name, d)
+            surf = cache.get(key, False)
+            if surf is False:
+                surf = cache[key] = self.assets.scaled(name, (d, d))
+            if surf is None:
+                ball.draw(self.screen, (x, y), d // 2)
+                continue
+            blit(surf, (x - d // 2, y - d // 2))
 
     def _render_running_state(self):
         """Render game during RUNNING state: balls, shop, clickable, points."""
-        self._load_ball_images()
-
-        for ball in self.shop.ball_entities:
-            pos = None
-            if hasattr(ball, "rect"):
-                rect = ball.rect
-                pos = (rect.centerx, rect.centery)
-            elif hasattr(ball, "pos"):
-                p = ball.pos
-                if isinstance(p, (tuple, list)) and len(p) >= 2:
-                    pos = (int(p[0]), int(p[1]))
-                elif hasattr(p, "x") and hasattr(p, "y"):
-                    pos = (int(p.x), int(p.y))
-            elif hasattr(ball, "x") and hasattr(ball, "y"):
-                pos = (int(ball.x), int(ball.y))
-
-            size = None
-            if hasattr(ball, "radius"):
-                r = getattr(ball, "radius")
-                try:
-                    size = (int(r * 2), int(r * 2))
-                except Exception:
-                    size = None
-            elif hasattr(ball, "rect"):
-                rect = ball.rect
-                size = (rect.width, rect.height)
-            elif hasattr(ball, "size"):
-                s = ball.size
-                try:
-                    size = (int(s), int(s))
-                except Exception:
-                    size = None
-
-            hovered = False
-            if hasattr(ball, "hovered"):
-                hovered = bool(ball.hovered)
-            elif hasattr(ball, "is_hovered"):
-                try:
-                    hovered = bool(ball.is_hovered())
-                except Exception:
-                    hovered = False
-
-            img = None
-            if hasattr(ball, "img") and ball.img:
-                img = ball.img
-            else:
-                type_id = getattr(ball, "type_id", None)
-                if type_id is None:
-                    type_id = None
-                if type_id and hasattr(self, "_ball_img_map"):
-                    img = self._ball_img_map.get(type_id)
-                else:
-                    img = next(
-                        iter(self._ball_img_map.values())
-                        ) if hasattr(self, "_ball_img_map") else None
-
-            if hovered:
-                hover_img = None
-                if hasattr(ball, "img_hover") and ball.img_hover:
-                    hover_img = ball.img_hover
-                elif hasattr(self, "_ball_hover_img_map") and type_id:
-                    hover_img = self._ball_hover_img_map.get(type_id)
-                if hover_img:
-                    img = hover_img
-
-            if img and pos:
-                surf = img
-                if size:
-                    key = (id(img), size[0], size[1])
-                    if key not in self._ball_scaled_cache:
-                        try:
-                            self._ball_scaled_cache[key] = (
-                                pygame.transform.smoothscale(img, size)
-                                )
-                        except Exception:
-                            try:
-                                self._ball_scaled_cache[key] = (
-                                    pygame.transform.scale(img, size)
-                                    )
-                            except Exception:
-                                self._ball_scaled_cache[key] = img
-                    surf = self._ball_scaled_cache[key]
-                rect = surf.get_rect(center=pos)
-                self.screen.blit(surf, rect)
-            else:
-                try:
-                    ball.draw(self.screen)
-                except Exception:
-                    pass
-
+        self._draw_balls()
 
         self.shop.draw(self.screen)
 
-        try:
-            if hasattr(self, "_ball_img_map"):
-                first_img = None
-                for v in self._ball_img_map.values():
-                    if v is not None:
-                        first_img = v
-                        break
-                if first_img is not None:
-                    self.clickable._ball_img = first_img
-                if hasattr(self, "_ball_hover_img_map"):
-                    first_hover = None
-                    for v in self._ball_hover_img_map.values():
-                        if v is not None:
-                            first_hover = v
-                            break
-                    if first_hover is not None:
-                        self.clickable._ball_hover_img = first_hover
-        except Exception:
-            pass
-
-
         try:
             self.clickable.draw(self.screen)
         except Exception as e:
             print("Clickable draw error:", e)
 
-        font_small = pygame.font.SysFont(None, 24)
+        self.particles.draw(self.screen)
+
+        points, income, click_power = self._displayed_values()
+        font_small = self.assets.font(self.layout.px(24))
         click_power_txt = font_small.render(
-            f"Click power: {self.player.click_power}", 
+            f"Click power: {click_power}", 
             True, 
             (255,255,255)
             )
         ball_y = self.clickable.y + int(
-            self.clickable.radius * self.clickable.scale
-            ) + 20
+            self.clickable.hit_radius() * self.clickable.scale
+            ) + self.layout.px(20)
         self.screen.blit(
             click_power_txt, 
             (self.clickable.x - click_power_txt.get_width() // 2, 
             ball_y)
             )
 
-        font = pygame.font.SysFont(None, 36)
-        points_bg = pygame.image.load("assets/points.png").convert_alpha()
+        font = self.assets.font(self.layout.px(36))
+        points_rect = self.layout.rect("points")
         txt = font.render(
-            f"{int(self.player.points)}", True, (255,255,255)
+            f"{int(points)}", True, (255,255,255)
+            )
+        if self._points_bg:
+            self.screen.blit(self._points_bg, points_rect)
+        self.screen.blit(txt, (points_rect.x + self.layout.px(30),
+                               points_rect.y + self.layout.px(35)))
+        rate_txt = font_small.render(
+            f"{income:.1f} /s", True, (255,255,255)
             )
-        self.screen.blit(points_bg, (510, 20))
-        self.screen.blit(txt, (540, 55))
+        self.screen.blit(
+            rate_txt,
+            (points_rect.centerx - rate_txt.get_width() // 2,
+             points_rect.bottom + self.layout.px(4))
+            )
+        self._draw_buffs(font_small, points_rect.centerx,
+                         points_rect.bottom + rate_txt.get_height()
+                         + self.layout.px(8))
+        if self._banner is not None:
+            banner = font.render(self._banner, True, (255, 220, 100))
+            self.screen.blit(
+                banner,
+                (self.screen.get_width() // 2 - banner.get_width() // 2,
+                 self.screen.get_height() - self.layout.px(70))
+                )
 
     def _render_menu_state(self):
         """Render menu state: background with darkening overlay."""
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
 
     def _render_credits_state(self):
         """Render credits state: background and credits text."""
-        overlay = pygame.Surface(self.screen.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._overlay, (0, 0))
         
-        font = pygame.font.SysFont(None, 36)
+        font = self.assets.font(self.layout.px(36))
         title = font.render("Credits", True, (255,255,255))
         self.screen.blit(
             title, 
-            (self.screen.get_width() // 2 - title.get_width() // 2, 50)
+            (self.screen.get_width() // 2 - title.get_width() // 2,
+             self.layout.px(50))
             )
 
         credits_text = (
             "Tennis Clicker\nDeveloped by Cécile Baslé and Iouri Martin with "
             "Pygame"
             )
-        small_font = pygame.font.SysFont(None, 24)
-        y = 150
+        small_font = self.assets.font(self.layout.px(24))
+        y = self.layout.px(150)
         for line in credits_text.split("\n"):
             txt = small_font.render(line, True, (255,255,255))
             self.screen.blit(
                 txt, 
                 (self.screen.get_width() // 2 - txt.get_width() // 2, y)
                 )
-            y += 40
+            y += self.layout.px(40)
+
+    def _render_slots_state(self):
+        """Render slot picker state: background and title."""
+        self.screen.blit(self._overlay, (0, 0))
+
+        font = self.assets.font(self.layout.px(36))
+        title = font.render("Choose a save slot", True, (255,255,255))
+        self.screen.blit(
+            title,
+            (self.screen.get_width() // 2 - title.get_width() // 2,
+             self.layout.px(150))
+            )
+
+    def _render_stats_state(self):
+        """Render the stats screen: one min/max graph per series.
+
+        The graphs are redrawn only when a new sample arrives or the
+        window is resized.
+        """
+        self.screen.blit(self._overlay, (0, 0))
+        area = self.layout.rect("graphs")
+        key = (self.stats.version, area.size)
+        if key != self._stats_key:
+            self._stats_surface = self._draw_stats_graphs(area.size)
+            self._stats_key = key
+        self.screen.blit(self._stats_surface, area)
+
+    def _draw_stats_graphs(self, size):
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        font = self.assets.font(self.layout.px(24))
+        gap = self.layout.px(12)
+        count = len(STATS_GRAPHS)
+        graph_h = (size[1] - gap * (count - 1)) // count
+        for n, (name, label, color) in enumerate(STATS_GRAPHS):
+            rect = pygame.Rect(0, n * (graph_h + gap), size[0], graph_h)
+            pygame.draw.rect(surf, (30, 30, 30, 200), rect,
+                             border_radius=8)
+            columns = self.stats.downsample(name, rect.width)
+            latest = self.stats.latest(name)
+            title = label if latest is None else f"{label}: {latest:.1f}"
+            surf.blit(font.render(title, True, (255,255,255)),
+                      (rect.x + gap, rect.y + gap // 2))
+            if not columns:
+                continue
+            lo = min(c[0] for c in columns)
+            hi = max(c[1] for c in columns)
+            span = (hi - lo) or 1.0
+            top = rect.y + font.get_height() + gap
+            height = rect.bottom - gap // 2 - top
+            x0 = rect.right - len(columns)
+            for x, (cmin, cmax) in enumerate(columns, x0):
+                y1 = top + height - int((cmin - lo) / span * height)
+                y2 = top + height - int((cmax - lo) / span * height)
+                pygame.draw.line(surf, color, (x, y1), (x, y2))
+        return surf
 
     def render(self):
         """Main render method: 
@@ -507,7 +881,14 @@ class Game:
             self._render_menu_state()
         elif self.state == "CREDITS":
             self._render_credits_state()
+        elif self.state == "SLOTS":
+            self._render_slots_state()
+        elif self.state == "STATS":
+            self._render_stats_state()
 
         self.ui.draw(self.screen, self.player)
 
-        pygame.display.flip()
\ No newline at end of file
+        if self.capture is not None:
+            self.capture.capture(self.screen)
+        pygame.display.flip()
+        self._needs_redraw = False
\ No newline at end of file
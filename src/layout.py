@@ -0,0 +1,71 @@
+import pygame
+
+DESIGN_WIDTH = 1280
+DESIGN_HEIGHT = 720
+
+# name -> (anchor, (dx, dy), (w, h)) in design pixels. The anchor is a
+# pygame.Rect point name used both on the window and on the element, so
+# ("topright", (-30, 0), ...) keeps an element 30 px from the right edge.
+# A size of None fills the window.
+ANCHORS = {
+    "playfield": ("topleft", (0, 0), None),
+    "shop": ("topright", (-30, 0), (350, 700)),
+    "points": ("midtop", (0, 20), (260, 85)),
+    "clickable": ("center", (0, 0), (220, 220)),
+    "start": ("midtop", (0, 150), (200, 60)),
+    "save": ("midtop", (0, 250), (140, 40)),
+    "load": ("midtop", (0, 320), (140, 40)),
+    "credits": ("midtop", (0, 390), (140, 40)),
+    "quit": ("midtop", (0, 460), (140, 40)),
+    "stats": ("midtop", (0, 530), (140, 40)),
+    "graphs": ("center", (0, 30), (1000, 560)),
+    "pause": ("topleft", (20, 20), (75, 75)),
+    "back": ("topleft", (10, 10), (140, 40)),
+}
+
+
+class Layout:
+    """Anchored screen rects for the current window size.
+
+    Rects are computed once per resize from design-resolution specs,
+    scaled uniformly so the 1280x720 layout fits the window.
+    """
+
+    def __init__(self, size, anchors=None):
+        self.specs = dict(ANCHORS if anchors is None else anchors)
+        self.rects = {}
+        self.resize(size)
+
+    def add(self, name, anchor, offset, size):
+        """Register another anchored element and place it."""
+        self.specs[name] = (anchor, offset, size)
+        self.rects[name] = self._place(anchor, offset, size)
+
+    def resize(self, size):
+        """Recompute every rect for a window of the given size."""
+        self.width, self.height = int(size[0]), int(size[1])
+        self.window = pygame.Rect(0, 0, self.width, self.height)
+        self.scale = min(self.width / DESIGN_WIDTH,
+                         self.height / DESIGN_HEIGHT)
+        self.rects = {
+            name: self._place(*spec) for name, spec in self.specs.items()
+        }
+
+    def px(self, value):
+        """Scale a design-pixel length to the window (at least 1)."""
+        return max(1, int(round(value * self.scale)))
+
+    def rect(self, name):
+        return self.rects[name].copy()
+
+    def __contains__(self, name):
+        return name in self.rects
+
+    def _place(self, anchor, offset, size):
+        if size is None:
+            return self.window.copy()
+        rect = pygame.Rect(0, 0, self.px(size[0]), self.px(size[1]))
+        x, y = getattr(self.window, anchor)
+        setattr(rect, anchor, (x + round(offset[0] * self.scale),
+                               y + round(offset[1] * self.scale)))
+        return rect
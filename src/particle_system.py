@@ -0,0 +1,253 @@
+import math
+import random
+from array import array
+
+import pygame
+
+GLYPHS = "+0123456789.kMBT"
+GLYPH_INDEX = {ch: i for i, ch in enumerate(GLYPHS)}
+MAX_GLYPHS = 8
+FADE_STEPS = 6
+SPARK_DIRECTIONS = 16
+
+KIND_TEXT = 0
+KIND_SPARK = 1
+
+DROP_NEWEST = "drop_newest"
+REPLACE_OLDEST = "replace_oldest"
+
+_SUFFIXES = (
+    (1e12, GLYPH_INDEX["T"]),
+    (1e9, GLYPH_INDEX["B"]),
+    (1e6, GLYPH_INDEX["M"]),
+    (1e4, GLYPH_INDEX["k"]),
+)
+
+
+class ParticleSystem:
+    """Fixed-capacity particle pool for floating numbers and bursts.
+
+    All particle state lives in flat arrays allocated once, and every
+    glyph and spark sprite is rendered up front (one copy per fade
+    step), so emitting a particle never creates a Surface or object.
+    """
+
+    def __init__(self, capacity=512, drop_policy=REPLACE_OLDEST,
+                 font_size=30, text_color=(255, 220, 100),
+                 spark_color=(255, 240, 160)):
+        if drop_policy not in (DROP_NEWEST, REPLACE_OLDEST):
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.capacity = capacity
+        self.drop_policy = drop_policy
+        self.dropped = 0
+
+        self.x = array("f", [0.0]) * capacity
+        self.y = array("f", [0.0]) * capacity
+        self.vx = array("f", [0.0]) * capacity
+        self.vy = array("f", [0.0]) * capacity
+        self.life = array("f", [0.0]) * capacity
+        self.max_life = array("f", [1.0]) * capacity
+        self.kind = array("b", [KIND_TEXT]) * capacity
+        self.glyph_len = array("B", [0]) * capacity
+        self.glyphs = array("b", [0]) * (capacity * MAX_GLYPHS)
+        self.alive = 0
+        self._cursor = 0
+        self._blits = []
+
+        self._dir_x = array("f", [
+            math.cos(2 * math.pi * k / SPARK_DIRECTIONS)
+            for k in range(SPARK_DIRECTIONS)
+        ])
+        self._dir_y = array("f", [
+            math.sin(2 * math.pi * k / SPARK_DIRECTIONS)
+            for k in range(SPARK_DIRECTIONS)
+        ])
+
+        self._init_sprites(font_size, text_color, spark_color)
+
+    def _init_sprites(self, font_size, text_color, spark_color):
+        """Pre-render glyph and spark sprites for every fade step."""
+        font = pygame.font.SysFont(None, font_size)
+        base_glyphs = [font.render(ch, True, text_color) for ch in GLYPHS]
+        self.glyph_widths = array("B", [g.get_width() for g in base_glyphs])
+        self.glyph_height = base_glyphs[0].get_height()
+
+        spark = pygame.Surface((6, 6), pygame.SRCALPHA)
+        pygame.draw.circle(spark, spark_color, (3, 3), 3)
+
+        self.glyph_sprites = []
+        self.spark_sprites = []
+        for step in range(FADE_STEPS):
+            alpha = int(255 * (step + 1) / FADE_STEPS)
+            faded = []
+            for g in base_glyphs:
+                s = g.copy()
+                s.set_alpha(alpha)
+                faded.append(s)
+            self.glyph_sprites.append(faded)
+            s = spark.copy()
+            s.set_alpha(alpha)
+            self.spark_sprites.append(s)
+
+    def _acquire(self):
+        """Return a free slot index, or -1 if the pool drops the emit."""
+        cap = self.capacity
+        life = self.life
+        if self.alive >= cap:
+            if self.drop_policy == DROP_NEWEST:
+                self.dropped += 1
+                return -1
+            i = self._cursor
+            self._cursor = (i + 1) % cap
+            self.dropped += 1
+            return i
+        i = self._cursor
+        while life[i] > 0.0:
+            i = (i + 1) % cap
+        self._cursor = (i + 1) % cap
+        self.alive += 1
+        return i
+
+    def emit_text(self, x, y, value, life=0.9):
+        """Spawn a floating "+N" number at (x, y)."""
+        i = self._acquire()
+        if i < 0:
+            return
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = 0.0
+        self.vy[i] = -70.0
+        self.life[i] = life
+        self.max_life[i] = life
+        self.kind[i] = KIND_TEXT
+        self._encode_value(i, value)
+
+    def emit_burst(self, x, y, count=6, speed=160.0, life=0.5):
+        """Spawn count sparks flying outward from (x, y)."""
+        dx = self._dir_x
+        dy = self._dir_y
+        offset = random.randrange(SPARK_DIRECTIONS)
+        step = max(1, SPARK_DIRECTIONS // max(1, count))
+        for k in range(count):
+            i = self._acquire()
+            if i < 0:
+                return
+            d = (offset + k * step) % SPARK_DIRECTIONS
+            s = speed * (0.6 + 0.4 * random.random())
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = dx[d] * s
+            self.vy[i] = dy[d] * s
+            self.life[i] = life
+            self.max_life[i] = life
+            self.kind[i] = KIND_SPARK
+
+    def _encode_value(self, i, value):
+        """Write "+value" as glyph indices into slot i without strings."""
+        glyphs = self.glyphs
+        base = i * MAX_GLYPHS
+        suffix = -1
+        for div, g in _SUFFIXES:
+            if value >= div:
+                value = value / (div if div != 1e4 else 1e3)
+                suffix = g
+                break
+        n = int(value)
+        tenths = -1
+        if n < 10 and value != n:
+            # Round to tenths before splitting, carrying 9.96 to 10.
+            n, tenths = divmod(int(round(value * 10)), 10)
+            if tenths == 0:
+                tenths = -1
+        room = MAX_GLYPHS - 1 - (suffix >= 0)
+        if n >= 10 ** room:
+            n = 10 ** room - 1
+
+        pos = MAX_GLYPHS
+        if suffix >= 0:
+            pos -= 1
+            glyphs[base + pos] = suffix
+        if tenths >= 0:
+            pos -= 1
+            glyphs[base + pos] = GLYPH_INDEX["0"] + tenths
+            pos -= 1
+            glyphs[base + pos] = GLYPH_INDEX["."]
+        while True:
+            pos -= 1
+            glyphs[base + pos] = GLYPH_INDEX["0"] + n % 10
+            n //= 10
+            if n == 0:
+                break
+        pos -= 1
+        glyphs[base + pos] = GLYPH_INDEX["+"]
+
+        length = MAX_GLYPHS - pos
+        for k in range(length):
+            glyphs[base + k] = glyphs[base + pos + k]
+        self.glyph_len[i] = length
+
+    def clear(self):
+        """Kill every particle."""
+        for i in range(self.capacity):
+            self.life[i] = 0.0
+        self.alive = 0
+
+    def update(self, dt):
+        """Advance all live particles and retire expired ones."""
+        if self.alive == 0:
+            return
+        x, y, vx, vy = self.x, self.y, self.vx, self.vy
+        life, kind = self.life, self.kind
+        gravity = 300.0 * dt
+        alive = 0
+        for i in range(self.capacity):
+            t = life[i]
+            if t <= 0.0:
+                continue
+            t -= dt
+            if t <= 0.0:
+                life[i] = 0.0
+                continue
+            life[i] = t
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            if kind[i] == KIND_SPARK:
+                vy[i] += gravity
+            alive += 1
+        self.alive = alive
+
+    def draw(self, screen):
+        """Draw all live particles with a single batched blit."""
+        if self.alive == 0:
+            return
+        blits = self._blits
+        blits.clear()
+        x, y, life, max_life = self.x, self.y, self.life, self.max_life
+        kind, glyph_len, glyphs = self.kind, self.glyph_len, self.glyphs
+        widths = self.glyph_widths
+        half_h = self.glyph_height // 2
+        last_step = FADE_STEPS - 1
+        for i in range(self.capacity):
+            t = life[i]
+            if t <= 0.0:
+                continue
+            step = int(t / max_life[i] * FADE_STEPS)
+            if step > last_step:
+                step = last_step
+            if kind[i] == KIND_SPARK:
+                blits.append((self.spark_sprites[step],
+                              (int(x[i]) - 3, int(y[i]) - 3)))
+                continue
+            sprites = self.glyph_sprites[step]
+            base = i * MAX_GLYPHS
+            n = glyph_len[i]
+            total_w = 0
+            for k in range(n):
+                total_w += widths[glyphs[base + k]]
+            gx = int(x[i]) - total_w // 2
+            gy = int(y[i]) - half_h
+            for k in range(n):
+                g = glyphs[base + k]
+                blits.append((sprites[g], (gx, gy)))
+                gx += widths[g]
+        screen.blits(blits, doreturn=False)
@@ -2,7 +2,13 @@ import pygame
 class PhysicsManager:
     def __init__(self):
         self.screen_rect = pygame.Rect(0,0,1280,720)
+        self.bounces = 0
 
     def update(self, dt, ball_entities):
+        """Move every ball and count this frame's wall bounces."""
+        rect = self.screen_rect
+        bounces = 0
         for b in ball_entities:
-            b.update(dt, self.screen_rect)
\ No newline at end of file
+            if b.update(dt, rect):
+                bounces += 1
+        self.bounces = bounces
@@ -1,6 +1,7 @@
 class PlayerState:
     def __init__(self):
         self.points = 0.0
+        self.base_click_power = 1.0
         self.click_power = 1.0
         self.global_multiplier = 1.0
         self.purchased_upgrades = []
@@ -8,16 +9,18 @@ class PlayerState:
     def to_dict(self):
         return {
             "points": self.points,
-            "click_power": self.click_power,
+            "base_click_power": self.base_click_power,
             "global_multiplier": self.global_multiplier,
-            "purchased_upgrades": self.purchased_upgrades
+            "purchased_upgrades": list(self.purchased_upgrades)
         }
 
     @classmethod
     def from_dict(cls, d):
+        """Build from validated (current schema) player data."""
         p = cls()
-        p.points = d.get("points", 0.0)
-        p.click_power = d.get("click_power", 1.0)
-        p.global_multiplier = d.get("global_multiplier", 1.0)
-        p.purchased_upgrades = d.get("purchased_upgrades", [])
+        p.points = d["points"]
+        p.base_click_power = d["base_click_power"]
+        p.click_power = p.base_click_power
+        p.global_multiplier = d["global_multiplier"]
+        p.purchased_upgrades = list(d["purchased_upgrades"])
         return p
\ No newline at end of file
@@ -0,0 +1,42 @@
+import argparse
+import sys
+
+from save_manager import SaveManager
+
+
+def convert(src, dst, fmt, compress=True):
+    """Convert a save file (JSON or binary) into the given format.
+
+    The source is migrated in memory only; it is never rewritten.
+    """
+    data = SaveManager(src).load(rewrite=False)
+    if data is None:
+        raise FileNotFoundError(src)
+    out = SaveManager(dst, fmt=fmt, compress=compress)
+    out.write(data)
+    return out.path.stat().st_size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert Tennis Clicker saves between JSON and binary."
+    )
+    parser.add_argument("src", help="save file to read (any format)")
+    parser.add_argument("dst", help="save file to write")
+    parser.add_argument("--to", choices=["json", "binary"], default="binary",
+                        help="output format (default: binary)")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="do not zlib-compress binary output")
+    args = parser.parse_args(argv)
+    try:
+        size = convert(args.src, args.dst, args.to,
+                       compress=not args.no_compress)
+    except Exception as e:
+        print("Conversion failed:", e)
+        return 1
+    print(f"Wrote {args.dst} ({args.to}, {size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+from atomic_file import write_atomic
+
+
+class SaveJournal:
+    """Append-only log of purchases, buffs and point checkpoints.
+
+    Every record carries an increasing sequence number. A full save
+    stores the sequence it was taken at, and compact() then drops the
+    records it already covers, so recovery is "load the last snapshot,
+    replay the journal tail".
+    """
+
+    def __init__(self, path, fsync=True):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.seq = 0
+        self.size = 0
+        self._lock = threading.Lock()
+        for rec in self.read():
+            self.seq = max(self.seq, rec.get("seq", 0))
+        if self.path.exists():
+            self.size = self.path.stat().st_size
+        self._file = open(self.path, "ab")
+
+    def append(self, kind, **fields):
+        """Durably append one record and return its sequence number."""
+        with self._lock:
+            self.seq += 1
+            rec = {"seq": self.seq, "t": kind}
+            rec.update(fields)
+            line = json.dumps(rec, separators=(",", ":")).encode("utf-8")
+            self._file.write(line + b"\n")
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.size += len(line) + 1
+            return self.seq
+
+    def read(self, after_seq=0):
+        """Return the records with a sequence number above after_seq.
+
+        A torn last line (crash mid-append) is ignored.
+        """
+        records = []
+        if not self.path.exists():
+            return records
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if rec.get("seq", 0) > after_seq:
+                    records.append(rec)
+        return records
+
+    def reset(self, seq):
+        """Continue numbering from at least seq (after loading a save)."""
+        with self._lock:
+            self.seq = max(self.seq, seq)
+
+    def compact(self, upto_seq):
+        """Drop records already covered by a snapshot taken at upto_seq."""
+        with self._lock:
+            keep = [{"seq": upto_seq, "t": "base"}]
+            keep.extend(
+                r for r in self.read(upto_seq) if r.get("t") != "base"
+            )
+            payload = b"".join(
+                json.dumps(r, separators=(",", ":")).encode("utf-8") + b"\n"
+                for r in keep
+            )
+            # The append handle is reopened on the new file afterwards.
+            self._file.close()
+            try:
+                write_atomic(self.path, payload, durable=self.fsync)
+            finally:
+                self._file = open(self.path, "ab")
+            self.size = len(payload)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def _apply_price(player, rec):
+    """Set the points a purchase left; older records only have the price."""
+    if "points" in rec:
+        player.points = rec["points"]
+    else:
+        player.points -= rec["price"]
+
+
+def after_new_game(records):
+    """Split off the records before the last "new_game" record.
+
+    Returns (reset, tail): whether a new game replaced the snapshot
+    the records were written against, and the records to replay.
+    """
+    for i in range(len(records) - 1, -1, -1):
+        if records[i].get("t") == "new_game":
+            return True, records[i + 1:]
+    return False, records
+
+
+def replay(records, player, shop):
+    """Re-apply journal records on top of a freshly loaded snapshot."""
+    applied = 0
+    for rec in records:
+        kind = rec.get("t")
+        if kind == "points":
+            player.points = rec["points"]
+            if "clicks" in rec:
+                shop.clicks = rec["clicks"]
+            if "buffs" in rec:
+                shop.buffs.from_dict(rec["buffs"])
+        elif kind == "building":
+            b = shop.buildings.get(rec["id"])
+            if b is None:
+                continue
+            b.count += 1
+            _apply_price(player, rec)
+        elif kind == "upgrade":
+            for i, u in enumerate(shop.upgrade_list):
+                if u.id == rec["id"]:
+                    u.bought = True
+                    shop.current_upgrade_index = max(
+                        shop.current_upgrade_index, i + 1
+                    )
+                    _apply_price(player, rec)
+                    break
+            else:
+                continue
+        elif kind == "achievement":
+            shop.unlock_achievement(rec["id"])
+        elif kind == "buff":
+            try:
+                shop.buffs.start(rec["name"], rec.get("target"),
+                                 rec.get("duration"))
+            except (KeyError, ValueError) as e:
+                print("Buff replay error:", e)
+                continue
+        else:
+            continue
+        applied += 1
+    shop.recompute_upgrade_effects()
+    return applied
@@ -1,22 +1,124 @@
 import json
+import time
 from pathlib import Path
 
+import binary_save
+import save_schema
+from atomic_file import write_atomic
+
+FORMAT_SUFFIXES = {"json": ".json", "binary": ".sav"}
+BALL_MODES = ("full", "seeded")
+
 class SaveManager:
-    def __init__(self, path):
+    def __init__(self, path, fmt="json", compress=True, ball_mode="full",
+                 slot=None, index=None):
+        if fmt not in FORMAT_SUFFIXES:
+            raise ValueError(f"Unknown save format: {fmt}")
+        if ball_mode not in BALL_MODES:
+            raise ValueError(f"Unknown ball mode: {ball_mode}")
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt
+        self.compress = compress
+        self.ball_mode = ball_mode
+        self.slot = slot
+        self.index = index
+        self.last_save_duration = 0.0
 
-    def save(self, player_state, shop):
+    def snapshot(self, player_state, shop, stats=None):
+        """Capture the state to save as plain data (cheap, main thread).
+
+        In "seeded" ball mode only the ball seed and tick are kept, so
+        the save size does not grow with the number of balls. A
+        StatsHistory given as stats is stored as a compact buffer.
+        """
+        if self.ball_mode == "seeded":
+            shop_data = shop.to_dict(include_balls=False)
+        elif self.fmt == "binary":
+            shop_data = shop.to_dict(include_balls=False)
+            shop_data["balls"] = shop.ball_columns()
+        else:
+            shop_data = shop.to_dict()
         data = {
+            "version": save_schema.SCHEMA_VERSION,
             "player": player_state.to_dict(),
-            "shop": shop.to_dict()
+            "shop": shop_data,
+            "summary": {
+                "saved_at": time.time(),
+                "points": player_state.points,
+                "production_per_second": shop.total_production_per_second()
+            }
         }
-        with open(self.path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if stats is not None:
+            data["stats"] = stats.to_dict()
+        return data
+
+    def describe(self, data, size=None):
+        """Build the slot index entry for a save dict."""
+        summary = data.get("summary", {})
+        if size is None and self.path.exists():
+            size = self.path.stat().st_size
+        return {
+            "saved_at": summary.get("saved_at"),
+            "points": summary.get(
+                "points", data.get("player", {}).get("points", 0.0)
+            ),
+            "production_per_second": summary.get("production_per_second"),
+            "size": size,
+            "format": self.fmt,
+            "format_version": data.get("version", 1)
+        }
+
+    def encode(self, data):
+        """Serialize a save dict to bytes in this manager's format."""
+        if self.fmt == "binary":
+            return binary_save.encode(data, compress=self.compress)
+        shop = data.get("shop", {})
+        if isinstance(shop.get("balls"), dict):
+            shop = dict(shop)
+            shop["balls"] = binary_save.columns_to_balls(shop["balls"])
+            data = dict(data, shop=shop)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def decode(payload):
+        """Parse save bytes, detecting the binary or JSON format."""
+        if binary_save.is_binary(payload):
+            return binary_save.decode(payload)
+        return json.loads(payload.decode("utf-8"))
+
+    def write(self, data):
+        """Serialize data and atomically replace the save file.
+
+        Returns the time the serialization and write took, in seconds.
+        """
+        start = time.perf_counter()
+        payload = self.encode(data)
+        write_atomic(self.path, payload)
+        self.last_save_duration = time.perf_counter() - start
+        if self.index is not None:
+            self.index.update(self.slot, self.describe(data, len(payload)))
+        return self.last_save_duration
+
+    def save(self, player_state, shop):
+        return self.write(self.snapshot(player_state, shop))
+
+    def load(self, rewrite=True):
+        """Read, migrate and validate the save; None if there is none.
 
-    def load(self):
+        Saves from an older schema are upgraded once and, unless
+        rewrite is False, rewritten, so later loads take the
+        validation-only path.
+        """
         if not self.path.exists():
             return None
-        with open(self.path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
\ No newline at end of file
+        with open(self.path, "rb") as f:
+            payload = f.read()
+        data, migrated = save_schema.migrate(self.decode(payload))
+        save_schema.validate(data)
+        if migrated and rewrite:
+            try:
+                self.write(data)
+            except Exception as e:
+                print("Could not rewrite migrated save:", e)
+        return data
@@ -0,0 +1,155 @@
+SCHEMA_VERSION = 2
+
+MIGRATIONS = {}
+
+
+class SaveSchemaError(ValueError):
+    """Raised when save data does not match the current schema."""
+
+
+def migration(from_version):
+    """Register a function upgrading save data from from_version."""
+    def register(fn):
+        MIGRATIONS[from_version] = fn
+        return fn
+    return register
+
+
+def migrate(data):
+    """Upgrade data to SCHEMA_VERSION; return (data, migrated)."""
+    version = data.get("version", 1)
+    if version > SCHEMA_VERSION:
+        raise SaveSchemaError(
+            f"Save version {version} is newer than {SCHEMA_VERSION}"
+        )
+    migrated = False
+    while version < SCHEMA_VERSION:
+        step = MIGRATIONS.get(version)
+        if step is None:
+            raise SaveSchemaError(f"No migration from version {version}")
+        data = step(data)
+        version = data["version"]
+        migrated = True
+    return data, migrated
+
+
+@migration(1)
+def _v1_to_v2(data):
+    """Drop catalog copies from saves and store upgrades by id.
+
+    Version 1 duplicated building names, prices and production in every
+    save (and ignored them on load), restored upgrades by list position,
+    and saved click_power with upgrade multipliers already applied.
+    """
+    player = data.get("player", {})
+    shop = data.get("shop", {})
+
+    ups = shop.get("upgrade_list", [])
+    bought = [u["id"] for u in ups if u.get("bought") and "id" in u]
+    click_power = float(player.get("click_power", 1.0))
+
+    buildings = {}
+    for k, v in shop.get("buildings", {}).items():
+        buildings[str(k)] = int(v.get("count", 0))
+
+    new_shop = {
+        "buildings": buildings,
+        "upgrades": bought,
+        "current_upgrade_index": int(shop.get("current_upgrade_index", 0)),
+    }
+    for key in ("balls", "ball_seed", "ball_tick"):
+        if key in shop:
+            new_shop[key] = shop[key]
+
+    out = {
+        "version": 2,
+        "player": {
+            "points": float(player.get("points", 0.0)),
+            "base_click_power": click_power / (2.0 ** len(bought)),
+            "global_multiplier": float(player.get("global_multiplier", 1.0)),
+            "purchased_upgrades": list(player.get("purchased_upgrades", [])),
+        },
+        "shop": new_shop,
+    }
+    for key in ("summary", "journal_seq"):
+        if key in data:
+            out[key] = data[key]
+    return out
+
+
+_NUMBER = (int, float)
+
+# field name -> (accepted types, required)
+_TOP_FIELDS = {
+    "version": (int, True),
+    "player": (dict, True),
+    "shop": (dict, True),
+    "summary": (dict, False),
+    "journal_seq": (int, False),
+    "stats": (dict, False),
+}
+_PLAYER_FIELDS = {
+    "points": (_NUMBER, True),
+    "base_click_power": (_NUMBER, True),
+    "global_multiplier": (_NUMBER, True),
+    "purchased_upgrades": (list, True),
+}
+_SHOP_FIELDS = {
+    "buildings": (dict, True),
+    "upgrades": (list, True),
+    "current_upgrade_index": (int, True),
+    "balls": ((list, dict), False),
+    "ball_seed": (int, False),
+    "ball_tick": (int, False),
+    "buffs": (list, False),
+    "clicks": (int, False),
+    "achievements": (list, False),
+}
+_BUFF_FIELDS = {
+    "name": (str, True),
+    "remaining": (_NUMBER, True),
+    "target": ((int, type(None)), False),
+}
+_STATS_FIELDS = {
+    "interval": (_NUMBER, True),
+    "count": (int, True),
+    "data": (str, True),
+}
+
+
+def _check(section, fields, where):
+    for name, (types, required) in fields.items():
+        if name not in section:
+            if required:
+                raise SaveSchemaError(f"Missing {where}{name}")
+            continue
+        value = section[name]
+        if not isinstance(value, types) or isinstance(value, bool):
+            raise SaveSchemaError(f"Bad type for {where}{name}")
+
+
+def validate(data):
+    """Check data against the current schema in a single pass."""
+    if not isinstance(data, dict):
+        raise SaveSchemaError("Save root must be an object")
+    _check(data, _TOP_FIELDS, "")
+    if data["version"] != SCHEMA_VERSION:
+        raise SaveSchemaError(f"Expected version {SCHEMA_VERSION}")
+    _check(data["player"], _PLAYER_FIELDS, "player.")
+    shop = data["shop"]
+    _check(shop, _SHOP_FIELDS, "shop.")
+    for k, count in shop["buildings"].items():
+        if not isinstance(count, int) or count < 0:
+            raise SaveSchemaError(f"Bad count for building {k}")
+    for i, buff in enumerate(shop.get("buffs", ())):
+        if not isinstance(buff, dict):
+            raise SaveSchemaError(f"Bad type for shop.buffs[{i}]")
+        _check(buff, _BUFF_FIELDS, f"shop.buffs[{i}].")
+    for i, achievement_id in enumerate(shop.get("achievements", ())):
+        if not isinstance(achievement_id, str):
+            raise SaveSchemaError(f"Bad type for shop.achievements[{i}]")
+    if "stats" in data:
+        _check(data["stats"], _STATS_FIELDS, "stats.")
+        if data["stats"]["count"] < 0:
+            raise SaveSchemaError("Bad count for stats")
+    return data
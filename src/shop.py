@@ -1,8 +1,30 @@
 import pygame
 import random
-from building import Building
-from upgrade import Upgrade
+from array import array
 from ball_entity import BallEntity
+from economy import Economy
+from afford_scheduler import AffordScheduler
+from asset_cache import AssetCache
+from layout import DESIGN_HEIGHT, DESIGN_WIDTH
+
+BALL_TICK_RATE = 60
+BALL_REGEN_PER_FRAME = 2000
+# Shop list geometry in design pixels (scaled by ui_scale).
+LIST_TOP = 150
+LIST_BOTTOM_MARGIN = 20
+ROW_PITCH = 75
+SCROLL_STEP = 40
+
+def _fold_motion(p, v, t, lo, hi):
+    """Position and velocity after t seconds bouncing inside [lo, hi]."""
+    span = hi - lo
+    if span <= 0:
+        return lo, v
+    s = (p - lo + v * t) % (2 * span)
+    if s <= span:
+        return lo + s, v
+    return lo + 2 * span - s, -v
+
 
 def set_surface_alpha(surface, opacity):
     """Return a copy of surface with the given opacity (0..255)."""
@@ -13,89 +35,54 @@ def set_surface_alpha(surface, opacity):
     return s
 
 
-class Shop:
-    def __init__(self, player, screen_width=1280, screen_height=720):
-        self.player = player
+class Shop(Economy):
+    def __init__(self, player, screen_width=1280, screen_height=720,
+                 catalog=None, assets=None):
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.assets = assets if assets is not None else AssetCache()
+        self.ui_scale = 1.0
+        self.scroll = 0
 
-        self.buildings = {}
-        self.upgrade_list = []
-        self.current_upgrade_index = 0
         self.ball_entities = []
         self.building_images = {}
-        self.ball_images = {}
-        self.click_power_multiplier = 1.0
-        self.clickable_scale_multiplier = 1.0
+        self.afford = AffordScheduler()
+        self._afford_stale = True
+        self._last_points = 0.0
+        self._card_cache = {}
+        self._text_cache = {}
+        self._hint_cache = {}
         self.clickable = None
+        self.particles = None
+        self.submit = None
+        self.defer = None
+        self.ball_seed = random.randrange(1 << 32)
+        self.ball_time = 0.0
+        self._ball_regen = None
+
+        Economy.__init__(self, player, catalog)
+        self.building_ids = list(self.buildings)
 
         self._init_fonts_and_bg()
-        self._init_buildings()
-        self._init_upgrades()
         self._init_ui_positions()
-        self._load_building_images()
-        self._load_ball_images()
 
     def _init_fonts_and_bg(self):
         """Init fonts and background image rect."""
-        self.font = pygame.font.SysFont(None, 32)
-        self.font_small = pygame.font.SysFont(None, 20)
-        try:
-            self.shop_bg = pygame.image.load(
-                "assets/shop-bg.png"
-            ).convert_alpha()
-        except Exception:
-            self.shop_bg = None
+        self.font = self.assets.font(self._px(32))
+        self.font_small = self.assets.font(self._px(20))
+        self.shop_bg = self.assets.scaled(
+            "shop-bg.png", (self._px(350), self._px(700))
+        )
 
         if self.shop_bg:
             self.shop_bg_rect = self.shop_bg.get_rect()
         else:
-            self.shop_bg_rect = pygame.Rect(0, 0, 350, 700)
+            self.shop_bg_rect = pygame.Rect(0, 0, self._px(350),
+                                            self._px(700))
 
         self.shop_bg_rect.right = self.screen_width - 20
         self.shop_bg_rect.top = 0
 
-    def _init_buildings(self):
-        """Create building objects used by the shop."""
-        self.buildings = {
-            1: Building(
-                1, "Ball Machine",
-                base_price=50, count=0, production_per_second=0.5
-            ),
-            2: Building(
-                2, "Pro Launcher",
-                base_price=300, count=0, production_per_second=4.0
-            ),
-            3: Building(
-                3, "Ball Factory",
-                base_price=1500, count=0, production_per_second=15.0
-            ),
-            4: Building(
-                4, "Tennis Lab",
-                base_price=8000, count=0, production_per_second=75.0
-            ),
-            5: Building(
-                5, "Quantum Server",
-                base_price=50000, count=0, production_per_second=400.0
-            ),
-            6: Building(
-                6, "Tennis Paradox Core",
-                base_price=300000, count=0, production_per_second=2500.0
-            ),
-        }
-
-    def _init_upgrades(self):
-        """Init the sequential upgrade list."""
-        self.upgrade_list = [
-            Upgrade("up1", "Better Swing I",
-                    "x2 power, +15% size", price=200),
-            Upgrade("up2", "Better Swing II",
-                    "x2 power, +15% size", price=2000),
-            Upgrade("up3", "Better Swing III",
-                    "x2 power, +15% size", price=12000),
-        ]
-        self.current_upgrade_index = 0
-
     def _init_ui_positions(self):
         """Initialize UI coordinates derived from background rect."""
         self.ui_x = self.shop_bg_rect.x
@@ -103,27 +90,70 @@ class Shop:
         self.ui_width = getattr(self, "ui_width", 350)
         self.ui_height = getattr(self, "ui_height", 700)
 
-    def _load_building_images(self):
-        """Load images for building cards into a dict."""
-        for i in self.buildings.keys():
-            try:
-                img = pygame.image.load(
-                    f"assets/shop-item-{i}.png"
-                ).convert_alpha()
-                img = pygame.transform.smoothscale(img, (260, 70))
-            except Exception:
-                img = None
-            self.building_images[i] = img
-
-    def _load_ball_images(self):
-        """Load ball images for each type id."""
-        for i in range(1, 7):
-            filename = "assets/ball.png" if i == 1 else f"assets/ball-{i}.png"
-            try:
-                img = pygame.image.load(filename).convert_alpha()
-            except Exception:
-                img = None
-            self.ball_images[i] = img
+    def _card_image(self, bid):
+        """Card image for a building, scaled on first use."""
+        img = self.building_images.get(bid, False)
+        if img is False:
+            img = self.assets.scaled(f"shop-item-{bid}.png",
+                                     (self._px(260), self._px(70)))
+            self.building_images[bid] = img
+        return img
+
+    def _px(self, value):
+        """Scale a design-pixel length by the UI scale."""
+        return max(1, int(round(value * self.ui_scale)))
+
+    def set_layout(self, rect, scale, screen_size):
+        """Place the panel at rect and rescale its art and fonts."""
+        self.ui_scale = scale
+        self.screen_width, self.screen_height = screen_size
+        self._init_fonts_and_bg()
+        self.set_ui_positions(rect.x, rect.y)
+        self.set_ui_size(rect.width, rect.height)
+        self.building_images.clear()
+        self._card_cache.clear()
+        self._text_cache.clear()
+        self._hint_cache.clear()
+        self._upgrade_bg = None
+
+    def _list_viewport(self):
+        """Screen rect of the scrollable card list inside the panel."""
+        top = self.shop_bg_rect.y + self._px(LIST_TOP)
+        bottom = self.shop_bg_rect.bottom - self._px(LIST_BOTTOM_MARGIN)
+        return pygame.Rect(self.shop_bg_rect.x, top,
+                           self.shop_bg_rect.width, max(0, bottom - top))
+
+    def _upgrade_shown(self):
+        i = self.current_upgrade_index
+        return i < len(self.upgrade_list) and self.upgrade_unlocked(i)
+
+    def _row_count(self):
+        """Buildings, then the next upgrade when it is available."""
+        return len(self.building_ids) + (1 if self._upgrade_shown() else 0)
+
+    def _max_scroll(self):
+        view = self._list_viewport().height / self.ui_scale
+        return max(0, int(self._row_count() * ROW_PITCH - view))
+
+    def scroll_by(self, amount):
+        """Scroll the list by amount design pixels, clamped."""
+        self.scroll = min(max(0, self.scroll + amount), self._max_scroll())
+
+    def _visible_rows(self):
+        """Index range of rows intersecting the viewport."""
+        view = self._list_viewport().height / self.ui_scale
+        first = self.scroll // ROW_PITCH
+        last = int((self.scroll + view) // ROW_PITCH) + 1
+        return range(first, min(last, self._row_count()))
+
+    def _row_rect(self, i):
+        """Screen rect of list row i (a building, or the upgrade)."""
+        y = self._list_viewport().y + self._px(i * ROW_PITCH - self.scroll)
+        if i < len(self.building_ids):
+            return pygame.Rect(self.shop_bg_rect.x + self._px(45), y,
+                               self._px(260), self._px(70))
+        return pygame.Rect(self.shop_bg_rect.x + self._px(75), y,
+                           self._px(200), self._px(60))
 
     def set_ui_positions(self, x, y):
         """Defines where the shop UI panel is drawn."""
@@ -140,153 +170,164 @@ class Shop:
     def set_clickable(self, clickable):
         """Set reference to the clickable object."""
         self.clickable = clickable
-        try:
-            if hasattr(self.clickable, "scale"):
-                self.clickable.scale = getattr(
-                    self.player, "clickable_scale", 1.0
-                )
-        except Exception:
-            pass
+        self._apply_scale_to_clickable()
+
+    def set_particles(self, particles):
+        """Set the particle pool used for purchase feedback."""
+        self.particles = particles
+
+    def set_command_channel(self, submit, defer):
+        """Route purchases through a simulation thread, or back (None).
+
+        submit(fn, *args) runs fn on the thread that owns the economy;
+        defer(fn, *args) brings effects back to the drawing thread.
+        """
+        self.submit = submit
+        self.defer = defer
+
+    def _emit_purchase_feedback(self, rect):
+        """Burst particles over a card that was just bought."""
+        if self.particles is not None:
+            self.particles.emit_burst(rect.centerx, rect.centery,
+                                      count=12, speed=220.0)
 
     def handle_event(self, event):
-        """Handle mouse clicks for purchases."""
+        """Handle mouse clicks for purchases and wheel scrolling."""
+        if event.type == pygame.MOUSEWHEEL:
+            if self.shop_bg_rect.collidepoint(pygame.mouse.get_pos()):
+                self.scroll_by(-event.y * SCROLL_STEP)
+            return
         if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
             return
         mx, my = event.pos
-        self._handle_building_click(mx, my)
-        self._handle_upgrade_click(mx, my)
+        self._handle_list_click(mx, my)
 
-    def _handle_building_click(self, mx, my):
-        """Test click against building rects and buy if clicked."""
-        i = 0
-        for bid, b in self.buildings.items():
-            rect = pygame.Rect(
-                self.shop_bg_rect.x + 45,
-                self.shop_bg_rect.y + 150 + i * 75,
-                260,
-                70
-            )
-            if rect.collidepoint(mx, my):
-                self.attempt_buy_building(bid)
-            i += 1
+    def _handle_list_click(self, mx, my):
+        """Map a click to its row arithmetically and buy that item."""
+        view = self._list_viewport()
+        if not view.collidepoint(mx, my):
+            return
+        i = int((my - view.y) / self.ui_scale + self.scroll) // ROW_PITCH
+        if i >= self._row_count():
+            return
+        rect = self._row_rect(i)
+        if not rect.collidepoint(mx, my):
+            return
+        if self.submit is not None:
+            self.submit(self._buy_row, i, rect)
+        else:
+            self._buy_row(i, rect)
 
-    def _handle_upgrade_click(self, mx, my):
-        """Test click on the upgrade UI and attempt purchase."""
-        if self.current_upgrade_index >= len(self.upgrade_list):
+    def _buy_row(self, i, rect):
+        """Buy list row i; rect is where the feedback burst goes."""
+        if i < len(self.building_ids):
+            bought = self.attempt_buy_building(self.building_ids[i])
+        else:
+            bought = self.attempt_buy_upgrade()
+        if not bought:
             return
-        up_rect = pygame.Rect(
-            self.shop_bg_rect.x + 75,
-            self.shop_bg_rect.y + 140 + len(self.buildings) * 75 + 10,
-            200,
-            60
-        )
-        if up_rect.collidepoint(mx, my):
-            self.attempt_buy_upgrade()
+        if self.defer is not None:
+            self.defer(self._emit_purchase_feedback, rect)
+        else:
+            self._emit_purchase_feedback(rect)
 
     def attempt_buy_building(self, building_id):
-        """Attempt to purchase a building."""
+        """Attempt to purchase a building and spawn its ball."""
+        if not Economy.attempt_buy_building(self, building_id):
+            return False
+        self.spawn_balls_for_building(building_id, count=1)
+        return True
+
+    def spawn_balls_for_building(self, building_id, count=1, rng=None,
+                                 elapsed=0.0):
+        """Spawn ball entities for a building.
+
+        With rng given, the spawn is reproducible, and elapsed seconds
+        of bouncing are applied analytically to the spawned balls.
+        Balls live in design pixels, so a seed gives the same field at
+        any window size.
+        """
+        rng = rng or random
         b = self.buildings.get(building_id)
-        if not b:
-            return
-        price = b.price_next()
-        if self.player.points >= price:
-            self.player.points -= price
-            b.count += 1
-            self.spawn_balls_for_building(building_id, count=1)
-
-    def spawn_balls_for_building(self, building_id, count=1):
-        """Spawn ball entities for a building."""
+        value = getattr(b, "production_per_second", 1.0)
+        radius = 12 + int(building_id * 2)
+        type_id = int(building_id)
         for _ in range(count):
-            img = self.ball_images.get(building_id)
-            x = random.uniform(200, 800)
-            y = random.uniform(100, 600)
-            vx = random.uniform(-200, 200)
-            vy = random.uniform(-150, 150)
+            x = rng.uniform(200, 800)
+            y = rng.uniform(100, 600)
+            vx = rng.uniform(-200, 200)
+            vy = rng.uniform(-150, 150)
+            if elapsed:
+                x, vx = _fold_motion(x, vx, elapsed, radius,
+                                     DESIGN_WIDTH - radius)
+                y, vy = _fold_motion(y, vy, elapsed, radius,
+                                     DESIGN_HEIGHT - radius)
+            self.ball_entities.append(
+                BallEntity(x, y, vx, vy, radius, value, type_id)
+            )
 
-            b = self.buildings.get(building_id)
-            value = getattr(b, "production_per_second", 1.0)
-            radius = 12 + int(building_id * 2)
+    def start_ball_regeneration(self, seed, tick):
+        """Rebuild the ball field from a seed, lazily over frames.
+
+        Balls are cosmetic and follow from building counts, so the
+        field is regenerated deterministically rather than loaded.
+        """
+        plan = []
+        for bid in sorted(self.buildings):
+            plan.extend([bid] * self.buildings[bid].count)
+        self.ball_seed = seed
+        self.ball_time = tick / BALL_TICK_RATE
+        self.ball_entities = []
+        self._ball_regen = [random.Random(seed), plan, 0]
 
-            be = BallEntity(x, y, vx, vy, radius=radius, value=value)
-            try:
-                be.img = img
-            except Exception:
-                pass
-            try:
-                be.type_id = int(building_id)
-            except Exception:
-                be.type_id = None
-            self.ball_entities.append(be)
-
-    def attempt_buy_upgrade(self):
-        """Attempt to purchase the next sequential upgrade."""
-        if self.current_upgrade_index >= len(self.upgrade_list):
-            return
-        u = self.upgrade_list[self.current_upgrade_index]
-        if self.player.points >= u.price:
-            self.player.points -= u.price
-            u.bought = True
-            self.current_upgrade_index += 1
-            self.recompute_upgrade_effects()
-
-    def recompute_upgrade_effects(self):
-        """Apply all purchased upgrade effects."""
-        power_mult = 1.0
-        size_mult = 1.0
-        for up in self.upgrade_list:
-            if up.bought:
-                power_mult *= 2.0
-                size_mult *= 1.15
-
-        self.click_power_multiplier = power_mult
-        self.clickable_scale_multiplier = size_mult
-        self._apply_click_power_to_player()
+    def _effects_changed(self):
+        """Also reschedule affordability and resize the clickable."""
+        Economy._effects_changed(self)
+        self._afford_stale = True
         self._apply_scale_to_clickable()
 
-    def _apply_click_power_to_player(self):
-        """Update player's click_power while preserving base_click_power."""
-        try:
-            base = getattr(self.player, "base_click_power", None)
-            if base is None:
-                self.player.base_click_power = getattr(
-                    self.player, "click_power", 1.0
-                )
-                base = self.player.base_click_power
-            self.player.click_power = base * self.click_power_multiplier
-        except Exception:
-            pass
-
     def _apply_scale_to_clickable(self):
-        """Update clickable.scale based on upgrade multiplier."""
-        try:
-            if self.clickable is not None:
-                if not hasattr(self.clickable, "base_scale"):
-                    self.clickable.base_scale = getattr(
-                        self.clickable, "scale", 1.0
-                    )
-                self.clickable.scale = getattr(
-                    self.clickable, "base_scale", 1.0
-                ) * self.clickable_scale_multiplier
-        except Exception:
-            pass
-
-    def total_production_per_second(self):
-        """Calculate total production from buildings and balls."""
-        total = 0.0
-        for b in self.buildings.values():
-            total += b.production_per_second * b.count
-        for ball in self.ball_entities:
-            total += getattr(ball, "value", 0.0) * 0.2
-        return total
+        """Grow the clickable area by the upgrade size multiplier."""
+        if self.clickable is not None:
+            self.clickable.size_multiplier = self.clickable_scale_multiplier
+
+    def _afford_prices(self):
+        for bid, b in self.buildings.items():
+            yield ("building", bid), b.price_next()
+        i = self.current_upgrade_index
+        if i < len(self.upgrade_list):
+            yield ("upgrade", i), self.upgrade_list[i].price
+
+    def _sync_affordability(self):
+        """Feed point changes to the affordability scheduler.
+
+        Gains are O(1) unless a crossing fires; spending or a price
+        change rebuilds the schedule.
+        """
+        points = self.player.points
+        delta = points - self._last_points
+        self._last_points = points
+        if self._afford_stale or delta < 0:
+            self.afford.rebuild(points, self._afford_prices())
+            self._afford_stale = False
+        elif delta > 0:
+            self.afford.earn(delta)
+
+    def seconds_until_affordable(self, key):
+        """Seconds until a shop item is affordable at the current rate."""
+        return self.afford.seconds_until(key, self.income_per_second())
 
     def update(self, dt):
         """Update shop state and ball entities."""
-        self.recompute_upgrade_effects()
+        self.ball_time += dt
+        self._sync_affordability()
         self._ensure_desired_ball_count()
-        self._update_ball_entities(dt)
 
     def _ensure_desired_ball_count(self):
         """Keep number of ball entities aligned with building counts."""
+        if self._ball_regen is not None:
+            self._continue_ball_regeneration()
+            return
         desired_ball_count = sum(b.count for b in self.buildings.values())
         while len(self.ball_entities) < desired_ball_count:
             owned = [bid for bid, b in self.buildings.items() if b.count > 0]
@@ -295,20 +336,23 @@ class Shop:
             bid = random.choice(owned)
             self.spawn_balls_for_building(bid, count=1)
 
-    def _update_ball_entities(self, dt):
-        """Call update on each ball entity if available."""
-        for ball in list(self.ball_entities):
-            try:
-                if hasattr(ball, "update"):
-                    ball.update(dt)
-            except Exception:
-                pass
+    def _continue_ball_regeneration(self):
+        """Spawn the next chunk of a seeded ball field."""
+        rng, plan, i = self._ball_regen
+        end = min(len(plan), i + BALL_REGEN_PER_FRAME)
+        while i < end:
+            self.spawn_balls_for_building(plan[i], count=1, rng=rng,
+                                          elapsed=self.ball_time)
+            i += 1
+        if i >= len(plan):
+            self._ball_regen = None
+        else:
+            self._ball_regen[2] = i
 
     def draw(self, screen):
         """Draw the whole shop UI to the given surface."""
         self._draw_bg(screen)
-        self._draw_buildings(screen)
-        self._draw_upgrade(screen)
+        self._draw_list(screen)
 
     def _draw_bg(self, screen):
         """Draw background panel or fallback rect."""
@@ -319,33 +363,91 @@ class Shop:
                 screen, (30, 30, 30), self.shop_bg_rect, border_radius=12
             )
 
-    def _draw_buildings(self, screen):
-        """Draw each building entry in the shop."""
-        i = 0
-        for bid, b in self.buildings.items():
-            rect = pygame.Rect(
-                self.shop_bg_rect.x + 45,
-                self.shop_bg_rect.y + 150 + i * 75,
-                260,
-                70
+    def _card_surface(self, key, image, alpha):
+        """Return image at alpha, copied once per (key, alpha)."""
+        surf = self._card_cache.get((key, alpha))
+        if surf is None:
+            surf = set_surface_alpha(image, alpha)
+            self._card_cache[(key, alpha)] = surf
+        return surf
+
+    def _draw_list(self, screen):
+        """Draw only the rows inside the scrolled viewport."""
+        if self.submit is None:
+            # Otherwise the simulation thread keeps it in sync.
+            self._sync_affordability()
+        self.scroll = min(self.scroll, self._max_scroll())
+        view = self._list_viewport()
+        mx, my = pygame.mouse.get_pos()
+        n_buildings = len(self.building_ids)
+        old_clip = screen.get_clip()
+        screen.set_clip(view.clip(old_clip))
+        for i in self._visible_rows():
+            rect = self._row_rect(i)
+            hover = view.collidepoint(mx, my) and rect.collidepoint(mx, my)
+            if i < n_buildings:
+                self._draw_building(screen, rect, self.building_ids[i],
+                                    hover)
+            else:
+                self._draw_upgrade(screen, rect, hover)
+        screen.set_clip(old_clip)
+        self._draw_scrollbar(screen, view)
+
+    def _draw_scrollbar(self, screen, view):
+        """Draw a thin scroll thumb when the list overflows."""
+        max_scroll = self._max_scroll()
+        if max_scroll <= 0:
+            return
+        total = max_scroll + view.height / self.ui_scale
+        thumb_h = max(self._px(20), int(view.height * (total - max_scroll)
+                                        / total))
+        thumb_y = view.y + int((view.height - thumb_h)
+                               * self.scroll / max_scroll)
+        thumb = pygame.Rect(view.right - self._px(22), thumb_y,
+                            self._px(6), thumb_h)
+        pygame.draw.rect(screen, (200, 200, 200), thumb,
+                         border_radius=3)
+
+    def _draw_building(self, screen, rect, bid, hover):
+        """Draw one building card."""
+        key = ("building", bid)
+        affordable = self.afford.affordable.get(key, False)
+
+        alpha = self._compute_alpha(affordable, hover)
+        card = self._card_image(bid)
+        if card:
+            screen.blit(self._card_surface(bid, card, alpha), rect)
+        else:
+            pygame.draw.rect(
+                screen, (60, 60, 60), rect, border_radius=10
             )
 
-            mx, my = pygame.mouse.get_pos()
-            hover = rect.collidepoint(mx, my)
-            affordable = self.player.points >= b.price_next()
+        self._draw_building_texts(screen, rect, self.buildings[bid])
+        if not affordable:
+            self._draw_ready_hint(screen, rect, key)
 
-            alpha = self._compute_alpha(affordable, hover)
-            card = self.building_images.get(bid)
-            if card:
-                card_mod = set_surface_alpha(card, alpha)
-                screen.blit(card_mod, rect)
-            else:
-                pygame.draw.rect(
-                    screen, (60, 60, 60), rect, border_radius=10
-                )
-
-            self._draw_building_texts(screen, rect, b)
-            i += 1
+    def _draw_ready_hint(self, screen, rect, key):
+        """Draw a small "ready in Ns" hint in the card corner."""
+        secs = self.seconds_until_affordable(key)
+        if secs is None:
+            return
+        secs = int(secs) + 1
+        if secs < 60:
+            label = f"ready in {secs}s"
+        elif secs < 3600:
+            label = f"ready in {secs // 60}m"
+        else:
+            label = f"ready in {secs // 3600}h"
+        surf = self._hint_cache.get(label)
+        if surf is None:
+            if len(self._hint_cache) > 256:
+                self._hint_cache.clear()
+            surf = self.font_small.render(label, True, (230, 230, 230))
+            self._hint_cache[label] = surf
+        hint_rect = surf.get_rect(
+            topright=(rect.right - self._px(8), rect.y + self._px(4))
+        )
+        screen.blit(surf, hint_rect)
 
     def _compute_alpha(self, affordable, hover):
         """Return desired alpha for UI element."""
@@ -354,71 +456,77 @@ class Shop:
         return 150
 
     def _draw_building_texts(self, screen, rect, b):
-        """Draw name, price and count for a building entry."""
-        name_surf = self.font.render(b.name, True, (255, 255, 255))
-        name_rect = name_surf.get_rect(center=(rect.centerx, rect.y + 20))
+        """Draw name, price and count for a building entry.
+
+        The rendered texts are cached until the building's count
+        (and therefore its price) changes.
+        """
+        cached = self._text_cache.get(b.id)
+        if cached is None or cached[0] != b.count:
+            cached = (
+                b.count,
+                self.font.render(b.name, True, (255, 255, 255)),
+                self.font.render(f"{b.price_next()}pts", True,
+                                 (255, 220, 100)),
+                self.font.render(f"x{b.count}", True, (66, 43, 21)),
+            )
+            self._text_cache[b.id] = cached
+        _, name_surf, price, count = cached
+        name_rect = name_surf.get_rect(
+            center=(rect.centerx, rect.y + self._px(20))
+        )
         screen.blit(name_surf, name_rect)
 
-        price = self.font.render(f"{b.price_next()}pts", True,
-                                 (255, 220, 100))
-        screen.blit(price, (rect.x + 12, rect.bottom - 32))
+        screen.blit(price, (rect.x + self._px(12),
+                            rect.bottom - self._px(32)))
 
-        count = self.font.render(f"x{b.count}", True, (66, 43, 21))
         count_rect = count.get_rect(
-            bottomright=(rect.right - 12, rect.bottom - 10)
+            bottomright=(rect.right - self._px(12),
+                         rect.bottom - self._px(10))
         )
         screen.blit(count, count_rect)
 
-    def _draw_upgrade(self, screen):
-        """Draw the next available upgrade (if any)."""
-        if self.current_upgrade_index >= len(self.upgrade_list):
-            return
-        u = self.upgrade_list[self.current_upgrade_index]
-
-        rect = pygame.Rect(
-            self.shop_bg_rect.x + 75,
-            self.shop_bg_rect.y + 140 + len(self.buildings) * 75 + 10,
-            200,
-            60
-        )
+    def _draw_upgrade(self, screen, rect, hover):
+        """Draw the card of the next available upgrade."""
+        i = self.current_upgrade_index
+        u = self.upgrade_list[i]
 
-        mx, my = pygame.mouse.get_pos()
-        hover = rect.collidepoint(mx, my)
-        affordable = self.player.points >= u.price
+        key = ("upgrade", i)
+        affordable = self.afford.affordable.get(key, False)
         alpha = self._compute_alpha(affordable, hover)
 
-        upgrade_bg = pygame.Surface((rect.w, rect.h), pygame.SRCALPHA)
-        upgrade_bg.fill((80, 60, 120))
-        upgrade_bg = set_surface_alpha(upgrade_bg, alpha)
-        screen.blit(upgrade_bg, rect)
-
-        title = self.font.render(u.name, True, (255, 255, 255))
-        trect = title.get_rect(center=(rect.centerx, rect.y + 20))
+        if getattr(self, "_upgrade_bg", None) is None:
+            self._upgrade_bg = pygame.Surface((rect.w, rect.h),
+                                              pygame.SRCALPHA)
+            self._upgrade_bg.fill((80, 60, 120))
+        screen.blit(self._card_surface("upgrade", self._upgrade_bg, alpha),
+                    rect)
+
+        cached = self._text_cache.get(key)
+        if cached is None:
+            cached = (
+                self.font.render(u.name, True, (255, 255, 255)),
+                self.font.render(f"{u.price}pts", True, (255, 220, 100)),
+            )
+            self._text_cache[key] = cached
+        title, price = cached
+        trect = title.get_rect(center=(rect.centerx,
+                                       rect.y + self._px(20)))
         screen.blit(title, trect)
 
-        price = self.font.render(f"{u.price}pts", True, (255, 220, 100))
-        screen.blit(price, (rect.x + 12, rect.bottom - 28))
+        screen.blit(price, (rect.x + self._px(12),
+                            rect.bottom - self._px(28)))
+        if not affordable:
+            self._draw_ready_hint(screen, rect, key)
 
-    def to_dict(self):
+    def to_dict(self, include_balls=True):
         """Serialize shop state for saving."""
-        data = {}
-        bdict = {}
-        for k, v in self.buildings.items():
-            try:
-                bdict[k] = v.to_dict()
-            except Exception:
-                bdict[k] = {"count": getattr(v, "count", 0)}
-        data["buildings"] = bdict
-        data["current_upgrade_index"] = self.current_upgrade_index
-
-        ups = []
-        for u in self.upgrade_list:
-            try:
-                ups.append(u.to_dict())
-            except Exception:
-                ups.append({"bought": getattr(u, "bought", False)})
-        data["upgrade_list"] = ups
+        data = Economy.to_dict(self)
+        data["ball_seed"] = self.ball_seed
+        data["ball_tick"] = int(self.ball_time * BALL_TICK_RATE)
 
+        if not include_balls:
+            return data
         balls = []
         for b in self.ball_entities:
             bd = {
@@ -428,55 +536,72 @@ class Shop:
                 "vy": getattr(b, "vy", 0),
                 "radius": getattr(b, "radius", 12),
                 "value": getattr(b, "value", 1.0),
-                "type_id": getattr(b, "type_id", None)
+                "type_id": b.type_id or None
             }
             balls.append(bd)
         data["balls"] = balls
         return data
 
+    def ball_columns(self):
+        """Snapshot ball state as packed per-field arrays."""
+        balls = self.ball_entities
+        return {
+            "x": array("f", [b.x for b in balls]),
+            "y": array("f", [b.y for b in balls]),
+            "vx": array("f", [b.vx for b in balls]),
+            "vy": array("f", [b.vy for b in balls]),
+            "radius": array("H", [b.radius for b in balls]),
+            "value": array("f", [b.value for b in balls]),
+            "type_id": array("h", [b.type_id or -1 for b in balls]),
+        }
+
     def from_dict(self, d, physics=None):
-        """Load shop state from saved data dictionary."""
-        bld = d.get("buildings", {})
-        for k_str, v in bld.items():
-            try:
-                k = int(k_str)
-            except Exception:
-                k = k_str
-            if k in self.buildings:
-                self.buildings[k].count = v.get("count", 0)
-
-        self.current_upgrade_index = d.get("current_upgrade_index", 0)
-        self._restore_upgrades_from_dict(d.get("upgrade_list", []))
-        self._restore_balls_from_dict(d.get("balls", []))
-        self.recompute_upgrade_effects()
-
-    def _restore_upgrades_from_dict(self, ups):
-        """Restore bought flags for sequential upgrades."""
-        for i, u_data in enumerate(ups):
-            if i < len(self.upgrade_list):
-                self.upgrade_list[i].bought = u_data.get("bought", False)
+        """Load shop state from validated (current schema) save data."""
+        Economy.from_dict(self, d)
+        self._ball_regen = None
+        if "balls" in d:
+            self._restore_balls_from_dict(d["balls"])
+            self.ball_seed = d.get("ball_seed", self.ball_seed)
+            self.ball_time = d.get("ball_tick", 0) / BALL_TICK_RATE
+        elif "ball_seed" in d:
+            self.start_ball_regeneration(d["ball_seed"],
+                                         d.get("ball_tick", 0))
+        else:
+            self.ball_entities = []
+
+    def reset_progress(self):
+        """Return counts, upgrades and balls to a fresh game."""
+        self.ball_entities = []
+        self._ball_regen = None
+        Economy.reset_progress(self)
+
+    def _restore_balls_from_columns(self, cols):
+        """Recreate ball entities from packed per-field arrays."""
+        self.ball_entities = [
+            BallEntity(x, y, vx, vy, radius, value, max(type_id, 0))
+            for x, y, vx, vy, radius, value, type_id in zip(
+                cols["x"], cols["y"], cols["vx"], cols["vy"],
+                cols["radius"], cols["value"], cols["type_id"]
+            )
+        ]
 
     def _restore_balls_from_dict(self, balls_data):
         """Recreate ball entities from saved ball dicts."""
+        if isinstance(balls_data, dict):
+            self._restore_balls_from_columns(balls_data)
+            return
         self.ball_entities = []
         for bd in balls_data:
-            be = BallEntity(
+            try:
+                type_id = int(bd.get("type_id") or 0)
+            except (TypeError, ValueError):
+                type_id = 0
+            self.ball_entities.append(BallEntity(
                 bd.get("x", 400),
                 bd.get("y", 300),
                 bd.get("vx", 0),
                 bd.get("vy", 0),
                 radius=bd.get("radius", 12),
-                value=bd.get("value", 1.0)
-            )
-            try:
-                be.type_id = int(bd.get("type_id")) if bd.get(
-                    "type_id"
-                ) is not None else None
-            except Exception:
-                be.type_id = None
-            try:
-                if be.type_id and be.type_id in self.ball_images:
-                    be.img = self.ball_images.get(be.type_id)
-            except Exception:
-                pass
-            self.ball_entities.append(be)
+                value=bd.get("value", 1.0),
+                type_id=type_id
+            ))
@@ -0,0 +1,145 @@
+import queue
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+
+class SimSnapshot:
+    """Read-only view of one simulation tick for the render thread.
+
+    A new snapshot is built every tick and published by swapping a
+    single reference, so the renderer never sees a half-written one.
+    """
+
+    __slots__ = ("tick", "points", "income", "click_power", "buffs",
+                 "xs", "ys", "radii", "types")
+
+    def __init__(self, tick, points, income, click_power, balls, buffs=()):
+        self.tick = tick
+        self.points = points
+        self.income = income
+        self.click_power = click_power
+        self.buffs = buffs
+        self.xs = array("f", [b.x for b in balls])
+        self.ys = array("f", [b.y for b in balls])
+        self.radii = array("H", [b.radius for b in balls])
+        self.types = array("H", [b.type_id for b in balls])
+
+
+class SimulationThread:
+    """Runs step(dt) at a fixed rate on its own thread.
+
+    Input reaches the simulation as queued commands, drained at the
+    start of each tick; effects meant for the main thread (particles,
+    sounds) come back through defer() and run in run_deferred(). The
+    thread only ticks while resumed; pause() waits for the tick in
+    flight, after which the main thread may touch the state directly.
+    """
+
+    def __init__(self, step, make_snapshot, rate=60):
+        self.step = step
+        self.make_snapshot = make_snapshot
+        self.rate = rate
+        self.dt = 1.0 / rate
+        self.tick = 0
+        self.late_ticks = 0
+        self.snapshot = None
+        self._commands = queue.SimpleQueue()
+        self._deferred = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._stopped = False
+        self.thread = threading.Thread(target=self._run, name="simulation",
+                                       daemon=True)
+        self.thread.start()
+
+    def submit(self, fn, *args):
+        """Queue fn(*args) to run on the simulation thread."""
+        self._commands.put((fn, args))
+
+    def defer(self, fn, *args):
+        """Queue fn(*args) to run on the main thread."""
+        self._deferred.put((fn, args))
+
+    def in_sim_thread(self):
+        return threading.current_thread() is self.thread
+
+    def run_deferred(self):
+        """Run the effects the simulation queued for the main thread."""
+        while True:
+            try:
+                fn, args = self._deferred.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn(*args)
+            except Exception as e:
+                print("Deferred call error:", e)
+
+    def resume(self):
+        self.snapshot = self.make_snapshot(self.tick)
+        self._active.set()
+
+    def pause(self):
+        """Stop ticking and wait for the tick in flight to finish."""
+        self._active.clear()
+        with self._lock:
+            pass
+
+    @contextmanager
+    def held(self):
+        """Hold off ticks while the main thread reads the state.
+
+        Unlike pause(), the thread keeps its schedule and simply runs
+        its next tick once the block exits.
+        """
+        with self._lock:
+            yield
+
+    def stop(self, timeout=None):
+        self._stopped = True
+        self._active.set()
+        if not self.in_sim_thread():
+            self.thread.join(timeout)
+
+    def _drain_commands(self):
+        while True:
+            try:
+                fn, args = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn(*args)
+            except Exception as e:
+                print("Simulation command error:", e)
+
+    def _run(self):
+        next_tick = time.perf_counter()
+        while not self._stopped:
+            if not self._active.is_set():
+                self._active.wait()
+                next_tick = time.perf_counter()
+                continue
+            with self._lock:
+                if not self._active.is_set() or self._stopped:
+                    continue
+                self._drain_commands()
+                try:
+                    self.step(self.dt)
+                except Exception as e:
+                    print("Simulation step error:", e)
+                self.tick += 1
+                try:
+                    self.snapshot = self.make_snapshot(self.tick)
+                except Exception as e:
+                    print("Simulation snapshot error:", e)
+            next_tick += self.dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -0.25:
+                # Too far behind (e.g. the process was suspended): drop
+                # the backlog instead of fast-forwarding in a burst.
+                self.late_ticks += 1
+                next_tick = time.perf_counter()
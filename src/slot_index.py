@@ -0,0 +1,55 @@
+import json
+import threading
+from pathlib import Path
+
+from atomic_file import write_atomic
+
+
+class SlotIndex:
+    """Small metadata file describing every save slot.
+
+    The Save/Load menu reads only this index; a slot's save file is
+    parsed when the player actually picks it.
+    """
+
+    def __init__(self, path="saves/index.json"):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.entries = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            self.entries = {int(k): v for k, v in raw.get("slots", {}).items()}
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, slot):
+        """Return the metadata dict for slot, or None if it is empty."""
+        return self.entries.get(slot)
+
+    def update(self, slot, meta):
+        """Record metadata for slot and rewrite the index atomically."""
+        with self._lock:
+            self.entries[slot] = dict(meta)
+            self._write()
+
+    def discover(self, slot, save_manager):
+        """Index a slot that has a save file but no entry yet."""
+        if slot in self.entries or not save_manager.path.exists():
+            return self.get(slot)
+        try:
+            data = save_manager.load()
+        except Exception as e:
+            print("Slot index scan error:", e)
+            return None
+        meta = save_manager.describe(data)
+        self.update(slot, meta)
+        return meta
+
+    def _write(self):
+        payload = json.dumps(
+            {"slots": {str(k): v for k, v in sorted(self.entries.items())}},
+            separators=(",", ":")
+        ).encode("utf-8")
+        write_atomic(self.path, payload)
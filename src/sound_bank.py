@@ -0,0 +1,124 @@
+import math
+import random
+from array import array
+
+import pygame
+
+# name -> (priority, min seconds between plays, volume, synth params)
+# Synth params: (start Hz, end Hz, seconds, decay per second, noise mix).
+SOUNDS = {
+    "purchase": (3, 0.0, 0.7, (660.0, 990.0, 0.18, 12.0, 0.0)),
+    "click": (2, 0.03, 0.5, (880.0, 620.0, 0.05, 60.0, 0.1)),
+    "bounce": (1, 0.06, 0.35, (240.0, 140.0, 0.04, 80.0, 0.35)),
+}
+
+
+def synthesize(mixer_format, start_hz, end_hz, seconds, decay, noise):
+    """Render a decaying pitch sweep as raw samples for the mixer.
+
+    mixer_format is pygame.mixer.get_init(); samples are signed 16 bit.
+    """
+    rate, _, channels = mixer_format
+    n = max(1, int(rate * seconds))
+    rng = random.Random(int(start_hz * 1000 + end_hz))
+    samples = array("h")
+    phase = 0.0
+    for i in range(n):
+        t = i / rate
+        hz = start_hz + (end_hz - start_hz) * i / n
+        phase += 2.0 * math.pi * hz / rate
+        env = math.exp(-decay * t) * min(1.0, i / (rate * 0.002))
+        v = (1.0 - noise) * math.sin(phase) + noise * rng.uniform(-1, 1)
+        sample = int(v * env * 30000)
+        for _ in range(channels):
+            samples.append(sample)
+    return samples.tobytes()
+
+
+class SoundBank:
+    """Preloaded sounds played through a fixed pool of mixer channels.
+
+    Triggers only bump a per-frame counter; end_frame() turns each
+    distinct sound into at most one play, louder when many triggers
+    were coalesced, and rate-limits it. When every channel is busy the
+    lowest-priority (then oldest) voice is stolen, unless the new sound
+    ranks below all of them. The mixer is left alone if it cannot be
+    initialised, which makes every call a no-op.
+    """
+
+    def __init__(self, channels=8, enabled=True):
+        self.enabled = False
+        self.sounds = {}
+        self.pending = {}
+        self.time = 0.0
+        self.played = 0
+        self.coalesced = 0
+        self.limited = 0
+        self.stolen = 0
+        self.dropped = 0
+        self._last_play = {}
+        if not enabled:
+            return
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            fmt = pygame.mixer.get_init()
+            if fmt is None or fmt[1] != -16:
+                return
+            pygame.mixer.set_num_channels(channels)
+            for name, (_, _, volume, params) in SOUNDS.items():
+                snd = pygame.mixer.Sound(buffer=synthesize(fmt, *params))
+                snd.set_volume(volume)
+                self.sounds[name] = snd
+        except pygame.error as e:
+            print("Sound init error:", e)
+            return
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        # Per channel: (priority, start time) of the voice it plays.
+        self.voices = [(0, 0.0)] * channels
+        self.enabled = True
+
+    def play(self, name, count=1):
+        """Request a sound; identical requests in a frame coalesce."""
+        if count > 0 and self.enabled:
+            self.pending[name] = self.pending.get(name, 0) + count
+
+    def end_frame(self, dt):
+        """Play this frame's coalesced requests, highest priority first."""
+        self.time += dt
+        if not self.pending:
+            return
+        pending = sorted(self.pending.items(),
+                         key=lambda item: -SOUNDS[item[0]][0])
+        self.pending = {}
+        for name, count in pending:
+            self.coalesced += count - 1
+            priority, interval, _, _ = SOUNDS[name]
+            if self.time - self._last_play.get(name, -1e9) < interval:
+                self.limited += count
+                continue
+            channel = self._acquire(priority)
+            if channel is None:
+                self.dropped += count
+                continue
+            boost = min(1.0, 0.7 + 0.1 * math.log2(count))
+            channel.set_volume(boost)
+            channel.play(self.sounds[name])
+            self._last_play[name] = self.time
+            self.played += 1
+
+    def _acquire(self, priority):
+        """Return a free channel, steal a lesser voice, or None."""
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                victim = i
+                break
+            if victim is None or self.voices[i] < self.voices[victim]:
+                victim = i
+        else:
+            if self.voices[victim][0] > priority:
+                return None
+            self.stolen += 1
+        self.voices[victim] = (priority, self.time)
+        return self.channels[victim]
@@ -0,0 +1,128 @@
+import base64
+import sys
+import zlib
+from array import array
+
+# Series name -> array typecode. Points can grow past float32 precision.
+SERIES = (
+    ("points", "d"),
+    ("production", "f"),
+    ("click_rate", "f"),
+    ("frame_ms", "f"),
+)
+
+
+class StatsHistory:
+    """Fixed-size ring of game statistics sampled at a fixed interval.
+
+    Each series is a preallocated array, so appending is O(1) and
+    memory stays bounded; the oldest sample is overwritten when full.
+    frame_ms is the mean frame time over each sampling interval.
+    """
+
+    def __init__(self, capacity=720, interval=5.0):
+        self.capacity = capacity
+        self.interval = interval
+        self.series = {
+            name: array(code, [0]) * capacity for name, code in SERIES
+        }
+        self.head = 0
+        self.count = 0
+        self.version = 0
+        self._elapsed = 0.0
+        self._frames = 0
+
+    def tick(self, dt, points, production, click_rate):
+        """Advance by one frame; sample when an interval has passed."""
+        self._elapsed += dt
+        self._frames += 1
+        if self._elapsed < self.interval:
+            return False
+        frame_ms = self._elapsed / self._frames * 1000.0
+        self.append(points, production, click_rate, frame_ms)
+        self._elapsed = 0.0
+        self._frames = 0
+        return True
+
+    def append(self, points, production, click_rate, frame_ms):
+        """Store one sample, overwriting the oldest when full."""
+        i = self.head
+        s = self.series
+        s["points"][i] = points
+        s["production"][i] = production
+        s["click_rate"][i] = click_rate
+        s["frame_ms"][i] = frame_ms
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+        self.version += 1
+
+    def values(self, name):
+        """Return the samples of one series, oldest first."""
+        data = self.series[name]
+        if self.count < self.capacity:
+            return data[:self.count]
+        return data[self.head:] + data[:self.head]
+
+    def latest(self, name):
+        if not self.count:
+            return None
+        return self.series[name][(self.head - 1) % self.capacity]
+
+    def downsample(self, name, buckets):
+        """Reduce a series to at most buckets (min, max) pairs.
+
+        Keeping both extremes per bucket preserves spikes that plain
+        averaging or decimation would hide when drawing.
+        """
+        data = self.values(name)
+        n = len(data)
+        if n == 0 or buckets <= 0:
+            return []
+        if n <= buckets:
+            return [(v, v) for v in data]
+        out = []
+        for b in range(buckets):
+            chunk = data[b * n // buckets:(b + 1) * n // buckets]
+            out.append((min(chunk), max(chunk)))
+        return out
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+        self.version += 1
+        self._elapsed = 0.0
+        self._frames = 0
+
+    def to_dict(self):
+        """Serialize the samples as one compressed little-endian buffer."""
+        raw = b""
+        for name, _ in SERIES:
+            data = self.values(name)
+            if sys.byteorder != "little":
+                data = array(data.typecode, data)
+                data.byteswap()
+            raw += data.tobytes()
+        return {
+            "interval": self.interval,
+            "count": self.count,
+            "data": base64.b64encode(zlib.compress(raw)).decode("ascii"),
+        }
+
+    def from_dict(self, d):
+        """Restore samples saved by to_dict (newest kept if they overflow)."""
+        self.clear()
+        count = d["count"]
+        raw = zlib.decompress(base64.b64decode(d["data"]))
+        offset = 0
+        columns = {}
+        for name, code in SERIES:
+            data = array(code)
+            size = data.itemsize * count
+            data.frombytes(raw[offset:offset + size])
+            if sys.byteorder != "little":
+                data.byteswap()
+            columns[name] = data
+            offset += size
+        for i in range(max(0, count - self.capacity), count):
+            self.append(*(columns[name][i] for name, _ in SERIES))
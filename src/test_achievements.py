@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+from achievements import AchievementIndex, Achievements
+from catalog import load_catalog
+from economy import Economy
+from player_state import PlayerState
+
+CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                       "data", "catalog.json")
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return load_catalog(CATALOG)
+
+
+def recording(catalog):
+    """An economy plus the ids of the achievement events it sends."""
+    economy = Economy(PlayerState(), catalog)
+    events = []
+
+    def on_event(kind, **data):
+        if kind == "achievement":
+            events.append(data["id"])
+
+    economy.add_listener(on_event)
+    return economy, events
+
+
+def test_counters_unlock_once_with_one_event(catalog):
+    economy, events = recording(catalog)
+    economy.count_clicks(99)
+    assert events == []
+    economy.count_clicks(1)
+    economy.count_clicks(5)
+    assert events == ["clicks_100"]
+
+
+def test_one_observation_can_pass_several_thresholds(catalog):
+    economy, events = recording(catalog)
+    economy.player.points = 200000.0
+    economy.advance(0.001)
+    assert events == ["points_1k", "points_100k"]
+
+
+def test_building_counters_are_per_building(catalog):
+    economy, events = recording(catalog)
+    economy.player.points = 1e9
+    for _ in range(10):
+        economy.attempt_buy_building(2)
+    assert "launchers_10" in events
+    assert "machines_10" not in events
+
+
+def test_rewards_multiply_click_power_and_production(catalog):
+    economy, _ = recording(catalog)
+    economy.buildings[1].count = 4
+    economy.recompute_upgrade_effects()
+    base = economy.total_production_per_second()
+    economy.count_clicks(1000)
+    assert economy.player.click_power == pytest.approx(1.1)
+    economy.player.points = 1e5
+    economy.advance(0.001)
+    assert economy.total_production_per_second() == pytest.approx(
+        base * 1.05
+    )
+
+
+def test_unlocks_persist_through_a_save(catalog):
+    economy, _ = recording(catalog)
+    economy.count_clicks(1000)
+    data = economy.to_dict()
+    assert data["achievements"] == ["clicks_100", "clicks_1k"]
+
+    loaded, events = recording(catalog)
+    loaded.from_dict(data)
+    assert loaded.achievements.ids() == ["clicks_100", "clicks_1k"]
+    assert loaded.player.click_power == pytest.approx(1.1)
+    loaded.count_clicks(1)
+    assert events == []
+
+
+def test_loading_unlocks_what_old_saves_reached_silently(catalog):
+    economy, _ = recording(catalog)
+    economy.buildings[1].count = 12
+    data = economy.to_dict()
+    data.pop("achievements", None)
+    loaded, events = recording(catalog)
+    loaded.from_dict(data)
+    assert loaded.achievements.ids() == ["machines_10"]
+    assert events == []
+
+
+def test_unknown_saved_ids_are_skipped(catalog):
+    achievements = Achievements(catalog.achievements)
+    achievements.from_dict(["gone", "clicks_100"])
+    assert achievements.ids() == ["clicks_100"]
+
+
+def test_direct_unlock_moves_the_cursor():
+    index = AchievementIndex([
+        {"id": "a", "counter": "clicks", "threshold": 10},
+        {"id": "b", "counter": "clicks", "threshold": 20,
+         "reward": {"type": "click_power", "factor": 2.0}},
+    ])
+    achievements = Achievements(index)
+    assert achievements.unlock_id("a")
+    assert not achievements.unlock_id("a")
+    assert not achievements.unlock_id("missing")
+    assert achievements.observe(("clicks", None), 15) == ()
+    assert achievements.observe(("clicks", None), 20) == [1]
+    assert achievements.click == 2.0
@@ -0,0 +1,130 @@
+import zlib
+from array import array
+
+import pytest
+
+import binary_save
+from binary_save import BALL_COLUMNS, BinarySaveError, decode, encode
+
+
+def make_save(balls):
+    return {
+        "version": 2,
+        "player": {"points": 1234.5, "click_power": 2.0,
+                   "base_click_power": 1.0},
+        "shop": {"buildings": {"1": 3, "2": 1}, "upgrades": [True, False],
+                 "current_upgrade_index": 1, "balls": balls},
+        "summary": {"saved_at": 1700000000.0, "points": 1234.5,
+                    "production_per_second": 4.5},
+    }
+
+
+BALLS = [
+    {"x": 120.5, "y": 80.25, "vx": -30.0, "vy": 12.5, "radius": 14,
+     "value": 1.5, "type_id": 1},
+    {"x": 640.0, "y": 360.0, "vx": 0.0, "vy": -99.0, "radius": 16,
+     "value": 8.0, "type_id": 300},
+    {"x": 10.0, "y": 20.0, "vx": 1.0, "vy": 2.0, "radius": 12,
+     "value": 1.0, "type_id": None},
+]
+
+
+def v1_payload(meta, balls, flags=0):
+    """A version 1 file: byte-sized type ids, otherwise the same layout."""
+    codes = {"type_id": "b"}
+    body = meta + b"".join(
+        array(codes.get(name, code), [b[name] for b in balls]).tobytes()
+        for name, code, _ in BALL_COLUMNS
+    )
+    if flags & binary_save.FLAG_ZLIB:
+        body = zlib.compress(body)
+    return binary_save._HEADER.pack(binary_save.MAGIC, 1, flags, len(meta),
+                                    len(balls)) + body
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip_full_save(compress):
+    data = make_save(BALLS)
+    payload = encode(data, compress=compress)
+    assert binary_save.is_binary(payload)
+    out = decode(payload)
+    balls = binary_save.columns_to_balls(out["shop"].pop("balls"))
+    expected = make_save(None)
+    expected["shop"].pop("balls")
+    assert out == expected
+    assert balls == BALLS
+
+
+def test_round_trip_column_input():
+    cols = binary_save.balls_to_columns(BALLS)
+    out = decode(encode(make_save(cols)))
+    assert binary_save.columns_to_balls(out["shop"]["balls"]) == BALLS
+
+
+def test_header_has_current_version():
+    header = binary_save._HEADER.unpack_from(encode(make_save(BALLS)))
+    assert header[1] == binary_save.FORMAT_VERSION == 2
+
+
+def test_no_balls_flag():
+    data = make_save(None)
+    del data["shop"]["balls"]
+    payload = encode(data)
+    flags = binary_save._HEADER.unpack_from(payload)[2]
+    assert flags & binary_save.FLAG_NO_BALLS
+    assert "balls" not in decode(payload)["shop"]
+
+
+def test_empty_ball_list_is_kept():
+    out = decode(encode(make_save([])))
+    assert binary_save.columns_to_balls(out["shop"]["balls"]) == []
+
+
+@pytest.mark.parametrize("flags", [0, binary_save.FLAG_ZLIB])
+def test_reads_v1_byte_type_ids(flags):
+    balls = [dict(b, type_id=-1 if b["type_id"] is None else b["type_id"])
+             for b in BALLS if (b["type_id"] or 0) < 128]
+    out = decode(v1_payload(b'{"version":2,"shop":{}}', balls, flags))
+    cols = out["shop"]["balls"]
+    assert cols["type_id"].typecode == "b"
+    assert [b["type_id"] for b in binary_save.columns_to_balls(cols)] == [
+        1, None
+    ]
+
+
+def test_rejects_newer_version():
+    payload = bytearray(encode(make_save(BALLS)))
+    payload[4:6] = (binary_save.FORMAT_VERSION + 1).to_bytes(2, "little")
+    with pytest.raises(BinarySaveError):
+        decode(bytes(payload))
+
+
+@pytest.mark.parametrize("cut", [0, 3, binary_save._HEADER.size - 1])
+def test_rejects_short_header(cut):
+    with pytest.raises(BinarySaveError):
+        decode(encode(make_save(BALLS))[:cut])
+
+
+def test_rejects_truncated_balls():
+    payload = encode(make_save(BALLS), compress=False)
+    with pytest.raises(BinarySaveError):
+        decode(payload[:-4])
+
+
+def test_rejects_corrupt_compressed_body():
+    payload = bytearray(encode(make_save(BALLS)))
+    payload[binary_save._HEADER.size + 2] ^= 0xFF
+    with pytest.raises(BinarySaveError):
+        decode(bytes(payload))
+
+
+def test_rejects_wrong_magic():
+    with pytest.raises(BinarySaveError):
+        decode(b"NOPE" + encode(make_save(BALLS))[4:])
+
+
+def test_rejects_ragged_columns():
+    cols = binary_save.balls_to_columns(BALLS)
+    cols["vx"] = cols["vx"][:1]
+    with pytest.raises(BinarySaveError):
+        encode(make_save(cols))
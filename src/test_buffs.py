@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+from buffs import BuffSet
+from catalog import load_catalog
+from economy import Economy
+from player_state import PlayerState
+
+CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                       "data", "catalog.json")
+
+
+@pytest.fixture
+def economy():
+    eco = Economy(PlayerState(), load_catalog(CATALOG))
+    eco.buildings[1].count = 10
+    eco.recompute_upgrade_effects()
+    return eco
+
+
+def test_expiry_inside_a_step_is_split(economy):
+    base = economy.income_per_second()
+    economy.start_buff("frenzy", duration=4.0)
+    gained = economy.advance(10.0)
+    assert gained == pytest.approx(base * 7.0 * 4.0 + base * 6.0)
+    assert len(economy.buffs) == 0
+    assert economy.income_per_second() == pytest.approx(base)
+
+
+def test_several_expiries_in_one_step(economy):
+    base = economy.income_per_second()
+    economy.start_buff("frenzy", duration=2.0)
+    economy.start_buff("building_boost", target=1, duration=5.0)
+    gained = economy.advance(8.0)
+    assert gained == pytest.approx(base * (21.0 * 2.0 + 3.0 * 3.0 + 3.0))
+    assert economy.buffs.active() == []
+
+
+def test_many_small_steps_match_one_big_step(economy):
+    other = Economy(PlayerState(), economy.catalog)
+    other.buildings[1].count = 10
+    other.recompute_upgrade_effects()
+    for eco in (economy, other):
+        eco.start_buff("frenzy", duration=3.3)
+    big = economy.advance(6.0)
+    small = sum(other.advance(0.1) for _ in range(60))
+    assert small == pytest.approx(big)
+
+
+def test_expiry_exactly_at_step_end(economy):
+    economy.start_buff("frenzy", duration=5.0)
+    economy.advance(5.0)
+    assert len(economy.buffs) == 0
+
+
+def test_click_buff_changes_click_power_until_expiry(economy):
+    economy.start_buff("click_storm", duration=1.0)
+    assert economy.player.click_power == 10.0
+    economy.advance(0.5)
+    assert economy.player.click_power == 10.0
+    economy.advance(0.5)
+    assert economy.player.click_power == 1.0
+
+
+def test_buffs_survive_a_save_round_trip(economy):
+    economy.start_buff("frenzy")
+    economy.advance(12.0)
+    loaded = Economy(PlayerState(), economy.catalog)
+    loaded.from_dict(economy.to_dict())
+    assert loaded.buffs.active() == [("frenzy", None, 18.0)]
+    assert loaded.buffs.production == 7.0
+
+
+def test_unknown_buffs_are_rejected_and_skipped_on_load():
+    buffs = BuffSet()
+    with pytest.raises(ValueError):
+        buffs.start("nope")
+    with pytest.raises(ValueError):
+        buffs.start("building_boost")
+    buffs.from_dict([{"name": "nope", "remaining": 1.0},
+                     {"name": "frenzy", "remaining": 2.0}])
+    assert [name for name, _, _ in buffs.active()] == ["frenzy"]
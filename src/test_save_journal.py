@@ -0,0 +1,143 @@
+import os
+
+import pytest
+
+from catalog import load_catalog
+from economy import Economy
+from player_state import PlayerState
+from save_journal import SaveJournal, after_new_game, replay
+
+CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                       "data", "catalog.json")
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return load_catalog(CATALOG)
+
+
+def journaled(catalog, journal):
+    """An economy whose events go to journal, as Game wires it."""
+    economy = Economy(PlayerState(), catalog)
+    economy.add_listener(lambda kind, **data: journal.append(kind, **data))
+    return economy
+
+
+def recover(catalog, path):
+    """Reopen the journal after a crash and replay it on a fresh game."""
+    journal = SaveJournal(path, fsync=False)
+    economy = Economy(PlayerState(), catalog)
+    _, records = after_new_game(journal.read())
+    replay(records, economy.player, economy)
+    journal.close()
+    return economy
+
+
+def test_crash_keeps_income_earned_since_checkpoint(catalog, tmp_path):
+    path = tmp_path / "slot.journal"
+    journal = SaveJournal(path, fsync=False)
+    live = journaled(catalog, journal)
+    live.player.points = 100.0
+    journal.append("points", points=live.player.points)
+    live.player.points = 1000.0
+    assert live.attempt_buy_building(1)
+    assert live.attempt_buy_building(1)
+    journal.close()
+
+    economy = recover(catalog, path)
+    assert economy.player.points == live.player.points
+    assert economy.buildings[1].count == 2
+    assert (economy.total_production_per_second()
+            == live.total_production_per_second())
+
+
+def test_older_purchase_records_subtract_the_price(catalog, tmp_path):
+    path = tmp_path / "slot.journal"
+    journal = SaveJournal(path, fsync=False)
+    journal.append("points", points=500.0)
+    journal.append("building", id=1, price=50)
+    journal.close()
+    assert recover(catalog, path).player.points == 450.0
+
+
+def test_buffs_and_clicks_survive_a_crash(catalog, tmp_path):
+    path = tmp_path / "slot.journal"
+    journal = SaveJournal(path, fsync=False)
+    live = journaled(catalog, journal)
+    live.player.points = 1000.0
+    live.attempt_buy_building(1)
+    live.start_buff("frenzy")
+    live.count_clicks(42)
+    live.advance(10.0)
+    journal.append("points", points=live.player.points, clicks=live.clicks,
+                   buffs=live.buffs.to_dict())
+    live.start_buff("click_storm")
+    journal.close()
+
+    economy = recover(catalog, path)
+    assert economy.clicks == 42
+    assert [(n, left) for n, _, left in economy.buffs.active()] == [
+        ("click_storm", 15.0), ("frenzy", 20.0)
+    ]
+    assert economy.buffs.production == live.buffs.production
+    assert economy.player.click_power == live.player.click_power
+
+
+def test_compaction_keeps_only_the_tail(catalog, tmp_path):
+    path = tmp_path / "slot.journal"
+    journal = SaveJournal(path, fsync=False)
+    live = journaled(catalog, journal)
+    live.player.points = 10000.0
+    live.attempt_buy_building(1)
+    snapshot = Economy(PlayerState(), catalog)
+    snapshot.from_dict(live.to_dict())
+    snapshot.player.points = live.player.points
+    seq = journal.seq
+    live.attempt_buy_building(2)
+    journal.compact(seq)
+    assert [r["t"] for r in journal.read()] == ["base", "building"]
+    size = journal.size
+    journal.close()
+    assert size == path.stat().st_size
+
+    reopened = SaveJournal(path, fsync=False)
+    assert reopened.seq == seq + 1
+    replay(reopened.read(seq), snapshot.player, snapshot)
+    reopened.close()
+    assert snapshot.player.points == live.player.points
+    assert {b: snapshot.buildings[b].count for b in (1, 2)} == {1: 1, 2: 1}
+
+
+def test_torn_last_record_is_ignored(tmp_path):
+    path = tmp_path / "slot.journal"
+    journal = SaveJournal(path, fsync=False)
+    journal.append("points", points=1.0)
+    journal.close()
+    with open(path, "ab") as f:
+        f.write(b'{"seq":2,"t":"buil')
+    reopened = SaveJournal(path, fsync=False)
+    assert [r["seq"] for r in reopened.read()] == [1]
+    assert reopened.seq == 1
+    reopened.close()
+
+
+def test_new_game_discards_earlier_records(catalog, tmp_path):
+    path = tmp_path / "slot.journal"
+    journal = SaveJournal(path, fsync=False)
+    journal.append("points", points=9000.0)
+    journal.append("building", id=1, price=50, points=8950.0)
+    journal.append("new_game")
+    journal.append("points", points=7.0)
+    reset, records = after_new_game(journal.read())
+    journal.close()
+    assert reset
+    assert [r["t"] for r in records] == ["points"]
+
+    economy = recover(catalog, path)
+    assert economy.player.points == 7.0
+    assert economy.buildings[1].count == 0
+
+
+def test_without_new_game_everything_is_replayed():
+    records = [{"seq": 1, "t": "points", "points": 1.0}]
+    assert after_new_game(records) == (False, records)
@@ -0,0 +1,152 @@
+import copy
+import os
+
+import pytest
+
+from catalog import load_catalog
+from economy import Economy
+from player_state import PlayerState
+from save_schema import SCHEMA_VERSION, SaveSchemaError, migrate, validate
+
+CATALOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                       "data", "catalog.json")
+
+
+def building_v1(bid, name, base_price, count, production):
+    return {"id": bid, "name": name, "base_price": base_price,
+            "count": count, "production_per_second": production}
+
+
+def upgrade_v1(uid, price, bought):
+    return {"id": uid, "name": "Better Swing", "price": price,
+            "description": "x2 power, +15% size", "bought": bought}
+
+
+# A version 1 save as the original game wrote it, two upgrades bought.
+V1_SAVE = {
+    "player": {
+        "points": 4321.5,
+        "click_power": 4.0,
+        "global_multiplier": 1.0,
+        "purchased_upgrades": [],
+    },
+    "shop": {
+        "buildings": {
+            "1": building_v1(1, "Ball Machine", 50, 7, 0.5),
+            "2": building_v1(2, "Pro Launcher", 300, 2, 4.0),
+            "3": building_v1(3, "Ball Factory", 1500, 0, 15.0),
+        },
+        "current_upgrade_index": 2,
+        "upgrade_list": [
+            upgrade_v1("up1", 200, True),
+            upgrade_v1("up2", 2000, True),
+            upgrade_v1("up3", 12000, False),
+        ],
+        "balls": [
+            {"x": 151.4, "y": 213.9, "vx": -143.9, "vy": -38.3,
+             "radius": 14, "value": 0.5, "type_id": 1},
+        ],
+    },
+}
+
+
+def migrated():
+    data, changed = migrate(copy.deepcopy(V1_SAVE))
+    assert changed
+    return data
+
+
+def test_v1_migrates_to_a_valid_current_save():
+    data = migrated()
+    assert data["version"] == SCHEMA_VERSION
+    assert validate(data) is data
+    assert data["shop"]["buildings"] == {"1": 7, "2": 2, "3": 0}
+    assert data["shop"]["upgrades"] == ["up1", "up2"]
+    assert data["shop"]["current_upgrade_index"] == 2
+    assert data["shop"]["balls"] == V1_SAVE["shop"]["balls"]
+    assert data["player"]["points"] == 4321.5
+
+
+def test_v1_click_power_loses_upgrade_multipliers():
+    data = migrated()
+    assert data["player"]["base_click_power"] == 1.0
+    player = PlayerState.from_dict(data["player"])
+    economy = Economy(player, load_catalog(CATALOG))
+    economy.from_dict(data["shop"])
+    # Loading re-applies both x2 upgrades: the v1 click power again.
+    assert player.click_power == V1_SAVE["player"]["click_power"]
+
+
+def test_v1_without_upgrades_keeps_click_power():
+    data = copy.deepcopy(V1_SAVE)
+    for u in data["shop"]["upgrade_list"]:
+        u["bought"] = False
+    data["player"]["click_power"] = 1.0
+    out, _ = migrate(data)
+    assert out["player"]["base_click_power"] == 1.0
+
+
+def test_current_save_is_not_migrated():
+    data = migrated()
+    again, changed = migrate(data)
+    assert again is data and not changed
+
+
+def test_newer_version_is_rejected():
+    data = migrated()
+    data["version"] = SCHEMA_VERSION + 1
+    with pytest.raises(SaveSchemaError):
+        migrate(data)
+
+
+@pytest.mark.parametrize("section, field, value", [
+    ("shop", "buffs", {"name": "frenzy"}),
+    ("shop", "buffs", "frenzy"),
+    ("shop", "clicks", 12.5),
+    ("shop", "clicks", True),
+    ("shop", "buffs", ["frenzy"]),
+    ("shop", "buffs", [{"name": "frenzy"}]),
+    ("shop", "buffs", [{"name": 3, "remaining": 1.0}]),
+    ("shop", "buffs", [{"name": "boost", "remaining": 1.0, "target": "2"}]),
+    ("shop", "achievements", "points_1k"),
+    ("shop", "achievements", [1]),
+    ("shop", "ball_seed", "7"),
+    ("shop", "balls", 3),
+    (None, "stats", []),
+    (None, "stats", {"interval": 5.0, "count": 2}),
+    (None, "stats", {"interval": 5.0, "count": -1, "data": ""}),
+    (None, "stats", {"interval": "5", "count": 0, "data": ""}),
+    (None, "journal_seq", "4"),
+    (None, "summary", None),
+])
+def test_malformed_optional_fields_are_rejected(section, field, value):
+    data = migrated()
+    target = data[section] if section else data
+    target[field] = value
+    with pytest.raises(SaveSchemaError):
+        validate(data)
+
+
+def test_well_formed_optional_fields_are_accepted():
+    data = migrated()
+    data["shop"].update(buffs=[{"name": "frenzy", "target": None,
+                                "remaining": 3.0}],
+                        clicks=12, achievements=["points_1k"])
+    data["stats"] = {"interval": 5.0, "count": 0, "data": ""}
+    data["journal_seq"] = 4
+    assert validate(data) is data
+
+
+@pytest.mark.parametrize("count", [-1, 1.5, "3"])
+def test_bad_building_counts_are_rejected(count):
+    data = migrated()
+    data["shop"]["buildings"]["1"] = count
+    with pytest.raises(SaveSchemaError):
+        validate(data)
+
+
+def test_missing_required_field_is_rejected():
+    data = migrated()
+    del data["player"]["points"]
+    with pytest.raises(SaveSchemaError):
+        validate(data)
@@ -0,0 +1,116 @@
+import threading
+import time
+
+import pytest
+
+from sim_thread import SimulationThread
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+class Recorder:
+    """A step function that logs the ticks and commands it sees."""
+
+    def __init__(self):
+        self.log = []
+        self.threads = set()
+
+    def step(self, dt):
+        self.log.append("step")
+        self.threads.add(threading.current_thread().name)
+
+    def command(self, name):
+        self.log.append(name)
+        self.threads.add(threading.current_thread().name)
+
+
+@pytest.fixture
+def sim():
+    rec = Recorder()
+    sim = SimulationThread(rec.step, lambda tick: tick, rate=500)
+    sim.rec = rec
+    yield sim
+    sim.stop(1.0)
+
+
+def test_nothing_ticks_until_resumed(sim):
+    time.sleep(0.02)
+    assert sim.tick == 0 and sim.rec.log == []
+    sim.resume()
+    assert wait_for(lambda: sim.tick >= 3)
+
+
+def test_commands_run_in_order_on_the_sim_thread_before_a_step(sim):
+    sim.submit(sim.rec.command, "a")
+    sim.submit(sim.rec.command, "b")
+    sim.resume()
+    assert wait_for(lambda: sim.tick >= 1)
+    sim.pause()
+    assert sim.rec.log[:3] == ["a", "b", "step"]
+    assert sim.rec.threads == {"simulation"}
+
+
+def test_pause_stops_ticks_and_resume_continues(sim):
+    sim.resume()
+    assert wait_for(lambda: sim.tick >= 3)
+    sim.pause()
+    paused_at = sim.tick
+    sim.submit(sim.rec.command, "queued")
+    time.sleep(0.02)
+    assert sim.tick == paused_at
+    assert "queued" not in sim.rec.log
+    sim.resume()
+    assert wait_for(lambda: sim.tick >= paused_at + 3)
+    sim.pause()
+    assert sim.rec.log.count("queued") == 1
+
+
+def test_held_blocks_ticks_without_pausing(sim):
+    sim.resume()
+    assert wait_for(lambda: sim.tick >= 1)
+    with sim.held():
+        held_at = sim.tick
+        time.sleep(0.02)
+        assert sim.tick == held_at
+    assert wait_for(lambda: sim.tick > held_at)
+
+
+def test_deferred_calls_run_on_the_main_thread(sim):
+    ran = []
+    sim.submit(sim.defer, lambda: ran.append(sim.in_sim_thread()))
+    sim.resume()
+    assert wait_for(lambda: sim.tick >= 1)
+    assert ran == []
+    sim.run_deferred()
+    assert ran == [False]
+
+
+def test_errors_do_not_stop_the_thread():
+    def step(dt):
+        raise RuntimeError("step")
+
+    def make_snapshot(tick):
+        if tick:
+            raise RuntimeError("snapshot")
+        return tick
+
+    sim = SimulationThread(step, make_snapshot, rate=500)
+    sim.submit(lambda: 1 / 0)
+    sim.resume()
+    try:
+        assert wait_for(lambda: sim.tick >= 3)
+    finally:
+        sim.stop(1.0)
+    assert not sim.thread.is_alive()
+
+
+def test_stop_wakes_a_paused_thread(sim):
+    sim.stop(1.0)
+    assert not sim.thread.is_alive()
@@ -2,58 +2,114 @@ import pygame
 from button import Button
 
 class UIManager:
+    """Retained-mode buttons grouped into per-state screens.
+
+    Screens are declared as data (state -> button ids, in draw order)
+    and compiled into draw and hit-test lists once, so switching state
+    only swaps the active screen and events and drawing only look at
+    its buttons. Buttons keep their rendered surfaces between frames.
+    """
+
     def __init__(self, screen):
         self.screen = screen
         self.buttons = {}
-        self.button_visibility = {}  
+        self.screens = {}
+        self.state = None
         self.font = pygame.font.SysFont(None, 24)
+        self._compiled = {}
+        self._active = ()
+        self._hit = ()
+        self._hit_rects = []
+        self._hovered = None
+        self._pressed = None
 
     def add_button(self, id_, rect, text, callback):
         btn = Button(pygame.Rect(rect), text, callback, self.font)
         self.buttons[id_] = btn
-        self.button_visibility[id_] = True  
-
-    def set_button_visible(self, id_, visible):
-        """Show or hide a button."""
-        if id_ in self.button_visibility:
-            self.button_visibility[id_] = visible
-
-    def set_buttons_visible_for_state(self, game_state):
-        """Show/hide buttons based on game state."""
-        if game_state == "MENU":
-            self.set_button_visible("start", True)
-            self.set_button_visible("save", True)
-            self.set_button_visible("load", True)
-            self.set_button_visible("credits", True)
-            self.set_button_visible("quit", True)
-            self.set_button_visible("pause", False)
-            self.set_button_visible("back", False)
-        elif game_state == "RUNNING":
-            self.set_button_visible("start", False)
-            self.set_button_visible("save", False)
-            self.set_button_visible("load", False)
-            self.set_button_visible("credits", False)
-            self.set_button_visible("quit", False)
-            self.set_button_visible("pause", True)
-            self.set_button_visible("back", False)
-        elif game_state == "CREDITS":
-            self.set_button_visible("start", False)
-            self.set_button_visible("save", False)
-            self.set_button_visible("load", False)
-            self.set_button_visible("credits", False)
-            self.set_button_visible("quit", False)
-            self.set_button_visible("back", True)
-            self.set_button_visible("pause", False)
+        self._compiled.clear()
+        return btn
 
-    def handle_event(self, event):
+    def set_screens(self, screens):
+        """Declare which buttons each game state shows (state -> ids)."""
+        self.screens = {state: tuple(ids) for state, ids in screens.items()}
+        self._compiled.clear()
+        self.set_state(self.state)
+
+    def _compile(self, state):
+        """Draw list and topmost-first hit-test list for a state."""
+        compiled = self._compiled.get(state)
+        if compiled is None:
+            draw = tuple(self.buttons[id_]
+                         for id_ in self.screens.get(state, ()))
+            hit = draw[::-1]
+            compiled = (draw, hit, [b.rect for b in hit])
+            self._compiled[state] = compiled
+        return compiled
+
+    def set_state(self, game_state):
+        """Show the screen of game_state; buttons of other states go idle."""
+        for b in (self._hovered, self._pressed):
+            if b is not None:
+                b.hover = False
+                b.pressed = False
+        self._hovered = None
+        self._pressed = None
+        self.state = game_state
+        self._active, self._hit, self._hit_rects = self._compile(game_state)
+        pos = pygame.mouse.get_pos() if pygame.display.get_init() else None
+        if pos is not None:
+            self._hover_at(pos)
+
+    def apply_layout(self, layout, font):
+        """Move buttons to their layout rects and switch their font."""
+        self.font = font
         for id_, b in self.buttons.items():
-            if self.button_visibility.get(id_, False):
-                b.handle_event(event)
+            if id_ in layout:
+                b.rect = layout.rect(id_)
+            b.font = font
+            b.invalidate()
+        self._compiled.clear()
+        if self.state is not None:
+            self.set_state(self.state)
+
+    def _button_at(self, pos):
+        i = pygame.Rect(pos, (1, 1)).collidelist(self._hit_rects)
+        return self._hit[i] if i >= 0 else None
+
+    def _hover_at(self, pos):
+        b = self._button_at(pos)
+        if b is self._hovered:
+            return
+        if self._hovered is not None:
+            self._hovered.hover = False
+        if b is not None:
+            b.hover = True
+        self._hovered = b
+
+    def handle_event(self, event):
+        """Dispatch an event to the one active button it concerns."""
+        if event.type == pygame.MOUSEMOTION:
+            self._hover_at(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            b = self._button_at(event.pos)
+            if b is not None:
+                b.pressed = True
+                self._pressed = b
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            b = self._pressed
+            self._pressed = None
+            if b is None:
+                return
+            b.pressed = False
+            if b.rect.collidepoint(event.pos):
+                try:
+                    b.callback()
+                except Exception as e:
+                    print("Button callback error:", e)
 
     def update(self, dt):
         pass
 
     def draw(self, screen, player_state=None):
-        for id_, b in self.buttons.items():
-            if self.button_visibility.get(id_, False):
-                b.draw(screen)
\ No newline at end of file
+        for b in self._active:
+            b.draw(screen)
@@ -1,12 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Upgrade:
     id: str
     name: str
     description: str
     price: int
     bought: bool = False
+    effects: list = field(default_factory=list)
+    unlock: dict = None
 
     def to_dict(self):
         return {